@@ -73,6 +73,12 @@ class TS1IOImport(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         default=True,
     )
 
+    keep_skeleton_templates: bpy.props.BoolProperty(  # type: ignore[valid-type]
+        name="Keep Skeleton Templates",
+        description="Keep hidden copies of found skeletons so later imports duplicate them instead of rebuilding them",
+        default=False,
+    )
+
     cleanup_meshes: bpy.props.BoolProperty(  # type: ignore[valid-type]
         name="Cleanup Meshes (Lossy)",
         description="Merge the vertices of the mesh, add sharp edges, remove original normals and shade smooth",
@@ -96,38 +102,110 @@ class TS1IOImport(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         default='med',
     )
 
+    run_in_background: bpy.props.BoolProperty(  # type: ignore[valid-type]
+        name="Import In Background",
+        description="Keep Blender responsive and show the progress while importing, press Esc to cancel",
+        default=False,
+    )
+
+    modal_time_budget = 0.05
+
     def execute(self, context: bpy.context) -> set[str]:
         """Execute the importing function."""
-        import io  # noqa: PLC0415
-        import logging  # noqa: PLC0415
         import pathlib  # noqa: PLC0415
 
-        from . import import_ts1  # noqa: PLC0415
+        from . import import_ts1, utils  # noqa: PLC0415
+        from .ts1_formats import import_report  # noqa: PLC0415
 
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.DEBUG)
-        log_stream = io.StringIO()
-        logger.addHandler(logging.StreamHandler(stream=log_stream))
+        self.import_report = import_report.ImportReport()
 
         directory = pathlib.Path(self.directory)
         paths = [directory / file.name for file in self.files]
 
-        import_ts1.import_files(
+        self.profiler = utils.create_profiler(context, "import-ts1")
+        self.created_data: set[bpy.types.ID] = set()
+        self.import_steps = import_ts1.iterate_import_files(
             context,
-            logger,
+            self.import_report,
+            self.profiler,
             paths,
             self.skin_color,
             import_skeletons=self.import_skeletons,
             import_meshes=self.import_meshes,
             import_animations=self.import_animations,
             find_skeleton=self.find_skeleton,
+            keep_skeleton_templates=self.keep_skeleton_templates,
             cleanup_meshes=self.cleanup_meshes,
             fix_textures=self.fix_textures,
         )
+        next(self.import_steps)
+
+        if not self.run_in_background:
+            self.profiler.start()
+            try:
+                for _ in self.import_steps:
+                    pass
+            except BaseException:
+                self.finish(context)
+                raise
+            return self.finish(context)
+
+        window_manager = context.window_manager
+        window_manager.progress_begin(0, 1)
+        self.timer = window_manager.event_timer_add(0.001, window=context.window)
+        window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context: bpy.context, event: bpy.types.Event) -> set[str]:
+        """Run import steps until the time budget of the timer tick is used, or cancel the import on Esc."""
+        import time  # noqa: PLC0415
+
+        from . import import_ts1, texture_loader  # noqa: PLC0415
+
+        if event.type == 'ESC':
+            texture_loader.image_cache.discard_deferred_images()
+            self.import_steps.close()
+            import_ts1.remove_data(self.created_data)
+            self.report({'WARNING'}, "Import cancelled")
+            self.finish(context)
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER' or event.timer != self.timer:
+            return {'PASS_THROUGH'}
+
+        deadline = time.perf_counter() + self.modal_time_budget
+        self.profiler.start()
+        # Only the data created during the import steps is recorded, not any the user creates between timer ticks.
+        data_snapshot = import_ts1.snapshot_data()
+        try:
+            while time.perf_counter() < deadline:
+                completed_steps, total_steps = self.import_steps.send(context)
+                context.window_manager.progress_update(completed_steps / total_steps)
+        except StopIteration:
+            return self.finish(context)
+        except BaseException:
+            self.finish(context)
+            raise
+        finally:
+            self.created_data |= import_ts1.find_data_created_since(data_snapshot)
+        self.profiler.stop()
+
+        return {'RUNNING_MODAL'}
 
-        log_output = log_stream.getvalue()
-        if log_output != "":
-            self.report({"ERROR"}, log_output)
+    def finish(self, context: bpy.context) -> set[str]:
+        """Stop the timer and progress and report the problems found and the profile summary."""
+        from . import utils  # noqa: PLC0415
+
+        if self.run_in_background:
+            context.window_manager.event_timer_remove(self.timer)
+            context.window_manager.progress_end()
+
+        profile_summary = utils.finish_profiler(context, self.profiler)
+        if profile_summary is not None:
+            self.report({"INFO"}, profile_summary)
+
+        if self.import_report:
+            self.report({"ERROR"}, self.import_report.format())
 
         return {'FINISHED'}
 
@@ -138,10 +216,12 @@ class TS1IOImport(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         col.prop(self, "import_meshes")
         col.prop(self, "import_animations")
         col.prop(self, "find_skeleton")
+        col.prop(self, "keep_skeleton_templates")
         col.prop(self, "cleanup_meshes")
         col.prop(self, "fix_textures")
         col.label(text="Skin Color:")
         col.prop(self, "skin_color", text="")
+        col.prop(self, "run_in_background")
 
 
 class TS1IOExport(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
@@ -245,9 +325,121 @@ class TS1IOAddonPreferences(bpy.types.AddonPreferences):
         default="",
     )
 
+    file_read_mode: bpy.props.EnumProperty(  # type: ignore[valid-type]
+        name="Parallel File Reading",
+        description="How referenced meshes and animations are read ahead of creating the Blender objects",
+        items=[
+            ('THREADS', "Threads", "Read files in a background thread pool"),
+            (
+                'PROCESSES',
+                "Processes (Experimental)",
+                (
+                    "Read files in parallel in separate processes, using all processor cores. Starting the processes "
+                    "takes time on every import, and files are read in Blender if they fail to start"
+                ),
+            ),
+            ('NONE', "None", "Read each file when it is needed"),
+        ],
+        default='THREADS',
+    )
+
+    texture_load_mode: bpy.props.EnumProperty(  # type: ignore[valid-type]
+        name="Texture Loading",
+        description="When the texture files of imported materials are loaded",
+        items=[
+            ('IMMEDIATE', "Immediate", "Load each texture file when the first material using it is created"),
+            ('DEFERRED', "Deferred", "Create materials with placeholder images and load the files at the end"),
+            (
+                'DECODED',
+                "Decoded In Parallel",
+                (
+                    "Decode the texture files while the meshes are created. The decoded images are packed in the "
+                    "blend file instead of linking to the texture files, so saved files are larger"
+                ),
+            ),
+            (
+                'PROXY',
+                "Proxy",
+                (
+                    "Load downscaled copies of the texture files, cached as PNG files, which can be swapped for the "
+                    "full resolution files from File > External Data"
+                ),
+            ),
+        ],
+        default='IMMEDIATE',
+    )
+
+    proxy_texture_scale: bpy.props.IntProperty(  # type: ignore[valid-type]
+        name="Proxy Texture Downscale",
+        description="How many times smaller the width and height of proxy textures are",
+        min=2,
+        max=16,
+        default=4,
+    )
+
+    proxy_directory: bpy.props.StringProperty(  # type: ignore[valid-type]
+        name="Proxy Texture Directory",
+        description="Directory the proxy textures are cached in, the addon config directory if empty",
+        subtype='DIR_PATH',
+        default="",
+    )
+
+    profile_imports: bpy.props.BoolProperty(  # type: ignore[valid-type]
+        name="Profile Imports",
+        description="Time each phase of an import, report the timings and write them to a JSON file",
+        default=False,
+    )
+
+    profile_functions: bpy.props.BoolProperty(  # type: ignore[valid-type]
+        name="Profile Functions (Slow)",
+        description="Also capture a cProfile of the import and write its slowest functions to the JSON file",
+        default=False,
+    )
+
+    profile_directory: bpy.props.StringProperty(  # type: ignore[valid-type]
+        name="Profile Directory",
+        description="Directory the import profiles are written to, the addon config directory if empty",
+        subtype='DIR_PATH',
+        default="",
+    )
+
     def draw(self, _: bpy.context) -> None:
         """Draw the addon preferences ui."""
         self.layout.prop(self, "file_search_directory")
+        self.layout.prop(self, "file_read_mode")
+        self.layout.prop(self, "texture_load_mode")
+        col = self.layout.column()
+        col.enabled = self.texture_load_mode == 'PROXY'
+        col.prop(self, "proxy_texture_scale")
+        col.prop(self, "proxy_directory")
+        self.layout.prop(self, "profile_imports")
+        col = self.layout.column()
+        col.enabled = self.profile_imports
+        col.prop(self, "profile_functions")
+        col.prop(self, "profile_directory")
+
+
+class TS1IOUseFullResolutionTextures(bpy.types.Operator):
+    """Swap the proxy textures of imported materials for their full resolution texture files."""
+
+    bl_idname: str = "ts1blenderio.usefullresolutiontextures"
+    bl_label: str = "Use Full Resolution The Sims Textures"
+    bl_description: str = "Load the full resolution texture files of all the proxy textures"
+    bl_options: typing.ClassVar[set[str]] = {'REGISTER', 'UNDO'}
+
+    def execute(self, _: bpy.context) -> set[str]:
+        """Execute the swapping function."""
+        from . import texture_loader  # noqa: PLC0415
+
+        image_count = texture_loader.use_full_resolution_images()
+        self.report({"INFO"}, f"Loaded {image_count} full resolution textures")
+
+        return {'FINISHED'}
+
+
+def ts1_menu_external_data(self: bpy.types.TOPBAR_MT_file_external_data, _: bpy.context) -> None:
+    """Add an entry to the external data menu."""
+    self.layout.operator(TS1IOUseFullResolutionTextures.bl_idname)
 
 
 class TSOIOImport(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
@@ -278,30 +470,32 @@ class TSOIOImport(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
 
     def execute(self, context: bpy.context) -> set[str]:
         """Execute the importing function."""
-        import io  # noqa: PLC0415
-        import logging  # noqa: PLC0415
         import pathlib  # noqa: PLC0415
 
-        from . import import_tso  # noqa: PLC0415
+        from . import import_tso, utils  # noqa: PLC0415
+        from .ts1_formats import import_report  # noqa: PLC0415
 
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.DEBUG)
-        log_stream = io.StringIO()
-        logger.addHandler(logging.StreamHandler(stream=log_stream))
+        report = import_report.ImportReport()
 
         directory = pathlib.Path(self.directory)
         paths = [directory / file.name for file in self.files]
 
+        profiler = utils.create_profiler(context, "import-tso")
+        profiler.start()
         import_tso.import_files(
             context,
-            logger,
+            report,
+            profiler,
             paths,
             cleanup_meshes=self.cleanup_meshes,
         )
 
-        log_output = log_stream.getvalue()
-        if log_output != "":
-            self.report({"ERROR"}, log_output)
+        profile_summary = utils.finish_profiler(context, profiler)
+        if profile_summary is not None:
+            self.report({"INFO"}, profile_summary)
+
+        if report:
+            self.report({"ERROR"}, report.format())
 
         return {'FINISHED'}
 
@@ -378,6 +572,7 @@ classes = (
     TS1IOImport,
     TS1IOExport,
     TS1IOAddonPreferences,
+    TS1IOUseFullResolutionTextures,
     TSOIOImport,
     TSOIOExport,
 )
@@ -385,11 +580,16 @@ classes = (
 
 def register() -> None:
     """Register with Blender."""
+    from . import texture_loader  # noqa: PLC0415
+
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    bpy.app.handlers.load_pre.append(texture_loader.clear_registry)
+
     bpy.types.TOPBAR_MT_file_import.append(ts1_menu_import)
     bpy.types.TOPBAR_MT_file_export.append(ts1_menu_export)
+    bpy.types.TOPBAR_MT_file_external_data.append(ts1_menu_external_data)
 
     bpy.types.TOPBAR_MT_file_import.append(tso_menu_import)
     bpy.types.TOPBAR_MT_file_export.append(tso_menu_export)
@@ -397,11 +597,17 @@ def register() -> None:
 
 def unregister() -> None:
     """Unregister with Blender."""
+    from . import texture_loader  # noqa: PLC0415
+
     for cls in classes:
         bpy.utils.unregister_class(cls)
 
+    if texture_loader.clear_registry in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(texture_loader.clear_registry)
+
     bpy.types.TOPBAR_MT_file_import.remove(ts1_menu_import)
     bpy.types.TOPBAR_MT_file_export.remove(ts1_menu_export)
+    bpy.types.TOPBAR_MT_file_external_data.remove(ts1_menu_external_data)
 
     bpy.types.TOPBAR_MT_file_import.remove(tso_menu_import)
     bpy.types.TOPBAR_MT_file_export.remove(tso_menu_export)
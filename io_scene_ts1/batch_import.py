@@ -0,0 +1,252 @@
+"""Import directories of The Sims 1 files in to .blend files with parallel background Blender processes.
+
+Run the driver with Python, for example:
+    python batch_import.py GameData/Skins converted --search-directory GameData --jobs 8
+
+The driver splits the bcf and cmx files in to shards and runs "blender --background" for each shard, which runs
+this script again as a worker that imports its shard with the io_scene_ts1 add-on and saves a .blend file.
+"""
+
+import argparse
+import concurrent.futures
+import dataclasses
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import time
+
+WORKER_COMMAND = "worker"
+
+
+@dataclasses.dataclass
+class Shard:
+    """The files imported in to a single .blend file."""
+
+    index: int
+    file_paths: list[pathlib.Path]
+    size: int = 0
+
+
+def list_files(directory: pathlib.Path) -> list[pathlib.Path]:
+    """List all the bcf and cmx files in the directory tree."""
+    return sorted(
+        file_path
+        for file_path in directory.rglob("*")
+        if file_path.suffix.lower() in {".bcf", ".cmx"} and file_path.is_file()
+    )
+
+
+def partition_files(file_paths: list[pathlib.Path], shard_count: int) -> list[Shard]:
+    """Partition the files in to shards of similar total file size, largest files first."""
+    shards = [Shard(index, []) for index in range(min(shard_count, len(file_paths)))]
+    sized_file_paths = sorted(((file_path.stat().st_size, file_path) for file_path in file_paths), reverse=True)
+    for size, file_path in sized_file_paths:
+        shard = min(shards, key=lambda shard: shard.size)
+        shard.file_paths.append(file_path)
+        shard.size += size
+
+    for shard in shards:
+        shard.file_paths.sort()
+
+    return shards
+
+
+def run_shard(
+    blender: str,
+    shard: Shard,
+    output_directory: pathlib.Path,
+    options: dict[str, object],
+) -> dict[str, object]:
+    """Run a background Blender process that imports the shard and return its results."""
+    shard_name = f"shard-{shard.index:04}"
+    manifest_path = output_directory / f"{shard_name}.manifest.json"
+    result_path = output_directory / f"{shard_name}.result.json"
+    log_path = output_directory / f"{shard_name}.log"
+
+    manifest = {
+        "files": [file_path.as_posix() for file_path in shard.file_paths],
+        "blend_file": (output_directory / f"{shard_name}.blend").as_posix(),
+        "result_file": result_path.as_posix(),
+        **options,
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+
+    command = [
+        blender,
+        "--background",
+        "--factory-startup",
+        "--python",
+        pathlib.Path(__file__).resolve().as_posix(),
+        "--",
+        WORKER_COMMAND,
+        manifest_path.as_posix(),
+    ]
+
+    start_time = time.perf_counter()
+    with log_path.open("w", encoding="utf-8") as log_file:
+        return_code = subprocess.run(command, stdout=log_file, stderr=subprocess.STDOUT, check=False).returncode  # noqa: S603
+    duration = time.perf_counter() - start_time
+
+    try:
+        result = json.loads(result_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        result = {"files": [], "blend_file": None}
+
+    return {
+        "shard": shard.index,
+        "return_code": return_code,
+        "duration": duration,
+        "log_file": log_path.as_posix(),
+        **result,
+    }
+
+
+def run_driver(arguments: argparse.Namespace) -> int:
+    """Partition the files, run the shards in parallel and write a summary of the results."""
+    file_paths = list_files(arguments.directory)
+    if not file_paths:
+        sys.stderr.write(f"No bcf or cmx files found in {arguments.directory}\n")
+        return 1
+
+    jobs = arguments.jobs or os.cpu_count() or 1
+    shards = partition_files(file_paths, arguments.shards or jobs)
+
+    output_directory = arguments.output_directory.resolve()
+    output_directory.mkdir(parents=True, exist_ok=True)
+
+    options = {
+        "search_directory": (arguments.search_directory or arguments.directory).resolve().as_posix(),
+        "skin_color": arguments.skin_color,
+        "import_skeletons": arguments.import_skeletons,
+        "import_meshes": not arguments.no_meshes,
+        "import_animations": not arguments.no_animations,
+        "cleanup_meshes": not arguments.no_cleanup_meshes,
+        "fix_textures": not arguments.no_fix_textures,
+    }
+
+    start_time = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(jobs) as executor:
+        futures = [executor.submit(run_shard, arguments.blender, shard, output_directory, options) for shard in shards]
+        shard_results = []
+        for future in concurrent.futures.as_completed(futures):
+            shard_result = future.result()
+            shard_results.append(shard_result)
+            sys.stdout.write(
+                f"shard {shard_result['shard']}: {len(shard_result['files'])} files imported "
+                f"in {shard_result['duration']:.1f}s, exit code {shard_result['return_code']}\n",
+            )
+    duration = time.perf_counter() - start_time
+
+    shard_results.sort(key=lambda shard_result: shard_result["shard"])
+    file_results = [file_result for shard_result in shard_results for file_result in shard_result["files"]]
+    summary = {
+        "duration": duration,
+        "file_count": len(file_paths),
+        "imported_file_count": sum(file_result["error"] is None for file_result in file_results),
+        "failed_file_count": len(file_paths) - sum(file_result["error"] is None for file_result in file_results),
+        "failed_shard_count": sum(shard_result["return_code"] != 0 for shard_result in shard_results),
+        "import_duration": sum(file_result["duration"] for file_result in file_results),
+        "shards": shard_results,
+    }
+    (output_directory / "summary.json").write_text(json.dumps(summary, indent=1), encoding="utf-8")
+
+    sys.stdout.write(
+        f"{summary['imported_file_count']} of {len(file_paths)} files imported in {duration:.1f}s "
+        f"using {len(shards)} shards and {jobs} jobs\n",
+    )
+
+    return 0 if summary["failed_file_count"] == 0 and summary["failed_shard_count"] == 0 else 1
+
+
+def run_worker(manifest_path: pathlib.Path) -> int:
+    """Import the files in the manifest in to an empty Blender file and save it."""
+    import traceback  # noqa: PLC0415
+
+    import addon_utils  # noqa: PLC0415
+    import bpy  # noqa: PLC0415
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    addon_utils.enable("io_scene_ts1", default_set=True)
+
+    from io_scene_ts1 import import_ts1  # noqa: PLC0415
+    from io_scene_ts1.ts1_formats import import_report, profiling  # noqa: PLC0415
+
+    preferences = bpy.context.preferences.addons["io_scene_ts1"].preferences
+    preferences.file_search_directory = manifest["search_directory"]
+    # The shards already use all the processor cores.
+    preferences.file_read_mode = 'NONE'
+
+    file_results = []
+    for file_name in manifest["files"]:
+        report = import_report.ImportReport()
+        error = None
+        profiler = profiling.Profiler(pathlib.Path(file_name).name)
+        profiler.start()
+        try:
+            import_ts1.import_files(
+                bpy.context,
+                report,
+                profiler,
+                [pathlib.Path(file_name)],
+                manifest["skin_color"],
+                import_skeletons=manifest["import_skeletons"],
+                import_meshes=manifest["import_meshes"],
+                import_animations=manifest["import_animations"],
+                find_skeleton=True,
+                keep_skeleton_templates=False,
+                cleanup_meshes=manifest["cleanup_meshes"],
+                fix_textures=manifest["fix_textures"],
+            )
+        except Exception:  # noqa: BLE001
+            error = traceback.format_exc()
+        profiler.stop()
+
+        file_results.append(
+            {
+                "file": file_name,
+                "duration": profiler.duration,
+                "spans": profiler.summary()["spans"],
+                "error": error,
+                "problems": report.counts(),
+                "messages": report.lines(),
+            },
+        )
+
+    bpy.ops.wm.save_as_mainfile(filepath=manifest["blend_file"])
+
+    result = {"files": file_results, "blend_file": manifest["blend_file"]}
+    pathlib.Path(manifest["result_file"]).write_text(json.dumps(result, indent=1), encoding="utf-8")
+
+    return 0
+
+
+def main() -> int:
+    """Run the driver, or the worker if run by Blender."""
+    if "--" in sys.argv:
+        worker_arguments = sys.argv[sys.argv.index("--") + 1 :]
+        if len(worker_arguments) == 2 and worker_arguments[0] == WORKER_COMMAND:
+            return run_worker(pathlib.Path(worker_arguments[1]))
+
+    parser = argparse.ArgumentParser(description="Import The Sims 1 bcf and cmx files in to .blend files.")
+    parser.add_argument("directory", type=pathlib.Path, help="Directory searched for bcf and cmx files")
+    parser.add_argument("output_directory", type=pathlib.Path, help="Directory the .blend files are saved in")
+    parser.add_argument("--search-directory", type=pathlib.Path, help="Directory searched for referenced files")
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument("--jobs", type=int, help="Number of Blender processes run at once")
+    parser.add_argument("--shards", type=int, help="Number of .blend files, the number of jobs by default")
+    parser.add_argument("--skin-color", choices=["drk", "med", "lgt"], default="med")
+    parser.add_argument("--import-skeletons", action="store_true")
+    parser.add_argument("--no-meshes", action="store_true")
+    parser.add_argument("--no-animations", action="store_true")
+    parser.add_argument("--no-cleanup-meshes", action="store_true")
+    parser.add_argument("--no-fix-textures", action="store_true")
+
+    return run_driver(parser.parse_args())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -161,4 +161,4 @@ def export_files(
         case ".cmx":
             cmx.write_file(file_path, bcf_desc)
         case ".bcf":
-            bcf.write_file(file_path, bcf_desc)
+            bcf.write_file(file_path, bcf_desc, atomic=True)
@@ -3,6 +3,7 @@
 import pathlib
 
 import bpy
+import numpy as np
 
 from . import export_animation, export_mesh
 from .ts1_formats import anim, bcf, mesh, property_list
@@ -49,10 +50,16 @@ def export_files(
                 for strip in nla_track.strips:
                     skill, cfp = export_animation.export_animation(armature_object, strip, nla_track.name)
 
-                    trans_iter = zip(cfp.positions_x, cfp.positions_y, cfp.positions_z, strict=True)
-                    translations = [(x, y, z) for x, y, z in trans_iter]
-                    rot_iter = zip(cfp.rotations_x, cfp.rotations_y, cfp.rotations_z, cfp.rotations_w, strict=True)
-                    rotations = [(x, y, z, w) for x, y, z, w in rot_iter]
+                    translations = np.empty((len(cfp.positions_x), 3), dtype=anim.FLOAT_DTYPE)
+                    translations[:, 0] = cfp.positions_x
+                    translations[:, 1] = cfp.positions_y
+                    translations[:, 2] = cfp.positions_z
+
+                    rotations = np.empty((len(cfp.rotations_x), 4), dtype=anim.FLOAT_DTYPE)
+                    rotations[:, 0] = cfp.rotations_x
+                    rotations[:, 1] = cfp.rotations_y
+                    rotations[:, 2] = cfp.rotations_z
+                    rotations[:, 3] = cfp.rotations_w
 
                     animation = anim.Anim(
                         skill.animation_name,
@@ -64,4 +71,4 @@ def export_files(
                         [bcf_motion_to_anim_motion(x) for x in skill.motions],
                     )
 
-                    anim.write_file(output_directory / (animation.name + ".anim"), animation)
+                    anim.write_file(output_directory / (animation.name + ".anim"), animation, atomic=True)
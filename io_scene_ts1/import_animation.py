@@ -1,22 +1,23 @@
 """Import The Sims animations in to Blender."""
 
 import dataclasses
-import logging
 
 import bpy
 import bpy_extras.anim_utils
 import mathutils
+import numpy as np
 
 from . import utils
 from .ts1_formats import bcf, cfp
+from .ts1_formats.import_report import ImportReport
 
 
 @dataclasses.dataclass
 class AnimData:
-    """Anim format translations and rotations."""
+    """Anim format translations and rotations as Nx3 and Nx4 arrays."""
 
-    translations: list[tuple[float, float, float]]
-    rotations: list[tuple[float, float, float, float]]
+    translations: np.ndarray
+    rotations: np.ndarray
 
 
 def get_translation_matrix(data: cfp.Cfp | AnimData, index: int) -> mathutils.Matrix | None:
@@ -27,7 +28,8 @@ def get_translation_matrix(data: cfp.Cfp | AnimData, index: int) -> mathutils.Ma
         case AnimData(translations):
             if index >= len(translations):
                 return None
-            vector = (translations[index][0], translations[index][2], translations[index][1])
+            x, y, z = translations[index]
+            vector = (x, z, y)
     return mathutils.Matrix.Translation(mathutils.Vector(vector) / utils.BONE_SCALE)
 
 
@@ -37,7 +39,8 @@ def get_rotation_matrix(data: cfp.Cfp | AnimData, index: int) -> mathutils.Matri
         case cfp.Cfp(_, _, _, rotations_x, rotations_y, rotations_z, rotations_w):
             quat = (rotations_w[index], rotations_x[index], rotations_z[index], rotations_y[index])
         case AnimData(_, rotations):
-            quat = (rotations[index][3], rotations[index][0], rotations[index][2], rotations[index][1])
+            x, y, z, w = rotations[index]
+            quat = (w, x, z, y)
     return mathutils.Quaternion(quat).to_matrix().to_4x4()
 
 
@@ -60,7 +63,7 @@ MAX_TIMELINE_MARKER_NAME_LENGTH = 63  # 64 - null
 
 def import_animation(
     context: bpy.types.Context,
-    logger: logging.Logger,
+    report: ImportReport,
     armature: bpy.types.Object,
     animation: bcf.Skill,
     translations_rotations: cfp.Cfp | AnimData,
@@ -110,7 +113,11 @@ def import_animation(
             if motion.uses_positions:
                 translation = get_translation_matrix(translations_rotations, motion.position_offset + frame)
                 if translation is None:
-                    logger.info("Could not import %s, invalid translation index.", animation.skill_name)
+                    report.add(
+                        "invalid_animations",
+                        "Could not import %s, invalid translation index.",
+                        animation.skill_name,
+                    )
                     anim_data.action = None
                     bpy.data.actions.remove(action)
                     return
@@ -172,27 +179,30 @@ def import_animation(
             create_fcurve_data(fcurves, rotation_data_path, 3, 1, [1.0, 0.0])
 
     if ignored_bone_count > 0:
-        logger.info("Skipped %i unknown bones in %s.", ignored_bone_count, animation.skill_name)
-
-    for motion in animation.motions:
-        for time_property_list in motion.time_property_lists:
-            for time_property in time_property_list.time_properties:
-                for event in time_property.events:
-                    event_string = f"{motion.bone_name} {event.name} {event.value}"
-                    frame = round(time_property.time / 33.3333333) + 1
-
-                    markers = [x for x in action.pose_markers if x.frame == frame]
-
-                    if len(markers) == 0:
-                        marker = action.pose_markers.new(name=event_string)
-                        marker.frame = frame
-                    else:
-                        last_marker = action.pose_markers[-1]
-                        if len(last_marker.name) + 1 + len(event_string) <= MAX_TIMELINE_MARKER_NAME_LENGTH:
-                            last_marker.name = f"{last_marker.name};{event_string}"
-                        else:
-                            marker = action.pose_markers.new(name=event_string)
-                            marker.frame = frame
+        report.add(
+            "unknown_bones",
+            "Skipped %i unknown bones in %s.",
+            ignored_bone_count,
+            animation.skill_name,
+            count=ignored_bone_count,
+        )
+
+    for event in bcf.create_event_table(animation):
+        event_string = f"{event.bone_name} {event.name} {event.value}"
+        frame = round(event.time / 33.3333333) + 1
+
+        markers = [x for x in action.pose_markers if x.frame == frame]
+
+        if len(markers) == 0:
+            marker = action.pose_markers.new(name=event_string)
+            marker.frame = frame
+        else:
+            last_marker = action.pose_markers[-1]
+            if len(last_marker.name) + 1 + len(event_string) <= MAX_TIMELINE_MARKER_NAME_LENGTH:
+                last_marker.name = f"{last_marker.name};{event_string}"
+            else:
+                marker = action.pose_markers.new(name=event_string)
+                marker.frame = frame
 
     track = anim_data.nla_tracks.new(prev=None)
     track.name = animation.animation_name
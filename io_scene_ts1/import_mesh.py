@@ -1,118 +1,153 @@
 """Import The Sims mesh in to Blender."""
 
-import logging
-import math
-
-import bmesh
 import bpy
-import mathutils
+import numpy as np
 
 from . import utils
+from .ts1_formats import skinning
 from .ts1_formats.bmf import Mesh
+from .ts1_formats.import_report import ImportReport
+
+# Swaps the y and z axes of positions in the files and scales them down to Blender units.
+FILE_TO_BLENDER_MATRIX = np.array(
+    [
+        [1.0 / utils.BONE_SCALE, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0 / utils.BONE_SCALE, 0.0],
+        [0.0, 1.0 / utils.BONE_SCALE, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ],
+)
+
+
+def filter_faces(faces: list[tuple[int, int, int]], vertex_count: int) -> tuple[np.ndarray, int]:
+    """Reverse the winding of the faces and remove the ones with invalid or repeated vertices, or that are duplicates.
+
+    The valid faces and the number of faces removed are returned.
+    """
+    face_array = np.array(faces, dtype=np.int64).reshape(-1, 3)[:, ::-1]
+
+    valid = ((face_array >= 0) & (face_array < vertex_count)).all(axis=1)
+    valid &= face_array[:, 0] != face_array[:, 1]
+    valid &= face_array[:, 1] != face_array[:, 2]
+    valid &= face_array[:, 2] != face_array[:, 0]
+    face_array = face_array[valid]
+
+    # Faces using the same vertices in any order are duplicates, the first one is kept.
+    _, first_indices = np.unique(np.sort(face_array, axis=1), axis=0, return_index=True)
+    face_array = face_array[np.sort(first_indices)]
+
+    return face_array, len(faces) - len(face_array)
+
+
+def calculate_weights(
+    skinned_mesh: skinning.SkinnedMesh, binding_groups: np.ndarray
+) -> dict[tuple[int, float], list[int]]:
+    """Calculate the vertex group weights of the vertices, as lists of vertex indices keyed by group and weight.
+
+    Every vertex is fully weighted to the group of its binding, then blended vertices are split between the group of
+    the binding whose vertex range contains them and the group of the binding they are blended with.
+    """
+    weights = dict.fromkeys(enumerate(binding_groups[skinned_mesh.vertex_bindings].tolist()), 1.0)
+
+    blends = skinned_mesh.blends
+    original_groups = np.where(
+        blends.original_bindings == skinning.UNBOUND,
+        skinning.UNBOUND,
+        binding_groups[blends.original_bindings],
+    )
+    for vertex_index, original_group, original_weight, blend_group, weight in zip(
+        blends.vertex_indices.tolist(),
+        original_groups.tolist(),
+        blends.original_weights.tolist(),
+        binding_groups[blends.bindings].tolist(),
+        blends.weights.tolist(),
+        strict=True,
+    ):
+        if original_group != skinning.UNBOUND:
+            weights[vertex_index, original_group] = original_weight
+        weights[vertex_index, blend_group] = weight
+
+    weight_batches: dict[tuple[int, float], list[int]] = {}
+    for (vertex_index, group_index), weight in weights.items():
+        weight_batches.setdefault((group_index, weight), []).append(vertex_index)
+    return weight_batches
 
 
 def import_mesh(
-    logger: logging.Logger, mesh_name: str, armature_object: bpy.types.Object, sims_mesh: Mesh
+    report: ImportReport, mesh_name: str, armature_object: bpy.types.Object, sims_mesh: Mesh
 ) -> bpy.types.Object | None:
     """Create a mesh object for the mesh."""
     armature = armature_object.data
 
     if not all(bone in armature.bones for bone in sims_mesh.bones):
-        logger.info(
-            f"Could not apply mesh {mesh_name} to armature {armature_object.name}. The bones do not match.",  # noqa: G004
+        report.add(
+            "mismatched_bones",
+            "Could not apply mesh %s to armature %s. The bones do not match.",
+            mesh_name,
+            armature_object.name,
         )
         return None
 
+    if any(bone_binding.bone_index >= len(sims_mesh.bones) for bone_binding in sims_mesh.bone_bindings):
+        report.add("invalid_bones", "Invalid bone index in %s.", mesh_name)
+        return None
+
+    binding_bone_names = [sims_mesh.bones[bone_binding.bone_index] for bone_binding in sims_mesh.bone_bindings]
+    bone_matrices = np.array(
+        [
+            armature.bones[bone_name].matrix_local @ utils.BONE_ROTATION_OFFSET_INVERTED
+            for bone_name in binding_bone_names
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 4, 4)
+
+    skinned_mesh = skinning.skin_mesh(sims_mesh, bone_matrices @ FILE_TO_BLENDER_MATRIX)
+    positions = skinned_mesh.positions
+
+    faces, invalid_face_count = filter_faces(sims_mesh.faces, len(positions))
+    if invalid_face_count > 0:
+        report.add(
+            "skipped_faces",
+            "Skipped %i invalid faces in mesh %s",
+            invalid_face_count,
+            mesh_name,
+            count=invalid_face_count,
+        )
+
     mesh = bpy.data.meshes.new(mesh_name)
     obj = bpy.data.objects.new(mesh_name, mesh)
 
-    b_mesh = bmesh.new()
-
-    normals = []
-    deform_layer = b_mesh.verts.layers.deform.verify()
-
-    # create the vertices
-    for bone_binding in sims_mesh.bone_bindings:
-        if bone_binding.bone_index >= len(sims_mesh.bones):
-            logger.info("Invalid bone index in %s.", mesh_name)
-            return None
-        bone_name = sims_mesh.bones[bone_binding.bone_index]
-
-        armature_bone = armature.bones[bone_name]
-        bone_matrix = armature_bone.matrix_local @ utils.BONE_ROTATION_OFFSET_INVERTED
-
-        vertex_group = obj.vertex_groups.new(name=bone_name)
-
-        vertex_index_start = bone_binding.vertex_index
-        vertex_index_end = vertex_index_start + bone_binding.vertex_count
-        for vertex in sims_mesh.vertices[vertex_index_start:vertex_index_end]:
-            position = mathutils.Vector(vertex.position).xzy / utils.BONE_SCALE
-            b_mesh_vertex = b_mesh.verts.new(bone_matrix @ position)
-
-            bone_matrix_normal = bone_matrix.to_quaternion().to_matrix().to_4x4()
-            normal = bone_matrix_normal @ mathutils.Vector(vertex.normal).xzy
-            normals.append(normal)
-
-            b_mesh_vertex[deform_layer][vertex_group.index] = 1.0
-
-    b_mesh.verts.ensure_lookup_table()
-    b_mesh.verts.index_update()
-
-    # handle blended vertices
-    for bone_binding in sims_mesh.bone_bindings:
-        bone_name = sims_mesh.bones[bone_binding.bone_index]
-        vertex_group = obj.vertex_groups[bone_name]
-
-        armature_bone = armature.bones[bone_name]
-        bone_matrix = armature_bone.matrix_local @ utils.BONE_ROTATION_OFFSET_INVERTED
-
-        blend_index_start = bone_binding.blended_vertex_index
-        blend_index_end = blend_index_start + bone_binding.blended_vertex_count
-        for blend_index, blend in enumerate(sims_mesh.blends[blend_index_start:blend_index_end]):
-            weight = float(blend.weight) * math.pow(2, -15)
-
-            # recalculate the final vertex position based on the blended vertex
-            vertex_position = b_mesh.verts[blend.vertex_index].co
-            blend_position = sims_mesh.blend_vertices[blend_index_start + blend_index].position
-            blend_position = mathutils.Vector(blend_position).xzy / utils.BONE_SCALE
-            blend_position = bone_matrix @ blend_position
-            vertex_position *= 1 - weight
-            blend_position *= weight
-            b_mesh.verts[blend.vertex_index].co = vertex_position + blend_position
-
-            # set the vertex weights
-            for inner_bone_binding in sims_mesh.bone_bindings:
-                vertex_index_start = inner_bone_binding.vertex_index
-                vertex_index_end = vertex_index_start + inner_bone_binding.vertex_count
-                if blend.vertex_index >= vertex_index_start and blend.vertex_index < vertex_index_end:
-                    original_bone_name = sims_mesh.bones[inner_bone_binding.bone_index]
-
-            original_vertex_group = obj.vertex_groups[original_bone_name]
-            b_mesh.verts[blend.vertex_index][deform_layer][original_vertex_group.index] = 1 - weight
-            b_mesh.verts[blend.vertex_index][deform_layer][vertex_group.index] = weight
-
-    # create the faces
-    invalid_face_count = 0
-    for face in sims_mesh.faces:
-        try:
-            b_mesh.faces.new((b_mesh.verts[face[2]], b_mesh.verts[face[1]], b_mesh.verts[face[0]]))
-        except ValueError as _:  # noqa: PERF203
-            invalid_face_count += 1
+    # create the vertices and faces
+    mesh.vertices.add(len(positions))
+    mesh.vertices.foreach_set("co", positions.astype(np.float32).ravel())
 
-    if invalid_face_count > 0:
-        logger.info(f"Skipped {invalid_face_count} invalid faces in mesh {mesh_name}")  # noqa: G004
+    loop_vertex_indices = faces.ravel()
+    mesh.loops.add(len(loop_vertex_indices))
+    mesh.loops.foreach_set("vertex_index", loop_vertex_indices.astype(np.int32))
 
-    # create the uvs
-    uv_layer = b_mesh.loops.layers.uv.verify()
-    for face in b_mesh.faces:
-        for loop in face.loops:
-            uv = sims_mesh.uvs[loop.vert.index]
-            loop[uv_layer].uv = (uv[0], 1 - uv[1])
+    mesh.polygons.add(len(faces))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(loop_vertex_indices), 3, dtype=np.int32))
 
-    b_mesh.to_mesh(mesh)
-    b_mesh.free()
+    mesh.update(calc_edges=True)
 
-    mesh.normals_split_custom_set_from_vertices(normals)
+    # create the uvs
+    uvs = np.array(sims_mesh.uvs, dtype=np.float32).reshape(-1, 2)[loop_vertex_indices]
+    uvs[:, 1] = 1 - uvs[:, 1]
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", uvs.ravel())
+
+    # set the vertex weights, adding the vertices of each group with the same weight in one call
+    group_indices: dict[str, int] = {}
+    for bone_name in binding_bone_names:
+        if bone_name not in group_indices:
+            group_indices[bone_name] = obj.vertex_groups.new(name=bone_name).index
+    binding_groups = np.array([group_indices[bone_name] for bone_name in binding_bone_names], dtype=np.int64)
+
+    weight_batches = calculate_weights(skinned_mesh, binding_groups)
+    for (group_index, weight), vertex_indices in weight_batches.items():
+        obj.vertex_groups[group_index].add(vertex_indices, weight, 'REPLACE')
+
+    mesh.normals_split_custom_set_from_vertices(skinned_mesh.normals)
 
     obj.location = armature_object.location
     obj.rotation_euler = armature_object.rotation_euler
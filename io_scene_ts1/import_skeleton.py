@@ -2,11 +2,13 @@
 
 import copy
 import math
+import pathlib
 
 import bpy
 import mathutils
 
 from . import utils
+from .ts1_formats import skeleton_cache
 from .ts1_formats.skeleton import Skeleton
 
 
@@ -72,3 +74,65 @@ def import_skeleton(context: bpy.types.Context, skeleton: Skeleton) -> bpy.types
     armature_object.select_set(state=True)
 
     return armature_object
+
+
+TEMPLATE_NAME_PREFIX = ".ts1-template-"
+TEMPLATE_KEY_PROPERTY = "TS1 Template Key"
+TEMPLATE_SKELETON_NAME_PROPERTY = "TS1 Template Skeleton Name"
+
+
+def duplicate_armature_object(
+    context: bpy.types.Context, source_object: bpy.types.Object, name: str
+) -> bpy.types.Object:
+    """Create a copy of an armature object and its armature and link it to the scene."""
+    armature_object = source_object.copy()
+    armature_object.data = source_object.data.copy()
+    armature_object.use_fake_user = False
+    for property_name in (TEMPLATE_KEY_PROPERTY, TEMPLATE_SKELETON_NAME_PROPERTY):
+        if property_name in armature_object:
+            del armature_object[property_name]
+    armature_object.name = name
+    armature_object.data.name = name
+    context.scene.collection.objects.link(armature_object)
+
+    bpy.ops.object.select_all(action='DESELECT')
+    armature_object.select_set(state=True)
+    context.view_layer.objects.active = armature_object
+
+    return armature_object
+
+
+def import_skeleton_file(
+    context: bpy.types.Context, file_path: pathlib.Path, *, keep_template: bool
+) -> bpy.types.Object:
+    """Create an armature object for the first skeleton in a bcf or cmx file.
+
+    If keep_template, a hidden copy of the armature is kept and duplicated by later imports of the unmodified file.
+    """
+    if not keep_template:
+        return import_skeleton(context, skeleton_cache.read_skeletons(file_path)[0])
+
+    template_name = TEMPLATE_NAME_PREFIX + file_path.name.lower()
+    template_key = skeleton_cache.source_key(file_path)
+
+    template = bpy.data.objects.get(template_name)
+    if template is not None and template.get(TEMPLATE_KEY_PROPERTY) == template_key:
+        return duplicate_armature_object(context, template, template[TEMPLATE_SKELETON_NAME_PROPERTY])
+
+    if template is not None:
+        template_armature = template.data
+        bpy.data.objects.remove(template)
+        if template_armature.users == 0:
+            bpy.data.armatures.remove(template_armature)
+
+    skeleton = skeleton_cache.read_skeletons(file_path)[0]
+    armature_object = import_skeleton(context, skeleton)
+
+    template = armature_object.copy()
+    template.data = armature_object.data.copy()
+    template.name = template_name
+    template.use_fake_user = True
+    template[TEMPLATE_KEY_PROPERTY] = template_key
+    template[TEMPLATE_SKELETON_NAME_PROPERTY] = skeleton.name
+
+    return armature_object
@@ -1,192 +1,127 @@
 """Import The Sims 1 3D formats in to Blender."""
 
-import logging
+import collections
+import collections.abc
 import pathlib
-import re
 
 import bpy
 
 from . import import_animation, import_mesh, import_skeleton, texture_loader
-from .ts1_formats import bcf, bmf, cfp, cmx, skn
+from .ts1_formats import (
+    import_plan,
+    import_report,
+    preload,
+    profiling,
+    property_list,
+    proxy_texture,
+    skin_classifier,
+    texture_names,
+)
 from .ts1_formats.error import FileReadError as TS1FileReadError
 
 
-def get_skin_type_skeleton_names(skin_name: str) -> list[str]:  # noqa: PLR0911
-    """Get a list of skeletons that a skin can be applied to."""
-    # gnome
-    if re.match("^xskin-SpellboundMAFat_Gnome-.*-GNOMEBODY.*", skin_name):
-        return ["kat"]
-
-    # adult head
-    if re.match("^xskin-c\\d{3}(f|m|u)a.*-head", skin_name.lower()):
-        return ["adult"]
-
-    # adult body
-    if re.match("^xskin-(b|f|h|l|s|w)\\d{3}(f|m|u)a(skn|fit|fat|chd).*-body.*", skin_name.lower()):
-        return ["adult"]
-
-    # child head
-    if re.match("^xskin-c\\d{3}(f|m|u)c.*-head", skin_name.lower()):
-        return ["child"]
-
-    # child body
-    if re.match("^xskin-(b|f|h|l|s|w)\\d{3}(f|m|u)c(skn|fit|fat|chd|).*-body.*", skin_name.lower()):
-        return ["child"]
-
-    # adult npc head
-    if re.match("^xskin-c((?!\\d{3}).).*(f|m|u)a(skn|fit|fat|)_.*-head-.*", skin_name.lower()):
-        return ["adult"]
-
-    # child npc head
-    if re.match("^xskin-c((?!\\d{3}).).*(f|m|u)cchd_.*-head-.*", skin_name.lower()):
-        return ["child"]
-
-    # adult npc body
-    if re.match("^xskin-((?!\\d{3}).).*(f|m|u)a(skn|fit|fat)_.*-pelvis-.*", skin_name.lower()):
-        return ["adult"]
-
-    # child npc body
-    if re.match("^xskin-.*chd_.*-pelvis-.*", skin_name.lower()):
-        return ["child"]
-
-    # adult costume
-    if re.match("^xskin-ct-.*(f|m)a-.*", skin_name.lower()):
-        return ["adult"]
-
-    # child costume
-    if re.match("^xskin-ct-.*(f|m)c-.*", skin_name.lower()):
-        return ["child"]
-
-    # unleashed npc
-    if texture_loader.is_unleashed_npc_body_skin_type(skin_name):
-        return ["adult"]
-
-    # cat
-    if re.match("^xskin-b\\d{3}(c|k)at.*", skin_name.lower()):
-        return ["kat"]
-
-    # dog
-    if re.match("^xskin-b\\d{3}dog_.*", skin_name.lower()):
-        return ["dog"]
-
-    # skunk and raccoon
-    if re.match("^xskin-.*-dogbody", skin_name.lower()):
-        return ["dog"]
-
-    # dragon
-    if re.match("^xskin-b\\d{3}dragon_.*", skin_name.lower()):
-        return ["kat"]
-
-    # effects
-    if re.match("^xskin-effects1-.*", skin_name.lower()):
-        return ["effects1"]
-
-    # cat accessories
-    if re.match("^xskin-cat.*-cat-", skin_name.lower()):
-        return ["kat"]
-
-    # dog accessories
-    if re.match("^xskin-dog.*-dog-", skin_name.lower()):
-        return ["dog"]
-
-    return ["adult", "child"]
-
-
 class UnknownSkillTypeError(Exception):
     """Unknown skill type error."""
 
 
 def get_skill_type_skeleton_name(skill_name: str) -> list[str]:
     """Return the name of the skeleton that the skill type uses."""
-    if skill_name.startswith("a2"):
-        return ["adult"]
-    if skill_name.startswith("c2"):
-        return ["child"]
-    if skill_name.startswith("k2"):
-        return ["kat"]
-    if skill_name.startswith("d2"):
-        return ["dog"]
-    if skill_name.startswith("f2"):
-        return ["kat"]
-    if skill_name.startswith("effects-"):
-        return ["effects1"]
-
-    raise UnknownSkillTypeError
+    skeleton_names = skin_classifier.classify_skill(skill_name)
+    if skeleton_names is None:
+        raise UnknownSkillTypeError
+
+    return list(skeleton_names)
 
 
 def find_or_import_skeleton(
     context: bpy.types.Context,
-    file_list: list[pathlib.Path],
+    skeleton_files: dict[str, pathlib.Path | None],
     skeleton_names: list[str],
+    *,
+    keep_skeleton_templates: bool,
 ) -> bpy.types.Object | None:
-    """Find a skeleton from the list of names, or import it if it doesn't exist."""
+    """Find a skeleton from the list of names, or import it from the planned skeleton file if it doesn't exist."""
     if context.active_object is not None:
         for skeleton_name in skeleton_names:
             if context.active_object.type == 'ARMATURE' and context.active_object.name.startswith(skeleton_name):
                 return context.active_object
 
-    skeleton_file_name_map = {
-        "adult": "adult-skeleton.cmx.bcf",
-        "child": "child-skeleton.cmx.bcf",
-        "kat": "kat_skeleton.cmx.bcf",
-        "dog": "dog_skeleton.cmx.bcf",
-        "effects1": "effects1-skeleton.cmx.bcf",
-    }
-    skeleton_file_name = skeleton_file_name_map.get(skeleton_names[0])
-
     armature_object = context.scene.objects.get(skeleton_names[0])
     if armature_object is None or armature_object.type != 'ARMATURE':
-        for file_path in file_list:
-            if file_path.name == skeleton_file_name:
-                bcf_file = bcf.read_file(file_path)
-                return import_skeleton.import_skeleton(context, bcf_file.skeletons[0])
+        file_path = skeleton_files.get(skeleton_names[0])
+        if file_path is not None:
+            return import_skeleton.import_skeleton_file(context, file_path, keep_template=keep_skeleton_templates)
 
     return armature_object
 
 
 def import_suit(
     context: bpy.types.Context,
-    logger: logging.Logger,
-    bcf_directory: pathlib.Path,
-    file_list: list[pathlib.Path],
-    texture_file_list: list[pathlib.Path],
-    suit: bcf.Suit,
-    preferred_skin_color: str,
+    report: import_report.ImportReport,
+    profiler: profiling.Profiler,
+    preloader: preload.Preloader,
+    plan: import_plan.ImportPlan,
+    suit_plan: import_plan.SuitPlan,
     armature_object_map: dict[str, list[str]],
     *,
+    mesh_file_uses: collections.Counter[pathlib.Path],
     find_skeleton: bool,
+    keep_skeleton_templates: bool,
     fix_textures: bool,
+    defer_images: bool,
 ) -> None:
-    """Create the meshes for the described suit."""
-    for skin in suit.skins:
+    """Create the meshes for the planned suit.
+
+    The mesh file uses are counted down, and each mesh is released from the preloader when its last skin reads it.
+    """
+    suit = suit_plan.suit
+    for skin, skin_plan in zip(suit.skins, suit_plan.skins, strict=True):
+        if skin_plan.mesh_file_path is not None:
+            mesh_file_uses[skin_plan.mesh_file_path] -= 1
+
         armature_object = None
         if find_skeleton:
-            skeleton_names = get_skin_type_skeleton_names(skin.skin_name)
-            armature_object = find_or_import_skeleton(context, file_list, skeleton_names)
+            skeleton_names = skin_plan.skeleton_names
+            with profiler.span("skeletons"):
+                armature_object = find_or_import_skeleton(
+                    context,
+                    plan.skeleton_files,
+                    skeleton_names,
+                    keep_skeleton_templates=keep_skeleton_templates,
+                )
 
             if armature_object is None:
-                logger.info(f"Could not find or import {skeleton_names[0]} skeleton used by {suit.name}.")  # noqa: G004
+                report.add(
+                    "missing_skeletons",
+                    "Could not find or import %s skeleton used by %s.",
+                    skeleton_names[0],
+                    suit.name,
+                )
                 continue
 
         elif context.active_object:
             armature_object = context.active_object
 
         if armature_object is None or armature_object.type != 'ARMATURE':
-            logger.info("Please select an armature to apply the imported mesh to.")
+            report.add("no_armature", "Please select an armature to apply the imported mesh to.")
             break
 
+        if skin_plan.mesh_file_path is None:
+            report.add("missing_meshes", "Could not find mesh %s used by %s.", skin.skin_name, suit.name)
+            continue
+
         try:
-            bmf_file_path = bcf_directory / (skin.skin_name + ".bmf")
-            if bmf_file_path.is_file():
-                bmf_file = bmf.read_file(bmf_file_path)
-            else:
-                skn_file_path = bcf_directory / (skin.skin_name + ".skn")
-                bmf_file = skn.read_file(skn_file_path)
+            with profiler.span("parsing"):
+                if mesh_file_uses[skin_plan.mesh_file_path] > 0:
+                    bmf_file = preloader.result(skin_plan.mesh_file_path)
+                else:
+                    bmf_file = preloader.take(skin_plan.mesh_file_path)
         except TS1FileReadError as _:
-            logger.info(f"Could not load mesh {skin.skin_name} used by {suit.name}.")  # noqa: G004
+            report.add("unreadable_files", "Could not load mesh %s used by %s.", skin.skin_name, suit.name)
             continue
 
-        obj = import_mesh.import_mesh(logger, skin.skin_name, armature_object, bmf_file.mesh)
+        with profiler.span("meshes"):
+            obj = import_mesh.import_mesh(report, skin.skin_name, armature_object, bmf_file.mesh)
         if obj is None:
             continue
 
@@ -201,17 +136,19 @@ def import_suit(
         obj["Bone Name"] = skin.bone_name
         obj["Censor Flags"] = skin.censor_flags
 
-        texture_loader.load_textures(
-            obj,
-            texture_file_list,
-            skin.skin_name,
-            bmf_file.default_texture_name,
-            preferred_skin_color,
-            fix_textures=fix_textures,
-        )
+        with profiler.span("textures"):
+            texture_files = skin_plan.texture_files
+            if not texture_files:
+                texture_files = texture_names.find_default_texture_files(
+                    plan.texture_index,
+                    skin.skin_name,
+                    bmf_file.default_texture_name,
+                    fix_textures=fix_textures,
+                )
+            texture_loader.create_materials(obj, texture_files, defer_images=defer_images)
 
         if not obj.data.materials:
-            logger.info(f"Could not find a texture for mesh {skin.skin_name}")  # noqa: G004
+            report.add("missing_textures", "Could not find a texture for mesh %s", skin.skin_name)
 
         if armature_object_map.get(armature_object) is None:
             armature_object_map[armature_object] = []
@@ -221,37 +158,65 @@ def import_suit(
 
 def import_skill(
     context: bpy.types.Context,
-    logger: logging.Logger,
-    file_directory: pathlib.Path,
-    file_list: list[pathlib.Path],
-    skill: bcf.Skill,
+    report: import_report.ImportReport,
+    skill_plan: import_plan.SkillPlan,
+    *,
+    profiler: profiling.Profiler,
+    preloader: preload.Preloader,
+    plan: import_plan.ImportPlan,
+    keep_skeleton_templates: bool,
 ) -> None:
-    """Create the actions and nla track for the described skill."""
-    cfp_file_path = file_directory / (skill.animation_name + ".cfp")
-    if not cfp_file_path.is_file():
-        matches = [file_path for file_path in file_list if file_path.stem.lower() == cfp_file_path.stem.lower()]
-        if len(matches) > 0:
-            cfp_file_path = matches[0]
+    """Create the actions and nla track for the planned skill."""
+    skill = skill_plan.skill
+    cfp_file_path = skill_plan.cfp_file_path
+    if cfp_file_path is None:
+        cfp_file_path = skill_plan.bcf_file_path.parent / (skill.animation_name + ".cfp")
     try:
-        cfp_file = cfp.read_file(cfp_file_path, skill.position_count, skill.rotation_count)
+        with profiler.span("parsing"):
+            cfp_file = preloader.take(cfp_file_path, skill.position_count, skill.rotation_count)
     except TS1FileReadError as _:
-        logger.info(f"Could not load cfp file {cfp_file_path}")  # noqa: G004
+        report.add("unreadable_files", "Could not load cfp file %s", cfp_file_path)
         return
 
     skeleton_name = get_skill_type_skeleton_name(skill.skill_name)
-    armature = find_or_import_skeleton(context, file_list, skeleton_name)
+    with profiler.span("skeletons"):
+        armature = find_or_import_skeleton(
+            context,
+            plan.skeleton_files,
+            skeleton_name,
+            keep_skeleton_templates=keep_skeleton_templates,
+        )
     if armature is None:
-        logger.info(f"Could not find or import {skeleton_name} skeleton used by {skill.skill_name}")  # noqa: G004
+        report.add(
+            "missing_skeletons",
+            "Could not find or import %s skeleton used by %s",
+            skeleton_name,
+            skill.skill_name,
+        )
         return
 
     armature_object = bpy.data.objects[armature.name]
 
-    import_animation.import_animation(context, logger, armature_object, skill, cfp_file)
+    with profiler.span("animations"):
+        import_animation.import_animation(context, report, armature_object, skill, cfp_file)
 
 
-def import_files(
+def get_file_index_cache_directory() -> pathlib.Path:
+    """Get the directory the file search directory index is cached in."""
+    return pathlib.Path(bpy.utils.user_resource('CONFIG', path="io_scene_ts1"))
+
+
+def get_proxy_directory(preferences: bpy.types.AddonPreferences) -> pathlib.Path:
+    """Get the directory the proxy textures are cached in."""
+    if preferences.proxy_directory != "":
+        return pathlib.Path(preferences.proxy_directory)
+    return pathlib.Path(bpy.utils.user_resource('CONFIG', path="io_scene_ts1/proxies"))
+
+
+def iterate_import_files(
     context: bpy.types.Context,
-    logger: logging.Logger,
+    report: import_report.ImportReport,
+    profiler: profiling.Profiler,
     file_paths: list[pathlib.Path],
     preferred_skin_color: str,
     *,
@@ -259,75 +224,216 @@ def import_files(
     import_meshes: bool,
     import_animations: bool,
     find_skeleton: bool,
+    keep_skeleton_templates: bool,
     cleanup_meshes: bool,
     fix_textures: bool,
-) -> None:
-    """Import all the skeletons, meshes and animations in the selected files."""
+) -> collections.abc.Generator[tuple[int, int], bpy.types.Context | None, None]:
+    """Import all the skeletons, meshes and animations in the selected files one step at a time.
+
+    After each step the number of completed steps and the total number of steps is yielded. The context of the next
+    step can be sent, as a context is only valid during the call it was passed to.
+    """
     if bpy.ops.object.mode_set.poll():
         bpy.ops.object.mode_set(mode='OBJECT')
 
     if bpy.ops.object.select_all.poll():
         bpy.ops.object.select_all(action='DESELECT')
 
-    bcf_files = []
-    for file_path in file_paths:
-        match file_path.suffix:
-            case ".cmx":
-                bcf_files.append((file_path, cmx.read_file(file_path)))
-            case ".bcf":
-                bcf_files.append((file_path, bcf.read_file(file_path)))
-
-    file_search_directory = pathlib.Path(context.preferences.addons["io_scene_ts1"].preferences.file_search_directory)
-    if file_search_directory == "":
-        file_search_directory = file_paths[0].parent
-    file_list = list(file_search_directory.rglob("*"))
-
-    if not file_paths[0].parent.is_relative_to(file_search_directory):
-        file_list.extend(file_paths[0].parent.glob("*"))
-
-    bcf_file_list = [path for path in file_list if path.suffix.lower() == ".bcf" or path.suffix.lower() == ".cmx"]
-
-    if import_skeletons:
-        for _, bcf_file in bcf_files:
-            for skeleton in bcf_file.skeletons:
-                import_skeleton.import_skeleton(context, skeleton)
-
-    if import_meshes:
-        mesh_file_list = bcf_file_list + [
-            path for path in file_list if path.suffix.lower() == ".bmf" or path.suffix.lower() == ".skn"
-        ]
-        texture_file_list = [
-            path for path in file_list if path.suffix.lower() == ".bmp" or path.suffix.lower() == ".tga"
-        ]
-
-        armature_object_map: dict[str, list[str]] = {}
-        for bcf_file_path, bcf_file in bcf_files:
-            for suit in bcf_file.suits:
-                import_suit(
-                    context,
-                    logger,
-                    bcf_file_path.parent,
-                    mesh_file_list,
+    context = (yield 0, 1) or context
+
+    preferences = context.preferences.addons["io_scene_ts1"].preferences
+
+    try:
+        with preload.Preloader(preferences.file_read_mode) as preloader:
+            bcf_file_paths = [file_path for file_path in file_paths if file_path.suffix in {".cmx", ".bcf"}]
+            for file_path in bcf_file_paths:
+                preloader.request(file_path)
+
+            with profiler.span("parsing"):
+                bcf_files = [(file_path, preloader.result(file_path)) for file_path in bcf_file_paths]
+
+            with profiler.span("discovery"):
+                file_search_directory = pathlib.Path(preferences.file_search_directory or file_paths[0].parent)
+                resolver, texture_file_list = import_plan.index_search_directories(
+                    file_paths,
+                    file_search_directory,
+                    get_file_index_cache_directory(),
+                )
+
+            with profiler.span("planning"):
+                plan = import_plan.create_plan(
+                    bcf_files,
+                    resolver,
                     texture_file_list,
-                    suit,
                     preferred_skin_color,
-                    armature_object_map,
+                    preloader,
+                    import_skeletons=import_skeletons,
+                    import_meshes=import_meshes,
+                    import_animations=import_animations,
                     find_skeleton=find_skeleton,
                     fix_textures=fix_textures,
+                    read_meshes=False,
                 )
 
-        previous_active_object = context.view_layer.objects.active
-
-        for armature_object, objects in armature_object_map.items():
-            import_mesh.parent_and_clean_up_meshes(context, armature_object, objects, cleanup_meshes=cleanup_meshes)
+            proxy_directory = None
+            if preferences.texture_load_mode == 'PROXY':
+                proxy_directory = get_proxy_directory(preferences)
+
+            if import_meshes and preferences.texture_load_mode in {'DECODED', 'PROXY'}:
+                for suit_plan in plan.suits:
+                    for skin_plan in suit_plan.skins:
+                        for _, texture_file_path in skin_plan.texture_files:
+                            if texture_file_path is None:
+                                continue
+                            if proxy_directory is None or not proxy_texture.is_proxy_cached(
+                                texture_file_path,
+                                proxy_directory,
+                                preferences.proxy_texture_scale,
+                            ):
+                                preloader.request(texture_file_path)
+
+            total_steps = 1 + len(plan.skeletons) + (len(plan.suits) + 1 if import_meshes else 0) + len(plan.skills)
+            completed_steps = 1
+            context = (yield completed_steps, total_steps) or context
+
+            if import_skeletons:
+                for _, bcf_file in bcf_files:
+                    for skeleton in bcf_file.skeletons:
+                        with profiler.span("skeletons"):
+                            import_skeleton.import_skeleton(context, skeleton)
+                        completed_steps += 1
+                        context = (yield completed_steps, total_steps) or context
+
+            if import_meshes:
+                armature_object_map: dict[str, list[str]] = {}
+                mesh_file_uses = plan.count_mesh_file_uses()
+                try:
+                    for suit_plan in plan.suits:
+                        import_suit(
+                            context,
+                            report,
+                            profiler,
+                            preloader,
+                            plan,
+                            suit_plan,
+                            armature_object_map,
+                            mesh_file_uses=mesh_file_uses,
+                            find_skeleton=find_skeleton,
+                            keep_skeleton_templates=keep_skeleton_templates,
+                            fix_textures=fix_textures,
+                            defer_images=preferences.texture_load_mode in {'DEFERRED', 'DECODED', 'PROXY'},
+                        )
+                        completed_steps += 1
+                        context = (yield completed_steps, total_steps) or context
+                finally:
+                    # Also give any placeholder images their files when the import is cancelled or fails.
+                    with profiler.span("textures"):
+                        texture_loader.image_cache.load_deferred_images(
+                            preloader if preferences.texture_load_mode in {'DECODED', 'PROXY'} else None,
+                            proxy_directory,
+                            preferences.proxy_texture_scale,
+                        )
+
+                with profiler.span("cleanup"):
+                    previous_active_object = context.view_layer.objects.active
+
+                    for armature_object, objects in armature_object_map.items():
+                        import_mesh.parent_and_clean_up_meshes(
+                            context,
+                            armature_object,
+                            objects,
+                            cleanup_meshes=cleanup_meshes,
+                        )
+
+                    bpy.ops.object.select_all(action='DESELECT')
+
+                    context.view_layer.objects.active = previous_active_object
+                completed_steps += 1
+                context = (yield completed_steps, total_steps) or context
+
+            for skill_plan in plan.skills:
+                import_skill(
+                    context,
+                    report,
+                    skill_plan,
+                    profiler=profiler,
+                    preloader=preloader,
+                    plan=plan,
+                    keep_skeleton_templates=keep_skeleton_templates,
+                )
+                completed_steps += 1
+                context = (yield completed_steps, total_steps) or context
+    finally:
+        # The parsed files are released once imported, so the properties shared between them are released too.
+        property_list.clear_interned_properties()
 
-        bpy.ops.object.select_all(action='DESELECT')
 
-        context.view_layer.objects.active = previous_active_object
+def import_files(
+    context: bpy.types.Context,
+    report: import_report.ImportReport,
+    profiler: profiling.Profiler,
+    file_paths: list[pathlib.Path],
+    preferred_skin_color: str,
+    *,
+    import_skeletons: bool,
+    import_meshes: bool,
+    import_animations: bool,
+    find_skeleton: bool,
+    keep_skeleton_templates: bool,
+    cleanup_meshes: bool,
+    fix_textures: bool,
+) -> None:
+    """Import all the skeletons, meshes and animations in the selected files."""
+    for _ in iterate_import_files(
+        context,
+        report,
+        profiler,
+        file_paths,
+        preferred_skin_color,
+        import_skeletons=import_skeletons,
+        import_meshes=import_meshes,
+        import_animations=import_animations,
+        find_skeleton=find_skeleton,
+        keep_skeleton_templates=keep_skeleton_templates,
+        cleanup_meshes=cleanup_meshes,
+        fix_textures=fix_textures,
+    ):
+        pass
+
+
+IMPORTED_DATA_COLLECTIONS = (
+    "objects",
+    "meshes",
+    "armatures",
+    "materials",
+    "images",
+    "actions",
+    "collections",
+)
+
+
+def snapshot_data() -> dict[str, set[bpy.types.ID]]:
+    """Record the data blocks that exist before an import."""
+    return {name: set(getattr(bpy.data, name)) for name in IMPORTED_DATA_COLLECTIONS}
+
+
+def find_data_created_since(snapshot: dict[str, set[bpy.types.ID]]) -> set[bpy.types.ID]:
+    """Find the data blocks created since the snapshot was taken."""
+    return {
+        data_block
+        for name, existing in snapshot.items()
+        for data_block in getattr(bpy.data, name)
+        if data_block not in existing
+    }
 
-    if import_animations:
-        animation_file_list = bcf_file_list + [path for path in file_list if path.suffix.lower() == ".cfp"]
 
-        for bcf_file_path, bcf_file in bcf_files:
-            for skill in bcf_file.skills:
-                import_skill(context, logger, bcf_file_path.parent, animation_file_list, skill)
+def remove_data(data_blocks: set[bpy.types.ID]) -> None:
+    """Remove the data blocks that still exist, to undo a cancelled import."""
+    bpy.data.batch_remove(
+        [
+            data_block
+            for name in IMPORTED_DATA_COLLECTIONS
+            for data_block in getattr(bpy.data, name)
+            if data_block in data_blocks
+        ],
+    )
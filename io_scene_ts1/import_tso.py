@@ -1,13 +1,13 @@
 """Import The Sims Online files."""
 
-import logging
 import pathlib
 
 import bpy
 
 from . import import_animation, import_mesh, import_skeleton
-from .ts1_formats import anim, bcf, mesh, property_list, skel
+from .ts1_formats import anim, bcf, mesh, profiling, property_list, skel
 from .ts1_formats.error import FileReadError
+from .ts1_formats.import_report import ImportReport
 
 
 def anim_motion_to_bcf_motion(motion: anim.Motion) -> bcf.Motion:
@@ -31,18 +31,24 @@ def anim_motion_to_bcf_motion(motion: anim.Motion) -> bcf.Motion:
     )
 
 
-def import_animations(file_paths: list[pathlib.Path], context: bpy.types.Context, logger: logging.Logger) -> None:
+def import_animations(
+    file_paths: list[pathlib.Path],
+    context: bpy.types.Context,
+    report: ImportReport,
+    profiler: profiling.Profiler,
+) -> None:
     """Import all the anim files in the list of files."""
     active_object = context.view_layer.objects.active
 
     anim_file_paths = [x for x in file_paths if x.suffix.lower() == ".anim"]
     if anim_file_paths and (active_object is None or active_object.type != 'ARMATURE'):
-        logger.info("Please select an armature to apply the animation to.")
+        report.add("no_armature", "Please select an armature to apply the animation to.")
         return
 
     for file_path in anim_file_paths:
         try:
-            animation = anim.read_file(file_path)
+            with profiler.span("parsing"):
+                animation = anim.read_file(file_path)
 
             skill = bcf.Skill(
                 animation.name,
@@ -59,15 +65,17 @@ def import_animations(file_paths: list[pathlib.Path], context: bpy.types.Context
                 animation.rotations,
             )
 
-            import_animation.import_animation(context, logger, active_object, skill, animation_data)
+            with profiler.span("animations"):
+                import_animation.import_animation(context, report, active_object, skill, animation_data)
 
         except FileReadError as _:  # noqa: PERF203
-            logger.info("Could not import %s.", file_path)
+            report.add("unreadable_files", "Could not import %s.", file_path)
 
 
 def import_files(
     context: bpy.types.Context,
-    logger: logging.Logger,
+    report: ImportReport,
+    profiler: profiling.Profiler,
     file_paths: list[pathlib.Path],
     *,
     cleanup_meshes: bool,
@@ -79,43 +87,54 @@ def import_files(
     if bpy.ops.object.select_all.poll():
         bpy.ops.object.select_all(action='DESELECT')
 
-    for file_path in [x for x in file_paths if x.suffix.lower() == ".skel"]:
-        try:
-            skeleton = skel.read_file(file_path)
-            context.view_layer.objects.active = import_skeleton.import_skeleton(context, skeleton)
-
-        except FileReadError as _:  # noqa: PERF203
-            logger.info(f"Could not import {file_path}")  # noqa: G004
-
-    active_object = context.view_layer.objects.active
-
-    mesh_file_paths = [x for x in file_paths if x.suffix.lower() == ".mesh"]
-    if mesh_file_paths and (active_object is None or active_object.type != 'ARMATURE'):
-        logger.info("Please select an armature to apply the mesh to.")
-        return
-
-    mesh_objects = []
-    for file_path in mesh_file_paths:
-        try:
-            sims_mesh = mesh.read_file(file_path)
-            mesh_object = import_mesh.import_mesh(logger, file_path.stem, active_object, sims_mesh)
-            if mesh_object is None:
-                continue
-            context.collection.objects.link(mesh_object)
-            mesh_objects.append(mesh_object)
-
-        except FileReadError as _:
-            logger.info("Could not import %s.", file_path)
-
-    mesh_objects = [obj for obj in mesh_objects if obj is not None]
-
-    if mesh_objects:
-        previous_active_object = context.view_layer.objects.active
-
-        import_mesh.parent_and_clean_up_meshes(context, active_object, mesh_objects, cleanup_meshes=cleanup_meshes)
-
-        bpy.ops.object.select_all(action='DESELECT')
-
-        context.view_layer.objects.active = previous_active_object
-
-    import_animations(file_paths, context, logger)
+    try:
+        for file_path in [x for x in file_paths if x.suffix.lower() == ".skel"]:
+            try:
+                with profiler.span("parsing"):
+                    skeleton = skel.read_file(file_path)
+                with profiler.span("skeletons"):
+                    context.view_layer.objects.active = import_skeleton.import_skeleton(context, skeleton)
+
+            except FileReadError as _:  # noqa: PERF203
+                report.add("unreadable_files", "Could not import %s", file_path)
+
+        active_object = context.view_layer.objects.active
+
+        mesh_file_paths = [x for x in file_paths if x.suffix.lower() == ".mesh"]
+        if mesh_file_paths and (active_object is None or active_object.type != 'ARMATURE'):
+            report.add("no_armature", "Please select an armature to apply the mesh to.")
+            return
+
+        mesh_objects = []
+        for file_path in mesh_file_paths:
+            try:
+                with profiler.span("parsing"):
+                    sims_mesh = mesh.read_file(file_path)
+                with profiler.span("meshes"):
+                    mesh_object = import_mesh.import_mesh(report, file_path.stem, active_object, sims_mesh)
+                if mesh_object is None:
+                    continue
+                context.collection.objects.link(mesh_object)
+                mesh_objects.append(mesh_object)
+
+            except FileReadError as _:
+                report.add("unreadable_files", "Could not import %s.", file_path)
+
+        mesh_objects = [obj for obj in mesh_objects if obj is not None]
+
+        if mesh_objects:
+            with profiler.span("cleanup"):
+                previous_active_object = context.view_layer.objects.active
+
+                import_mesh.parent_and_clean_up_meshes(
+                    context, active_object, mesh_objects, cleanup_meshes=cleanup_meshes
+                )
+
+                bpy.ops.object.select_all(action='DESELECT')
+
+                context.view_layer.objects.active = previous_active_object
+
+        import_animations(file_paths, context, report, profiler)
+    finally:
+        # The read files are released once imported, so the properties shared between them are released too.
+        property_list.clear_interned_properties()
@@ -1,9 +1,13 @@
 """Utility functions and classes."""
 
 import math
+import pathlib
 
+import bpy
 import mathutils
 
+from .ts1_formats import profiling
+
 BONE_SCALE = 3.0
 BONE_ROTATION_OFFSET = mathutils.Matrix.Rotation(math.radians(-90.0), 4, 'Z')
 BONE_ROTATION_OFFSET_INVERTED = BONE_ROTATION_OFFSET.inverted()
@@ -11,3 +15,33 @@ BONE_ROTATION_OFFSET_INVERTED = BONE_ROTATION_OFFSET.inverted()
 
 class ExportError(Exception):
     """General purpose export error."""
+
+
+def create_profiler(context: bpy.types.Context, name: str) -> profiling.Profiler:
+    """Create a profiler for an import, enabled as set in the addon preferences."""
+    preferences = context.preferences.addons["io_scene_ts1"].preferences
+    return profiling.Profiler(
+        name,
+        enabled=preferences.profile_imports,
+        profile_functions=preferences.profile_functions,
+    )
+
+
+def finish_profiler(context: bpy.types.Context, profiler: profiling.Profiler) -> str | None:
+    """Stop the profiler, write its summary to the profile directory and return the summary as a single line."""
+    profiler.stop()
+    if not profiler.enabled:
+        return None
+
+    preferences = context.preferences.addons["io_scene_ts1"].preferences
+    directory = preferences.profile_directory
+    if directory == "":
+        directory = bpy.utils.user_resource('CONFIG', path="io_scene_ts1/profiles")
+
+    summary = profiler.format_summary()
+    try:
+        file_path = profiler.write_summary(pathlib.Path(directory))
+    except OSError:
+        return summary
+
+    return f"{summary}, written to {file_path}"
@@ -6,9 +6,16 @@ import pytest
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Pytest add option."""
     parser.addoption("--files-directory", action="store")
+    parser.addoption("--benchmark", action="store_true")
 
 
 @pytest.fixture
 def files_directory(request: pytest.FixtureRequest) -> str:
     """Pytest fixture files-directory command line option."""
     return request.config.getoption("--files-directory")
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> bool:
+    """Pytest fixture benchmark command line option."""
+    return request.config.getoption("--benchmark")
@@ -0,0 +1,83 @@
+"""Generate synthetic skin names and texture file lists shaped like the ones in The Sims."""
+
+import random
+from pathlib import Path
+
+from ts1_formats import texture_names
+
+SEXES = ("f", "m", "u")
+ADULT_WEIGHTS = ("skn", "fit", "fat")
+CLOTHES = ("b", "f", "h", "l", "s", "w")
+NPC_NAMES = ("Cop", "Chef", "Maid", "Gardener", "Repo", "Nanny", "Burglar", "Waiter", "Genie", "Photographer")
+JOB_SKIN_NAMES = (
+    "xskin-b001mafit_01-PELVIS-BODY",
+    "xskin-b002mafit_01-PELVIS-BODY",
+    "xskin-b003fafit_01-PELVIS-BODY",
+    "xskin-b004mafit_01-PELVIS-BODY",
+    "xskin-b008fafit_01-PELVIS-BODY",
+    "xskin-b012fafat_01-PELVIS-BODY",
+    "xskin-c_skeleton-HEAD-HEAD",
+    "xskin-nffit_01-PELVIS-MBODY",
+)
+
+
+def generate_skin_name(generator: random.Random, index: int) -> str:
+    """Generate a skin name of one of the texture families, chosen by the index."""
+    sex = generator.choice(SEXES)
+    age = generator.choice(("a", "a", "c"))
+    weight = generator.choice(ADULT_WEIGHTS) if age == "a" else "chd"
+    number = index % 1000
+    name = f"{generator.choice(NPC_NAMES).lower()}{index}"
+
+    match index % 8:
+        case 0:
+            skin_name = f"xskin-c{number:03d}{sex}{age}_{name}-HEAD-HEAD"
+        case 1:
+            skin_name = f"xskin-{generator.choice(CLOTHES)}{number:03d}{sex}{age}{weight}_{name}-PELVIS-BODY"
+        case 2:
+            side = generator.choice(("l", "r"))
+            position = generator.choice((("c", "fist"), ("o", "hand"), ("p", "point")))
+            hand_sex = generator.choice(("f", "m", "c"))
+            skin_name = f"xskin-h{sex}{side}{position[0]}-{side}_hand-{position[1]}{hand_sex}{side}"
+        case 3:
+            skin_name = f"xskin-n{sex}{weight}_01-PELVIS-BODY"
+        case 4:
+            skin_name = f"xskin-c{generator.choice(NPC_NAMES)}{sex}{age}_{index:02d}-HEAD-HEAD"
+        case 5:
+            skin_name = f"xskin-{generator.choice(NPC_NAMES)}{sex}{age}{weight}_{index:02d}-PELVIS-BODY"
+        case 6:
+            skin_name = f"xskin-ct-{name}-{sex}{age}-{index % 100:02d}-PELVIS-BODY"
+        case _:
+            skin_name = JOB_SKIN_NAMES[index // 8 % len(JOB_SKIN_NAMES)]
+
+    return skin_name
+
+
+def generate_skin_names(count: int, seed: int = 0) -> list[str]:
+    """Generate skin names of all the texture families, ages, sexes and weights, including job and npc skins."""
+    generator = random.Random(seed)  # noqa: S311
+    return [generate_skin_name(generator, index) for index in range(count)]
+
+
+def generate_texture_file_list(skin_names: list[str], count: int, seed: int = 0) -> list[Path]:
+    """Generate a list of texture files for the skins in every skin color, padded with unrelated textures."""
+    generator = random.Random(seed)  # noqa: S311
+
+    texture_file_names: list[str] = []
+    for skin_name in skin_names:
+        for skin_color in texture_names.SKIN_COLORS:
+            variants, _ = texture_names.list_texture_variants(skin_name, skin_color, fix_textures=False)
+            if variants:
+                texture_file_names.append(variants[0])
+                texture_file_names.append(f"{variants[-1]}_{generator.randrange(10)}")
+
+    unique_texture_file_names = list(dict.fromkeys(texture_file_names))[:count]
+    while len(unique_texture_file_names) < count:
+        unique_texture_file_names.append(f"x{generator.randrange(1 << 32):08x}_{len(unique_texture_file_names)}")
+
+    generator.shuffle(unique_texture_file_names)
+    directories = ("GameData/Skins", "ExpansionPack/Skins", "Downloads")
+    return [
+        Path(directories[index % len(directories)]) / f"{texture_file_name}.{generator.choice(('bmp', 'tga'))}"
+        for index, texture_file_name in enumerate(unique_texture_file_names)
+    ]
@@ -13,6 +13,8 @@ def roundtrip_anim(file_path: Path) -> None:
     """Test reading, writing and rereading an anim file."""
     input_anim = anim.read_file(file_path)
 
+    assert anim.read_bytes(memoryview(file_path.read_bytes())) == input_anim
+
     byte_stream = io.BytesIO()
     anim.write_anim(byte_stream, input_anim)
 
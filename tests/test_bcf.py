@@ -13,6 +13,8 @@ def roundtrip_bcf(file_path: Path) -> None:
     """Test reading, writing and rereading a bcf file."""
     bcf_file = bcf.read_file(file_path)
 
+    assert bcf.read_bytes(memoryview(file_path.read_bytes())) == bcf_file
+
     byte_stream = io.BytesIO()
     bcf.write_bcf(byte_stream, bcf_file)
 
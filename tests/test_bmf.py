@@ -13,6 +13,8 @@ def roundtrip_bmf(file_path: Path) -> None:
     """Test reading, writing and rereading a bmf file."""
     bmf_file = bmf.read_file(file_path)
 
+    assert bmf.read_bytes(memoryview(file_path.read_bytes())) == bmf_file
+
     byte_stream = io.BytesIO()
     bmf.write_bmf(byte_stream, bmf_file)
 
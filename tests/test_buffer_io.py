@@ -0,0 +1,35 @@
+"""Buffer io tests."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ts1_formats import buffer_io
+
+
+@pytest.mark.skipif(os.name != "posix", reason="File modes are only fully supported on posix")
+def test_atomic_write_new_file_mode(tmp_path: Path) -> None:
+    """Test that an atomic write creates a file with the mode of a newly created file."""
+    umask = os.umask(0o022)
+    try:
+        buffer_io.write_file(tmp_path / "new.bin", b"data", atomic=True)
+    finally:
+        os.umask(umask)
+
+    assert (tmp_path / "new.bin").read_bytes() == b"data"
+    assert (tmp_path / "new.bin").stat().st_mode & 0o7777 == 0o644
+
+
+@pytest.mark.skipif(os.name != "posix", reason="File modes are only fully supported on posix")
+def test_atomic_write_existing_file_mode(tmp_path: Path) -> None:
+    """Test that an atomic write keeps the mode of the file it replaces."""
+    file_path = tmp_path / "existing.bin"
+    file_path.write_bytes(b"old")
+    file_path.chmod(0o640)
+
+    buffer_io.write_file(file_path, b"new", atomic=True)
+
+    assert file_path.read_bytes() == b"new"
+    assert file_path.stat().st_mode & 0o7777 == 0o640
+    assert list(tmp_path.iterdir()) == [file_path]
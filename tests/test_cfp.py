@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from ts1_formats import bcf, cfp, cmx
+from ts1_formats import asset_resolver, bcf, cfp, cmx
 
 KNOWN_MISSING_CFP_FILES = [
     "xskill-k2a-praise-get-toss",
@@ -28,29 +28,28 @@ KNOWN_MISSING_CFP_FILES = [
 ]
 
 
-def read_cfps(cfp_file_list: list[Path], directory: Path, skills: list[bcf.Skill]) -> None:
+def read_cfps(resolver: asset_resolver.AssetResolver, directory: Path, skills: list[bcf.Skill]) -> None:
     """Read all the cfp files in the specified skills."""
     for skill in skills:
         if skill.animation_name in KNOWN_MISSING_CFP_FILES:
             continue
 
-        cfp_file_path = directory / (skill.animation_name + ".cfp")
-        if not cfp_file_path.is_file():
-            cfp_file_path = next(x for x in cfp_file_list if x.stem.lower() == skill.animation_name.lower())
+        cfp_file_path = resolver.resolve(skill.animation_name, ".cfp", directory=directory)
+        assert cfp_file_path is not None
 
         cfp.read_file(cfp_file_path, skill.position_count, skill.rotation_count)
 
 
-def read_bcf(file_path: Path, cfp_file_list: list[Path]) -> None:
+def read_bcf(file_path: Path, resolver: asset_resolver.AssetResolver) -> None:
     """Read a bcf file and all the cfp files in the specified skills."""
     bcf_file = bcf.read_file(file_path)
-    read_cfps(cfp_file_list, file_path.parents[0], bcf_file.skills)
+    read_cfps(resolver, file_path.parents[0], bcf_file.skills)
 
 
-def read_cmx(file_path: Path, cfp_file_list: list[Path]) -> None:
+def read_cmx(file_path: Path, resolver: asset_resolver.AssetResolver) -> None:
     """Read a cmx file and all the cfp files in the specified skills."""
     bcf_file = cmx.read_file(file_path)
-    read_cfps(cfp_file_list, file_path.parents[0], bcf_file.skills)
+    read_cfps(resolver, file_path.parents[0], bcf_file.skills)
 
 
 def test_cfp(files_directory: str | None) -> None:
@@ -58,12 +57,12 @@ def test_cfp(files_directory: str | None) -> None:
     if files_directory is None:
         pytest.skip("No file directory specified")
 
-    cfp_file_list = list(Path(files_directory).rglob("*.cfp"))
+    resolver = asset_resolver.AssetResolver(Path(files_directory).rglob("*.cfp"))
 
     pool = multiprocessing.Pool(None)
 
     bcf_file_list = Path(files_directory).rglob("*.bcf")
-    pool.starmap(read_bcf, zip(bcf_file_list, itertools.repeat(cfp_file_list)))
+    pool.starmap(read_bcf, zip(bcf_file_list, itertools.repeat(resolver)))
 
     cmx_file_list = Path(files_directory).rglob("*.cmx")
-    pool.starmap(read_cmx, zip(cmx_file_list, itertools.repeat(cfp_file_list)))
+    pool.starmap(read_cmx, zip(cmx_file_list, itertools.repeat(resolver)))
@@ -0,0 +1,55 @@
+"""File index tests."""
+
+from pathlib import Path
+
+import pytest
+
+from ts1_formats import file_index
+
+
+def test_file_index(files_directory: str | None, tmp_path: Path) -> None:
+    """Test indexing, caching and reloading the index of the specified directory."""
+    if files_directory is None:
+        pytest.skip("No file directory specified")
+
+    root = Path(files_directory)
+    file_list = sorted(path for path in root.rglob("*") if not path.is_dir())
+
+    index = file_index.load_index(root, tmp_path)
+
+    assert sorted(index.files()) == file_list
+    assert sorted(index.files(".bmf", ".SKN")) == [
+        path for path in file_list if path.suffix.lower() in {".bmf", ".skn"}
+    ]
+    for path in file_list:
+        assert path in index.find(path.stem.upper(), path.suffix)
+
+    cached_index = file_index.load_index(root, tmp_path)
+
+    assert cached_index.directories == index.directories
+    assert not cached_index.refresh()
+
+
+def test_file_index_symbolic_links(tmp_path: Path) -> None:
+    """Test that directory symbolic links are followed, and that links back to indexed directories are not."""
+    root = tmp_path / "root"
+    (root / "Skins").mkdir(parents=True)
+    (root / "Skins" / "B001FAFitLgt_01.bmp").touch()
+    linked_directory = tmp_path / "Downloads"
+    linked_directory.mkdir()
+    (linked_directory / "xskin-b001fafit_01-PELVIS-BODY.skn").touch()
+    try:
+        (root / "Downloads").symlink_to(linked_directory, target_is_directory=True)
+        (root / "Skins" / "Parent").symlink_to(root, target_is_directory=True)
+    except OSError:
+        pytest.skip("Symbolic links are not supported")
+
+    index = file_index.FileIndex(root)
+    index.refresh()
+
+    assert sorted(index.files()) == [
+        root / "Downloads" / "xskin-b001fafit_01-PELVIS-BODY.skn",
+        root / "Skins" / "B001FAFitLgt_01.bmp",
+    ]
+    assert index.find("b001fafitlgt_01", ".BMP") == [root / "Skins" / "B001FAFitLgt_01.bmp"]
+    assert not index.refresh()
@@ -0,0 +1,31 @@
+"""Fixup table tests."""
+
+from pathlib import Path
+
+import pytest
+
+from ts1_formats import bcf, fixups
+
+
+def test_fixups(files_directory: str | None) -> None:
+    """Test that fixing the skins in the bcf files and texture files in the specified directory is idempotent."""
+    if files_directory is None:
+        pytest.skip("No file directory specified")
+
+    fixup_table = fixups.load_fixup_table()
+    assert fixup_table.version == fixups.FIXUPS_VERSION
+    assert fixups.load_fixup_table() is fixup_table
+
+    for file_path in Path(files_directory).rglob("*.bcf"):
+        for suit in bcf.read_file(file_path).suits:
+            for skin in suit.skins:
+                skin_name, default_texture = fixups.fixup_skin_name_and_default_texture(skin.skin_name, "")
+                assert fixups.fixup_skin_name_and_default_texture(skin_name, default_texture) == (
+                    skin_name,
+                    default_texture,
+                )
+
+    for file_path in Path(files_directory).rglob("*"):
+        if file_path.suffix.lower() in {".bmp", ".tga"}:
+            texture_file_name = fixups.fix_texture_file_name(file_path.stem)
+            assert fixups.fix_texture_file_name(texture_file_name) == texture_file_name
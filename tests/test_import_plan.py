@@ -0,0 +1,54 @@
+"""Import plan tests."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ts1_formats import bcf, import_plan, texture_names
+
+
+def test_import_plan(files_directory: str | None) -> None:
+    """Test planning the import of all bcf and cmx files in the specified directory."""
+    if files_directory is None:
+        pytest.skip("No file directory specified")
+
+    file_list = [*Path(files_directory).rglob("*.bcf"), *Path(files_directory).rglob("*.cmx")]
+    if not file_list:
+        pytest.skip("No bcf or cmx files found")
+
+    plan = import_plan.plan_files(file_list, Path(files_directory))
+
+    assert len(plan.bcf_files) == len(file_list)
+    assert len(plan.suits) == sum(len(bcf_file.suits) for _, bcf_file in plan.bcf_files)
+    assert len(plan.skills) == sum(len(bcf_file.skills) for _, bcf_file in plan.bcf_files)
+
+    for suit_plan in plan.suits:
+        for skin_plan in suit_plan.skins:
+            assert (skin_plan.vertex_count is None) == (skin_plan.mesh_file_path is None) or any(
+                missing.kind == "unreadable mesh" and missing.name == skin_plan.skin_name for missing in plan.missing
+            )
+
+    plan_dict = json.loads(json.dumps(plan.to_dict()))
+
+    assert plan_dict["counts"] == plan.counts()
+
+
+def test_count_mesh_file_uses() -> None:
+    """Test counting the skins that use each mesh file."""
+    body = Path("xskin-b001fafit_01-PELVIS-BODY.bmf")
+    head = Path("xskin-c001fa_azalea-HEAD-HEAD.bmf")
+    suits = [
+        import_plan.SuitPlan(
+            Path("suits.bcf"),
+            bcf.Suit(f"suit{index}", 0, 0, []),
+            [
+                import_plan.SkinPlan(body.stem, body, ["adult"], []),
+                import_plan.SkinPlan(head.stem, head if index == 0 else None, ["adult"], []),
+            ],
+        )
+        for index in range(3)
+    ]
+    plan = import_plan.ImportPlan([], [], {}, suits, [], [], texture_names.TextureIndex([], fix_textures=False))
+
+    assert plan.count_mesh_file_uses() == {body: 3, head: 1}
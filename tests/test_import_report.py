@@ -0,0 +1,45 @@
+"""Import report tests."""
+
+from ts1_formats import import_report
+
+
+def test_import_report() -> None:
+    """Test counting problems, keeping only the first sample messages and reporting how many were left out."""
+    report = import_report.ImportReport(sample_count=2)
+    assert not report
+
+    for skin_name in ("xskin-b001", "xskin-b002", "xskin-b003", "xskin-b004"):
+        report.add("missing_meshes", "Could not find mesh %s used by %s.", skin_name, "b001", count=2)
+    report.add("missing_textures", "Could not find texture b001fafitlgt_01.")
+
+    assert report
+    assert report.counts() == {"missing_meshes": 8, "missing_textures": 1}
+    assert report.lines() == [
+        "Could not find mesh xskin-b001 used by b001.",
+        "Could not find mesh xskin-b002 used by b001.",
+        "... and 2 more missing meshes problems.",
+        "Could not find texture b001fafitlgt_01.",
+    ]
+    assert report.format() == "\n".join(report.lines())
+    assert report.to_dict() == {
+        "missing_meshes": {
+            "count": 8,
+            "occurrences": 4,
+            "samples": [
+                "Could not find mesh xskin-b001 used by b001.",
+                "Could not find mesh xskin-b002 used by b001.",
+            ],
+        },
+        "missing_textures": {
+            "count": 1,
+            "occurrences": 1,
+            "samples": ["Could not find texture b001fafitlgt_01."],
+        },
+    }
+
+
+def test_import_report_message_without_arguments() -> None:
+    """Test that messages without arguments are kept as they are, even if they contain percent signs."""
+    report = import_report.ImportReport()
+    report.add("skipped_faces", "Skipped 100% of the faces.")
+    assert report.lines() == ["Skipped 100% of the faces."]
@@ -13,6 +13,8 @@ def roundtrip_mesh(file_path: Path) -> None:
     """Test reading, writing and rereading a mesh file."""
     input_mesh = mesh.read_file(file_path)
 
+    assert mesh.read_bytes(memoryview(file_path.read_bytes())) == input_mesh
+
     byte_stream = io.BytesIO()
     mesh.write_mesh(byte_stream, input_mesh)
 
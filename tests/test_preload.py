@@ -0,0 +1,80 @@
+"""Preloader tests."""
+
+import shutil
+import struct
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import ts1_formats
+from ts1_formats import preload
+
+# Imports the preloader from inside a package whose __init__ imports bpy, like the Blender add-on, with bpy only
+# available in the parent process, and reads a file in a worker process.
+PROCESS_POOL_SCRIPT = """
+import pathlib
+import sys
+import types
+
+if __name__ == "__main__":
+    sys.path.insert(0, sys.argv[1])
+    sys.modules["bpy"] = types.ModuleType("bpy")
+
+    from io_scene_ts1.ts1_formats import preload
+
+    with preload.Preloader('PROCESSES', 1) as preloader:
+        file_path = pathlib.Path(sys.argv[2])
+        preloader.request(file_path)
+        decoded_texture = preloader.result(file_path)
+        assert preloader.executor is not None, "The process pool stopped working"
+        print(decoded_texture.width, decoded_texture.height)
+"""
+
+
+def create_bmp(width: int, height: int) -> bytes:
+    """Create an uncompressed 24 bit BMP file filled with black."""
+    row_size = (width * 3 + 3) & ~3
+    pixel_data = bytes(row_size * height)
+    info_header = struct.pack('<IiiHHIIiiII', 40, width, height, 1, 24, 0, len(pixel_data), 0, 0, 0, 0)
+    file_header = struct.pack('<2sIHHI', b"BM", 54 + len(pixel_data), 0, 0, 54)
+    return file_header + info_header + pixel_data
+
+
+def test_process_pool_in_addon_package(tmp_path: Path) -> None:
+    """Test that process pool workers can read files when the formats package is inside the Blender add-on."""
+    addon_directory = tmp_path / "io_scene_ts1"
+    shutil.copytree(
+        Path(ts1_formats.__file__).parent,
+        addon_directory / "ts1_formats",
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    (addon_directory / "__init__.py").write_text("import bpy\n")
+
+    file_path = tmp_path / "texture.bmp"
+    file_path.write_bytes(create_bmp(3, 2))
+
+    script_path = tmp_path / "process_pool.py"
+    script_path.write_text(textwrap.dedent(PROCESS_POOL_SCRIPT))
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(script_path), str(tmp_path), str(file_path)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["3", "2"]
+
+
+def test_take_releases_result(tmp_path: Path) -> None:
+    """Test that taking a read file releases it from the preloader."""
+    file_path = tmp_path / "texture.bmp"
+    file_path.write_bytes(create_bmp(3, 2))
+
+    with preload.Preloader('THREADS', 1) as preloader:
+        preloader.request(file_path)
+        decoded_texture = preloader.take(file_path)
+        assert (decoded_texture.width, decoded_texture.height) == (3, 2)
+        assert not preloader.futures
@@ -0,0 +1,53 @@
+"""Profiling tests."""
+
+import json
+from pathlib import Path
+
+from ts1_formats import profiling
+
+
+def profiled_function() -> int:
+    """Do some work for the function profile to find."""
+    return sum(range(1000))
+
+
+def test_profiling(tmp_path: Path) -> None:
+    """Test recording spans and a function profile and writing them as a summary."""
+    profiler = profiling.Profiler("test", profile_functions=True)
+    profiler.start()
+    for _ in range(3):
+        with profiler.span("parsing"):
+            profiled_function()
+    with profiler.span("textures"):
+        pass
+    profiler.stop()
+
+    assert {name: span.count for name, span in profiler.spans.items()} == {"parsing": 3, "textures": 1}
+    assert sum(span.duration for span in profiler.spans.values()) <= profiler.duration
+
+    summary = json.loads(profiler.write_summary(tmp_path).read_text(encoding="utf-8"))
+    assert summary["name"] == "test"
+    assert summary["spans"]["parsing"]["count"] == 3
+    assert any("profiled_function" in function["function"] for function in summary["functions"])
+
+
+def test_format_summary() -> None:
+    """Test the single line summary, which only shows the count of spans entered more than once."""
+    profiler = profiling.Profiler("import-ts1")
+    assert profiler.format_summary() == "import-ts1 took 0.00s"
+
+    profiler.duration = 1.5
+    profiler.spans = {"parsing": profiling.Span(0.25, 1), "textures": profiling.Span(1.0, 4)}
+    assert profiler.format_summary() == "import-ts1 took 1.50s: parsing 0.25s, textures 1.00s (4)"
+
+
+def test_disabled_profiler() -> None:
+    """Test that a disabled profiler records nothing."""
+    profiler = profiling.Profiler("disabled", enabled=False)
+    profiler.start()
+    with profiler.span("phase"):
+        pass
+    profiler.stop()
+    assert not profiler.spans
+    assert profiler.duration == 0.0
+    assert profiler.summary()["functions"] == []
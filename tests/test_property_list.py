@@ -0,0 +1,17 @@
+"""Property list tests."""
+
+from ts1_formats import property_list
+
+
+def test_intern_property() -> None:
+    """Test that properties are shared until they are released, and that the number kept is bounded."""
+    prop = property_list.intern_property("xevt", "1")
+    assert property_list.intern_property("xevt", "1") is prop
+    assert property_list.intern_property("xevt", "2") is not prop
+
+    for index in range(property_list.PROPERTY_CACHE_SIZE + 1):
+        property_list.intern_property("name", str(index))
+    assert property_list.intern_property.cache_info().currsize == property_list.PROPERTY_CACHE_SIZE
+
+    property_list.clear_interned_properties()
+    assert property_list.intern_property.cache_info().currsize == 0
@@ -0,0 +1,54 @@
+"""Proxy texture tests."""
+
+import struct
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ts1_formats import proxy_texture, texture
+
+
+def read_png_pixels(file_path: Path) -> np.ndarray:
+    """Read the 8 bit pixels of an unfiltered PNG file, bottom row first, checking the CRC of each chunk."""
+    buffer = file_path.read_bytes()
+    assert buffer[:8] == b"\x89PNG\r\n\x1a\n"
+
+    position = 8
+    chunks: dict[bytes, bytes] = {}
+    while position < len(buffer):
+        (length,) = struct.unpack_from('>I', buffer, position)
+        chunk_type = buffer[position + 4 : position + 8]
+        data = buffer[position + 8 : position + 8 + length]
+        assert struct.unpack_from('>I', buffer, position + 8 + length)[0] == zlib.crc32(chunk_type + data)
+        chunks[chunk_type] = chunks.get(chunk_type, b"") + data
+        position += 12 + length
+
+    width, height, _, color_type = struct.unpack_from('>IIBB', chunks[b"IHDR"])
+    channel_count = 4 if color_type == 6 else 3
+    rows = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape(height, -1)
+    assert (rows[:, 0] == 0).all()
+    return rows[::-1, 1:].reshape(height, width, channel_count)
+
+
+def test_proxy_texture(files_directory: str | None, tmp_path: Path) -> None:
+    """Test creating and caching proxies of all the bmp and tga files in the specified directory."""
+    if files_directory is None:
+        pytest.skip("No file directory specified")
+
+    file_paths = [
+        file_path for file_path in Path(files_directory).rglob("*") if file_path.suffix.lower() in {".bmp", ".tga"}
+    ]
+
+    for file_path in file_paths:
+        assert not proxy_texture.is_proxy_cached(file_path, tmp_path, proxy_texture.PROXY_SCALE)
+        proxy_file_path = proxy_texture.get_proxy(file_path, tmp_path)
+        assert proxy_texture.is_proxy_cached(file_path, tmp_path, proxy_texture.PROXY_SCALE)
+        assert proxy_texture.get_proxy(file_path, tmp_path) == proxy_file_path
+
+        decoded_texture = texture.downscale(texture.read_file(file_path), proxy_texture.PROXY_SCALE)
+        pixels = read_png_pixels(proxy_file_path)
+        assert pixels.shape[:2] == (decoded_texture.height, decoded_texture.width)
+        expected = decoded_texture.pixels[..., : pixels.shape[2]] * 255.0
+        assert np.abs(pixels - expected).max() <= 0.5 + 1e-3
@@ -0,0 +1,95 @@
+"""Skeleton topology tests."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ts1_formats import bcf, skel, skeleton, skeleton_topology
+
+SIN_45 = np.sqrt(0.5)
+
+
+def create_bone(
+    name: str, parent: str, position: tuple[float, float, float], rotation: tuple[float, float, float, float]
+) -> skeleton.Bone:
+    """Create a bone without properties."""
+    return skeleton.Bone(name, parent, [], position, rotation, True, True, False, 0.0, 0.0)  # noqa: FBT003
+
+
+# A root bone rotated a quarter turn about z and a child rotated a quarter turn about x, as x, y, z, w quaternions.
+TWO_BONE_SKELETON = skeleton.Skeleton(
+    "two-bones",
+    [
+        create_bone("ROOT", skeleton_topology.ROOT_PARENT_NAME, (1.0, 2.0, 3.0), (0.0, 0.0, SIN_45, SIN_45)),
+        create_bone("CHILD", "ROOT", (0.0, 1.0, 0.0), (SIN_45, 0.0, 0.0, SIN_45)),
+    ],
+)
+
+# The bind pose matrices the Blender importer creates for the skeleton, with its y and z axis swap undone.
+TWO_BONE_WORLD_MATRICES = [
+    [
+        [0.0, 1.0, 0.0, 1.0],
+        [-1.0, 0.0, 0.0, 2.0],
+        [0.0, 0.0, 1.0, 3.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ],
+    [
+        [0.0, 0.0, 1.0, 2.0],
+        [-1.0, 0.0, 0.0, 2.0],
+        [0.0, -1.0, 0.0, 3.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ],
+]
+
+
+def test_two_bone_skeleton_topology() -> None:
+    """Test the bind pose matrices of a hand built skeleton against the ones the Blender importer creates."""
+    topology = skeleton_topology.create_topology(TWO_BONE_SKELETON)
+
+    assert topology.bone_index_map == {"ROOT": 0, "CHILD": 1}
+    assert topology.parent_indices.tolist() == [skeleton_topology.NO_PARENT, 0]
+    assert topology.depths.tolist() == [0, 1]
+    assert np.allclose(topology.world_matrices, TWO_BONE_WORLD_MATRICES)
+
+
+def check_topology(skele: skeleton.Skeleton) -> None:
+    """Test that the topology of a skeleton is consistent with its bones."""
+    topology = skeleton_topology.create_topology(skele)
+
+    assert topology.bone_names == [bone.name for bone in skele.bones]
+
+    for index, bone in enumerate(skele.bones):
+        parent_index = topology.parent_indices[index]
+        if bone.parent == skeleton_topology.ROOT_PARENT_NAME:
+            assert parent_index == skeleton_topology.NO_PARENT
+            expected_matrix = topology.local_matrices[index]
+        else:
+            assert topology.bone_names[parent_index] == bone.parent
+            assert parent_index < index
+            expected_matrix = topology.world_matrices[parent_index] @ topology.local_matrices[index]
+
+        assert np.allclose(topology.world_matrices[index], expected_matrix)
+
+    rotations = topology.world_matrices[:, :3, :3]
+    identities = np.broadcast_to(np.identity(3), rotations.shape)
+    assert np.allclose(rotations @ rotations.transpose(0, 2, 1), identities, atol=1e-5)
+
+
+def test_bcf_skeleton_topology(files_directory: str | None) -> None:
+    """Test the topology of all skeletons in the bcf files in the specified directory."""
+    if files_directory is None:
+        pytest.skip("No file directory specified")
+
+    for file_path in Path(files_directory).rglob("*.bcf"):
+        for skele in bcf.read_file(file_path).skeletons:
+            check_topology(skele)
+
+
+def test_skel_skeleton_topology(files_directory: str | None) -> None:
+    """Test the topology of all skel files in the specified directory."""
+    if files_directory is None:
+        pytest.skip("No file directory specified")
+
+    for file_path in Path(files_directory).rglob("*.skel"):
+        check_topology(skel.read_file(file_path))
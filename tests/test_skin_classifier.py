@@ -0,0 +1,80 @@
+"""Skin classifier tests."""
+
+import pytest
+
+from ts1_formats import skin_classifier
+
+# Skin names and the skeleton names and texture family they were classified with before the rules were compiled.
+SKIN_CLASSES = [
+    ("xskin-c001fa_azalea-HEAD-HEAD", ("adult",), "head"),
+    ("xskin-c003mc_dudley-HEAD-HEAD", ("child",), "head"),
+    ("xskin-b001fafit_01-PELVIS-BODY", ("adult",), "body"),
+    ("xskin-b012fafat_01-PELVIS-BODY", ("adult",), "body"),
+    ("xskin-b004mafit_01-PELVIS-BODY", ("adult",), "body"),
+    ("xskin-s004mcchd_bowtie-PELVIS-BODY", ("child",), "body"),
+    ("xskin-hfrc-r_hand-fistfr", ("adult", "child"), "hand"),
+    ("xskin-hmlo-l_hand-handml", ("adult", "child"), "hand"),
+    ("xskin-nffit_01-PELVIS-BODY", ("adult", "child"), "nude_body"),
+    ("xskin-nmchd_01-PELVIS-BODY", ("child",), "nude_body"),
+    ("xskin-cCopma_01-HEAD-HEAD", ("adult",), "head"),
+    ("xskin-cMaidf_01-HEAD-HEAD", ("adult", "child"), "npc_head"),
+    ("xskin-cChefmfat_01-HEAD-HEAD", ("adult", "child"), "npc_head"),
+    ("xskin-cGeniemafit_01-HEAD-HEAD", ("adult",), "age_weight_npc_head"),
+    ("xskin-cNannycchd_01-HEAD-HEAD", ("adult", "child"), None),
+    ("xskin-Copmafit_01-PELVIS-BODY", ("adult",), "npc_body"),
+    ("xskin-Burglarmskn_01-PELVIS-BODY", ("adult",), "npc_body"),
+    ("xskin-Kidmcchd_01-PELVIS-BODY", ("child",), "npc_body"),
+    ("xskin-bPetTrainer_01-PELVIS-BODY", ("adult",), "unleashed_npc_body"),
+    ("xskin-ct-bunny-fa-01-PELVIS-BODY", ("adult",), "costume_body"),
+    ("xskin-ct-elf-mc-01-PELVIS-BODY", ("child",), "costume_body"),
+    ("xskin-b001cat_tabby-PELVIS-BODY", ("kat",), None),
+    ("xskin-b002kat_siamese-PELVIS-BODY", ("kat",), None),
+    ("xskin-b001dog_lab-PELVIS-DOGBODY", ("dog",), None),
+    ("xskin-skunk-PELVIS-DOGBODY", ("dog",), None),
+    ("xskin-b001dragon_red-PELVIS-BODY", ("kat",), None),
+    ("xskin-effects1-fire-EFFECTS", ("effects1",), None),
+    ("xskin-cathat-CAT-HAT", ("kat",), None),
+    ("xskin-dogcollar-DOG-COLLAR", ("dog",), None),
+    ("xskin-SpellboundMAFat_Gnome-PELVIS-GNOMEBODY", ("kat",), None),
+    ("xskin-spellboundmafat_gnome-PELVIS-GNOMEBODY", ("adult",), None),
+    ("xskin-c_skeleton-HEAD-HEAD", ("adult", "child"), None),
+    ("xskin-unknownthing", ("adult", "child"), None),
+]
+
+
+@pytest.mark.parametrize(("skin_name", "skeleton_names", "texture_family"), SKIN_CLASSES)
+def test_classify_skin(skin_name: str, skeleton_names: tuple[str, ...], texture_family: str | None) -> None:
+    """Test classifying skin names of every kind of skin."""
+    skin_class = skin_classifier.classify_skin(skin_name)
+    assert skin_class.skeleton_names == skeleton_names
+    assert skin_class.texture_family == texture_family
+    assert skin_classifier.classify_skin(skin_name) is skin_class
+
+
+def test_classify_skin_details() -> None:
+    """Test reading the sex, age and body type codes from skin names."""
+    body = skin_classifier.classify_skin("xskin-b012fafat_01-PELVIS-BODY")
+    assert (body.category, body.sex, body.age, body.body_type) == ("adult_body", "f", "a", "fat")
+
+    npc_body = skin_classifier.classify_skin("xskin-Kidmcchd_01-PELVIS-BODY")
+    assert (npc_body.category, npc_body.sex, npc_body.age, npc_body.body_type) == ("child_npc_body", "m", "c", "chd")
+
+    hand = skin_classifier.classify_skin("xskin-hmlo-l_hand-handml")
+    assert (hand.category, hand.sex, hand.age, hand.body_type) == (None, "m", None, None)
+
+
+@pytest.mark.parametrize(
+    ("skill_name", "skeleton_names"),
+    [
+        ("a2o-standing-loop", ("adult",)),
+        ("c2o-dance", ("child",)),
+        ("k2o-sleep", ("kat",)),
+        ("d2o-bark", ("dog",)),
+        ("f2o-fly", ("kat",)),
+        ("effects-fire", ("effects1",)),
+        ("x2o-unknown", None),
+    ],
+)
+def test_classify_skill(skill_name: str, skeleton_names: tuple[str, ...] | None) -> None:
+    """Test finding the skeletons a skill can be applied to from its name prefix."""
+    assert skin_classifier.classify_skill(skill_name) == skeleton_names
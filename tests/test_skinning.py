@@ -0,0 +1,100 @@
+"""Skinning tests."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ts1_formats import bcf, bmf, mesh, skeleton_topology, skinning
+
+from .test_skeleton_topology import TWO_BONE_SKELETON, TWO_BONE_WORLD_MATRICES
+
+# A mesh with a vertex bound to each bone of the two bone skeleton, listing the bones in a different order.
+TWO_BONE_MESH = bmf.Mesh(
+    ["CHILD", "ROOT"],
+    [],
+    [bmf.BoneBinding(0, 0, 1, 0, 0), bmf.BoneBinding(1, 1, 1, 0, 0)],
+    [(0.0, 0.0), (0.0, 0.0)],
+    [],
+    [bmf.Vertex((1.0, 0.0, 0.0), (0.0, 1.0, 0.0)), bmf.Vertex((0.0, 0.0, 1.0), (1.0, 0.0, 0.0))],
+    [],
+)
+
+
+def test_two_bone_skinning() -> None:
+    """Test skinning a hand built mesh to the bind pose matrices the Blender importer creates for its skeleton."""
+    topology = skeleton_topology.create_topology(TWO_BONE_SKELETON)
+    binding_matrices = skinning.resolve_binding_matrices(topology, TWO_BONE_MESH)
+    assert np.allclose(binding_matrices, [TWO_BONE_WORLD_MATRICES[1], TWO_BONE_WORLD_MATRICES[0]])
+
+    skinned_mesh = skinning.skin_mesh(TWO_BONE_MESH, binding_matrices)
+    assert np.allclose(skinned_mesh.positions, [[2.0, 1.0, 3.0], [1.0, 2.0, 4.0]])
+    assert np.allclose(skinned_mesh.normals, [[0.0, 0.0, -1.0], [0.0, -1.0, 0.0]])
+    assert skinned_mesh.vertex_bindings.tolist() == [0, 1]
+
+
+def skin_vertices(sims_mesh: bmf.Mesh, binding_matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Skin the vertex positions and normals of a mesh one vertex at a time."""
+    positions = []
+    normals = []
+    for binding_index, bone_binding in enumerate(sims_mesh.bone_bindings):
+        matrix = binding_matrices[binding_index]
+        rotation = matrix[:3, :3] / np.linalg.norm(matrix[:3, :3], axis=0)
+        vertex_end = bone_binding.vertex_index + bone_binding.vertex_count
+        for vertex in sims_mesh.vertices[bone_binding.vertex_index : vertex_end]:
+            positions.append(matrix[:3, :3] @ vertex.position + matrix[:3, 3])
+            normals.append(rotation @ vertex.normal)
+
+    for binding_index, bone_binding in enumerate(sims_mesh.bone_bindings):
+        matrix = binding_matrices[binding_index]
+        blend_start = bone_binding.blended_vertex_index
+        for blend_index in range(blend_start, blend_start + bone_binding.blended_vertex_count):
+            blend = sims_mesh.blends[blend_index]
+            weight = blend.weight * skinning.BLEND_WEIGHT_SCALE
+            target = matrix[:3, :3] @ sims_mesh.blend_vertices[blend_index].position + matrix[:3, 3]
+            positions[blend.vertex_index] = positions[blend.vertex_index] * (1 - weight) + target * weight
+
+    return np.array(positions).reshape(-1, 3), np.array(normals).reshape(-1, 3)
+
+
+def check_skinning(sims_mesh: bmf.Mesh, topologies: list[skeleton_topology.SkeletonTopology]) -> None:
+    """Test skinning a mesh to the first skeleton with all its bones, or to identity matrices if there is none."""
+    binding_matrices = np.broadcast_to(np.identity(4), (len(sims_mesh.bone_bindings), 4, 4))
+    for topology in topologies:
+        if all(bone_name in topology.bone_index_map for bone_name in sims_mesh.bones):
+            binding_matrices = skinning.resolve_binding_matrices(topology, sims_mesh)
+            break
+
+    vertex_bindings = skinning.resolve_vertex_bindings(sims_mesh)
+    for vertex_index, binding_index in enumerate(vertex_bindings.tolist()):
+        owners = [
+            index
+            for index, bone_binding in enumerate(sims_mesh.bone_bindings)
+            if bone_binding.vertex_index <= vertex_index < bone_binding.vertex_index + bone_binding.vertex_count
+        ]
+        assert binding_index == (owners[-1] if owners else skinning.UNBOUND)
+
+    skinned_mesh = skinning.skin_mesh(sims_mesh, binding_matrices)
+    positions, normals = skin_vertices(sims_mesh, binding_matrices)
+    assert np.allclose(skinned_mesh.positions, positions)
+    assert np.allclose(skinned_mesh.normals, normals)
+    assert np.allclose(skinned_mesh.blends.original_weights + skinned_mesh.blends.weights, 1.0)
+    assert (skinned_mesh.blends.original_bindings == vertex_bindings[skinned_mesh.blends.vertex_indices]).all()
+
+
+def test_skinning(files_directory: str | None) -> None:
+    """Test skinning all the bmf and mesh files in the specified directory to the skeletons in the bcf files."""
+    if files_directory is None:
+        pytest.skip("No file directory specified")
+
+    topologies = [
+        skeleton_topology.create_topology(skele)
+        for file_path in Path(files_directory).rglob("*.bcf")
+        for skele in bcf.read_file(file_path).skeletons
+    ]
+
+    for file_path in Path(files_directory).rglob("*.bmf"):
+        check_skinning(bmf.read_file(file_path).mesh, topologies)
+
+    for file_path in Path(files_directory).rglob("*.mesh"):
+        check_skinning(mesh.read_file(file_path), topologies)
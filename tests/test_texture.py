@@ -0,0 +1,185 @@
+"""Texture tests."""
+
+import struct
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ts1_formats import preload, texture
+from ts1_formats.error import FileReadError
+
+
+def read_size(file_path: Path) -> tuple[int, int]:
+    """Read the width and height from the header of a BMP or TGA file."""
+    buffer = file_path.read_bytes()
+    if buffer[:2] == b"BM":
+        if struct.unpack_from('<I', buffer, 14)[0] == 12:
+            width, height = struct.unpack_from('<hh', buffer, 18)
+        else:
+            width, height = struct.unpack_from('<ii', buffer, 18)
+        return width, abs(height)
+    return struct.unpack_from('<HH', buffer, 12)
+
+
+def create_bmp(
+    width: int,
+    height: int,
+    bits_per_pixel: int,
+    pixel_data: bytes,
+    *,
+    palette: bytes = b"",
+    compression: int = 0,
+) -> bytes:
+    """Create a BMP file with a Windows info header."""
+    pixel_offset = 54 + len(palette)
+    file_header = struct.pack('<2sIHHI', b"BM", pixel_offset + len(pixel_data), 0, 0, pixel_offset)
+    info_header = struct.pack(
+        '<IiiHHIIiiII',
+        40,
+        width,
+        height,
+        1,
+        bits_per_pixel,
+        compression,
+        len(pixel_data),
+        0,
+        0,
+        len(palette) // 4,
+        0,
+    )
+    return file_header + info_header + palette + pixel_data
+
+
+def create_tga(
+    image_type: int, width: int, height: int, bits_per_pixel: int, data: bytes, *, descriptor: int = 0
+) -> bytes:
+    """Create a TGA file without a colormap."""
+    header = struct.pack('<BBBHHBHHHHBB', 0, 0, image_type, 0, 0, 0, 0, 0, width, height, bits_per_pixel, descriptor)
+    return header + data
+
+
+def to_rgba(decoded_texture: texture.Texture) -> list:
+    """Convert the pixels of a texture to 8 bit RGBA rows, bottom row first."""
+    return np.rint(decoded_texture.pixels * 255).astype(np.uint8).tolist()
+
+
+# Blue, green, red, reserved palette entries for black, red, green and blue.
+PALETTE = bytes((0, 0, 0, 0, 0, 0, 255, 0, 0, 255, 0, 0, 255, 0, 0, 0))
+BLACK = [0, 0, 0, 255]
+RED = [255, 0, 0, 255]
+GREEN = [0, 255, 0, 255]
+BLUE = [0, 0, 255, 255]
+
+
+def test_bmp_8_bit_palette() -> None:
+    """Test reading an uncompressed 8 bit paletted bmp, with padded rows stored bottom row first."""
+    pixel_data = bytes((1, 2, 0, 0, 3, 0, 0, 0))
+    decoded_texture = texture.read_bytes(create_bmp(2, 2, 8, pixel_data, palette=PALETTE))
+
+    assert (decoded_texture.width, decoded_texture.height, decoded_texture.has_alpha) == (2, 2, False)
+    assert to_rgba(decoded_texture) == [[RED, GREEN], [BLUE, BLACK]]
+
+
+@pytest.mark.parametrize("top_down", [False, True])
+def test_bmp_24_bit(*, top_down: bool) -> None:
+    """Test reading an uncompressed 24 bit bmp, stored bottom row first or top row first."""
+    pixel_data = bytes((1, 2, 3, 4, 5, 6, 0, 0, 7, 8, 9, 10, 11, 12, 0, 0))
+    decoded_texture = texture.read_bytes(create_bmp(2, -2 if top_down else 2, 24, pixel_data))
+
+    first_row = [[3, 2, 1, 255], [6, 5, 4, 255]]
+    second_row = [[9, 8, 7, 255], [12, 11, 10, 255]]
+    assert (decoded_texture.width, decoded_texture.height, decoded_texture.has_alpha) == (2, 2, False)
+    assert to_rgba(decoded_texture) == ([second_row, first_row] if top_down else [first_row, second_row])
+
+
+def test_bmp_rle8() -> None:
+    """Test reading an RLE8 compressed bmp, with encoded and absolute runs."""
+    pixel_data = bytes(
+        (
+            *(3, 1, 1, 2, 0, 0),  # Three red pixels, one green pixel and the end of the row.
+            *(0, 3, 2, 1, 0, 0, 1, 3),  # Absolute run of three pixels, padded to a word, and one blue pixel.
+            *(0, 1),  # The end of the bitmap.
+        ),
+    )
+    decoded_texture = texture.read_bytes(create_bmp(4, 2, 8, pixel_data, palette=PALETTE, compression=1))
+
+    assert (decoded_texture.width, decoded_texture.height) == (4, 2)
+    assert to_rgba(decoded_texture) == [[RED, RED, RED, GREEN], [GREEN, RED, BLACK, BLUE]]
+
+
+def test_bmp_rle8_overflow() -> None:
+    """Test that runs past the end of a row are clipped to the row in an RLE8 compressed bmp."""
+    pixel_data = bytes(
+        (
+            *(3, 1, 3, 2, 5, 3),  # Runs of three red, three green and five blue pixels in a row of four.
+            *(0, 3, 1, 2, 3, 0),  # Absolute run starting after the end of the row.
+            *(0, 0, 0, 1),  # The end of the row and the end of the bitmap.
+        ),
+    )
+    decoded_texture = texture.read_bytes(create_bmp(4, 2, 8, pixel_data, palette=PALETTE, compression=1))
+
+    assert to_rgba(decoded_texture) == [[RED, RED, RED, GREEN], [BLACK, BLACK, BLACK, BLACK]]
+
+
+def test_bmp_rle8_truncated() -> None:
+    """Test that an RLE8 compressed bmp ending in the middle of an absolute run can't be read."""
+    pixel_data = bytes((0, 5, 1, 2))
+    with pytest.raises(FileReadError):
+        texture.read_bytes(create_bmp(8, 1, 8, pixel_data, palette=PALETTE, compression=1))
+
+
+def test_tga_rle() -> None:
+    """Test reading an RLE compressed 24 bit tga, with run length and raw packets, stored bottom row first."""
+    data = bytes(
+        (
+            *(0x81, 0, 0, 255),  # Two red pixels.
+            *(0x00, 255, 0, 0),  # One blue pixel.
+            *(0x02, 0, 255, 0, 1, 2, 3, 4, 5, 6),  # Three raw pixels.
+        ),
+    )
+    decoded_texture = texture.read_bytes(create_tga(10, 3, 2, 24, data))
+
+    assert (decoded_texture.width, decoded_texture.height, decoded_texture.has_alpha) == (3, 2, False)
+    assert to_rgba(decoded_texture) == [[RED, RED, BLUE], [GREEN, [3, 2, 1, 255], [6, 5, 4, 255]]]
+
+
+def test_tga_top_origin() -> None:
+    """Test reading an uncompressed 32 bit tga with alpha, stored top row first."""
+    data = bytes(
+        (
+            *(0, 0, 255, 128, 0, 255, 0, 255),
+            *(255, 0, 0, 0, 10, 20, 30, 64),
+        ),
+    )
+    decoded_texture = texture.read_bytes(create_tga(2, 2, 2, 32, data, descriptor=0x28))
+
+    assert (decoded_texture.width, decoded_texture.height, decoded_texture.has_alpha) == (2, 2, True)
+    assert to_rgba(decoded_texture) == [[[0, 0, 255, 0], [30, 20, 10, 64]], [[255, 0, 0, 128], GREEN]]
+
+
+def test_texture(files_directory: str | None) -> None:
+    """Test reading all the bmp and tga files in the specified directory."""
+    if files_directory is None:
+        pytest.skip("No file directory specified")
+
+    file_paths = [
+        file_path for file_path in Path(files_directory).rglob("*") if file_path.suffix.lower() in {".bmp", ".tga"}
+    ]
+
+    with preload.Preloader() as preloader:
+        for file_path in file_paths:
+            preloader.request(file_path)
+
+        for file_path in file_paths:
+            decoded_texture = preloader.result(file_path)
+            width, height = read_size(file_path)
+            assert (decoded_texture.width, decoded_texture.height) == (width, height)
+            assert decoded_texture.pixels.shape == (height, width, 4)
+            assert decoded_texture.pixels.dtype == np.float32
+            assert decoded_texture.pixels.min() >= 0.0
+            assert decoded_texture.pixels.max() <= 1.0
+            if not decoded_texture.has_alpha:
+                assert (decoded_texture.pixels[..., 3] == 1.0).all()
+
+            assert (texture.read_file(file_path).pixels == decoded_texture.pixels).all()
@@ -0,0 +1,52 @@
+"""Texture discovery benchmark."""
+
+import time
+
+import pytest
+
+from ts1_formats import texture_names
+
+from . import synthetic_textures
+
+SKIN_COUNT = 1000
+TEXTURE_FILE_COUNTS = (1_000, 10_000, 100_000)
+
+# How many times slower a lookup may get as the texture file count grows 100 times, a linear scan would be ~100.
+MAX_SLOWDOWN = 10.0
+
+
+def time_lookups(texture_index: texture_names.TextureIndex, skin_names: list[str]) -> float:
+    """Return the fastest of several timings of finding the texture files of every skin, in seconds per lookup."""
+    timings = []
+    for _ in range(3):
+        texture_names.list_texture_variants.cache_clear()
+        start = time.perf_counter()
+        for skin_name in skin_names:
+            texture_names.find_texture_files(texture_index, skin_name, "", "med", fix_textures=True)
+        timings.append((time.perf_counter() - start) / len(skin_names))
+    return min(timings)
+
+
+def test_texture_benchmark(benchmark: bool) -> None:  # noqa: FBT001
+    """Benchmark finding the texture files of synthetic skins among 1k to 100k synthetic texture files."""
+    if not benchmark:
+        pytest.skip("Benchmarks not enabled")
+
+    skin_names = synthetic_textures.generate_skin_names(SKIN_COUNT)
+
+    lookup_times = []
+    for texture_file_count in TEXTURE_FILE_COUNTS:
+        texture_file_list = synthetic_textures.generate_texture_file_list(skin_names, texture_file_count)
+
+        start = time.perf_counter()
+        texture_index = texture_names.TextureIndex(texture_file_list, fix_textures=True)
+        index_time = time.perf_counter() - start
+
+        lookup_time = time_lookups(texture_index, skin_names)
+        lookup_times.append(lookup_time)
+        print(  # noqa: T201
+            f"{texture_file_count} texture files: indexed in {index_time * 1000:.1f}ms, "
+            f"{1 / lookup_time:.0f} lookups per second",
+        )
+
+    assert lookup_times[-1] / lookup_times[0] < MAX_SLOWDOWN
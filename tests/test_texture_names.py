@@ -0,0 +1,68 @@
+"""Texture name tests."""
+
+from pathlib import Path
+
+import pytest
+
+from ts1_formats import bcf, fixups, texture_names
+
+
+def test_texture_index(files_directory: str | None) -> None:
+    """Test exact and prefix queries of an index of the texture files in the specified directory."""
+    if files_directory is None:
+        pytest.skip("No file directory specified")
+
+    texture_file_list = sorted(
+        file_path for file_path in Path(files_directory).rglob("*") if file_path.suffix.lower() in {".bmp", ".tga"}
+    )
+
+    for fix_textures in (True, False):
+        texture_index = texture_names.TextureIndex(texture_file_list, fix_textures=fix_textures)
+        assert len(texture_index) == len(texture_file_list)
+
+        def name(file_path: Path, *, fix_textures: bool = fix_textures) -> str:
+            stem = fixups.fix_texture_file_name(file_path.stem) if fix_textures else file_path.stem
+            return stem.lower()
+
+        for file_path in texture_file_list:
+            query = file_path.stem.upper()
+            exact = [entry.file_path for entry in texture_index.exact(query)]
+            assert exact == [other for other in texture_file_list if name(other) == query.lower()]
+
+            prefix = query[: max(1, len(query) // 2)]
+            matches = {entry.file_path for entry in texture_index.prefix(prefix)}
+            assert matches == {other for other in texture_file_list if name(other).startswith(prefix.lower())}
+
+        prefixes = [file_path.stem[:3] for file_path in reversed(texture_file_list)]
+        matched = [entry.file_path for entry in texture_index.match_prefixes(prefixes)]
+        expected = sorted(
+            (other for other in texture_file_list if any(name(other).startswith(p.lower()) for p in prefixes)),
+            key=lambda other: (
+                next(i for i, p in enumerate(prefixes) if name(other).startswith(p.lower())),
+                texture_file_list.index(other),
+            ),
+        )
+        assert matched == expected
+
+
+def test_list_texture_variants(files_directory: str | None) -> None:
+    """Test listing the texture variants of every skin in the bcf files in the specified directory."""
+    if files_directory is None:
+        pytest.skip("No file directory specified")
+
+    for file_path in Path(files_directory).rglob("*.bcf"):
+        for suit in bcf.read_file(file_path).suits:
+            for skin in suit.skins:
+                for fix_textures in (True, False):
+                    for skin_color in texture_names.SKIN_COLORS:
+                        texture_file_names, find_secondary_textures = texture_names.list_texture_variants(
+                            skin.skin_name,
+                            skin_color,
+                            fix_textures=fix_textures,
+                        )
+                        assert all(name == name.lower() for name in texture_file_names)
+                        assert texture_names.list_texture_variants(
+                            skin.skin_name,
+                            skin_color,
+                            fix_textures=fix_textures,
+                        ) == (texture_file_names, find_secondary_textures)
@@ -5,7 +5,9 @@ import pathlib
 import struct
 import typing
 
-from . import pascal_string, property_list
+import numpy as np
+
+from . import buffer_io, pascal_string, property_list
 from .error import FileReadError
 
 
@@ -29,12 +31,21 @@ def read_time_properties(stream: typing.BinaryIO) -> list[TimeProperty]:
     ]
 
 
-def write_time_properties(stream: typing.BinaryIO, time_properties: list[TimeProperty]) -> None:
-    """Write time properties to a stream."""
-    stream.write(struct.pack('>I', len(time_properties)))
+def time_properties_size(time_properties: list[TimeProperty]) -> int:
+    """Return the size in bytes of packed time properties."""
+    return 4 + sum(
+        4 + property_list.property_lists_size(time_property.property_lists) for time_property in time_properties
+    )
+
+
+def pack_time_properties(buffer: bytearray, offset: int, time_properties: list[TimeProperty]) -> int:
+    """Pack time properties in to a buffer at the offset and return the offset after them."""
+    struct.pack_into('>I', buffer, offset, len(time_properties))
+    offset += 4
     for time_property in time_properties:
-        stream.write(struct.pack('>I', time_property.time))
-        property_list.write_property_lists(stream, time_property.property_lists, '>')
+        struct.pack_into('>I', buffer, offset, time_property.time)
+        offset = property_list.pack_property_lists(buffer, offset + 4, time_property.property_lists, '>')
+    return offset
 
 
 @dataclasses.dataclass
@@ -55,11 +66,20 @@ def read_time_property_lists(stream: typing.BinaryIO) -> list[TimePropertyList]:
     ]
 
 
-def write_time_property_lists(stream: typing.BinaryIO, time_property_lists: list[TimePropertyList]) -> None:
-    """Write time property lists to a stream."""
-    stream.write(struct.pack('>I', len(time_property_lists)))
+def time_property_lists_size(time_property_lists: list[TimePropertyList]) -> int:
+    """Return the size in bytes of packed time property lists."""
+    return 4 + sum(
+        time_properties_size(time_property_list.time_properties) for time_property_list in time_property_lists
+    )
+
+
+def pack_time_property_lists(buffer: bytearray, offset: int, time_property_lists: list[TimePropertyList]) -> int:
+    """Pack time property lists in to a buffer at the offset and return the offset after them."""
+    struct.pack_into('>I', buffer, offset, len(time_property_lists))
+    offset += 4
     for time_property_list in time_property_lists:
-        write_time_properties(stream, time_property_list.time_properties)
+        offset = pack_time_properties(buffer, offset, time_property_list.time_properties)
+    return offset
 
 
 @dataclasses.dataclass
@@ -108,48 +128,117 @@ def read_motion(stream: typing.BinaryIO) -> Motion:
     )
 
 
-def write_motion(stream: typing.BinaryIO, motion: Motion) -> None:
-    """Write a motion to a stream."""
-    stream.write(struct.pack('>I', 1))
-    pascal_string.write_string(stream, motion.bone_name)
-    stream.write(struct.pack('>I', motion.frame_count))
-    stream.write(struct.pack('<f', motion.duration))
-    stream.write(struct.pack('B', motion.uses_positions))
-    stream.write(struct.pack('B', motion.uses_rotations))
-    stream.write(struct.pack('>i', motion.position_offset))
-    stream.write(struct.pack('>i', motion.rotation_offset))
-
-    stream.write(struct.pack('B', len(motion.property_lists) != 0))
+def motion_size(motion: Motion) -> int:
+    """Return the size in bytes of a packed motion."""
+    size = 4 + pascal_string.string_size(motion.bone_name) + 4 + 4 + 1 + 1 + 4 + 4 + 1 + 1
+    if len(motion.property_lists):
+        size += property_list.property_lists_size(motion.property_lists)
+    if len(motion.time_property_lists):
+        size += time_property_lists_size(motion.time_property_lists)
+    return size
+
+
+def pack_motion(buffer: bytearray, offset: int, motion: Motion) -> int:
+    """Pack a motion in to a buffer at the offset and return the offset after it."""
+    struct.pack_into('>I', buffer, offset, 1)
+    offset = pascal_string.pack_string(buffer, offset + 4, motion.bone_name)
+    struct.pack_into('>I', buffer, offset, motion.frame_count)
+    struct.pack_into('<f', buffer, offset + 4, motion.duration)
+    struct.pack_into('BB', buffer, offset + 8, motion.uses_positions, motion.uses_rotations)
+    struct.pack_into('>ii', buffer, offset + 10, motion.position_offset, motion.rotation_offset)
+    offset += 18
+
+    struct.pack_into('B', buffer, offset, len(motion.property_lists) != 0)
+    offset += 1
     if len(motion.property_lists):
-        property_list.write_property_lists(stream, motion.property_lists, '>')
+        offset = property_list.pack_property_lists(buffer, offset, motion.property_lists, '>')
 
-    stream.write(struct.pack('B', len(motion.time_property_lists) != 0))
+    struct.pack_into('B', buffer, offset, len(motion.time_property_lists) != 0)
+    offset += 1
     if len(motion.time_property_lists):
-        write_time_property_lists(stream, motion.time_property_lists)
+        offset = pack_time_property_lists(buffer, offset, motion.time_property_lists)
+
+    return offset
+
 
+FLOAT_DTYPE = np.dtype('<f4')
 
-def write_translation(stream: typing.BinaryIO, translation: tuple[float, float, float]) -> None:
-    """Write a translation to a stream."""
-    stream.write(struct.pack('<3f', *translation))
 
+def read_vectors(stream: typing.BinaryIO, component_count: int) -> np.ndarray:
+    """Read a count prefixed block of float vectors from a stream as an Nx(component_count) array."""
+    count = struct.unpack('>I', stream.read(4))[0]
+    size = count * component_count * FLOAT_DTYPE.itemsize
+    data = stream.read(size)
+    if len(data) != size:
+        raise FileReadError
+    return np.frombuffer(data, dtype=FLOAT_DTYPE).reshape(count, component_count)
 
-def write_rotation(stream: typing.BinaryIO, rotation: tuple[float, float, float, float]) -> None:
-    """Write a rotation to a stream."""
-    stream.write(struct.pack('<4f', *rotation))
 
+def vectors_size(vectors: np.ndarray) -> int:
+    """Return the size in bytes of a packed block of float vectors."""
+    return 4 + np.size(vectors) * FLOAT_DTYPE.itemsize
 
-@dataclasses.dataclass
+
+def pack_vectors(buffer: bytearray, offset: int, vectors: np.ndarray, component_count: int) -> int:
+    """Pack a count prefixed block of float vectors in to a buffer at the offset and return the offset after it."""
+    vectors = np.reshape(vectors, (-1, component_count))
+    struct.pack_into('>I', buffer, offset, len(vectors))
+    offset += 4
+    np.frombuffer(buffer, dtype=FLOAT_DTYPE, count=vectors.size, offset=offset).reshape(vectors.shape)[:] = vectors
+    return offset + vectors.size * FLOAT_DTYPE.itemsize
+
+
+def read_translations(stream: typing.BinaryIO) -> np.ndarray:
+    """Read translations from a stream as an Nx3 array."""
+    return read_vectors(stream, 3)
+
+
+def pack_translations(buffer: bytearray, offset: int, translations: np.ndarray) -> int:
+    """Pack an Nx3 array of translations in to a buffer at the offset and return the offset after it."""
+    return pack_vectors(buffer, offset, translations, 3)
+
+
+def read_rotations(stream: typing.BinaryIO) -> np.ndarray:
+    """Read rotations from a stream as an Nx4 array of x, y, z, w quaternions."""
+    return read_vectors(stream, 4)
+
+
+def pack_rotations(buffer: bytearray, offset: int, rotations: np.ndarray) -> int:
+    """Pack an Nx4 array of x, y, z, w quaternions in to a buffer at the offset and return the offset after it."""
+    return pack_vectors(buffer, offset, rotations, 4)
+
+
+@dataclasses.dataclass(eq=False)
 class Anim:
-    """Description of an anim stream."""
+    """Description of an anim stream.
+
+    Translations and rotations are little endian float32 arrays with the shapes Nx3 and Nx4.
+    """
 
     name: str
     duration: float
     distance: float
     moves: bool
-    translations: list[tuple[float, float, float]]
-    rotations: list[tuple[float, float, float, float]]
+    translations: np.ndarray
+    rotations: np.ndarray
     motions: list[Motion]
 
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two anims, including the contents of the translation and rotation arrays."""
+        if not isinstance(other, Anim):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.duration == other.duration
+            and self.distance == other.distance
+            and self.moves == other.moves
+            and np.array_equal(self.translations, other.translations, equal_nan=True)
+            and np.array_equal(self.rotations, other.rotations, equal_nan=True)
+            and self.motions == other.motions
+        )
+
 
 def read_anim(stream: typing.BinaryIO) -> Anim:
     """Read an anim from a stream."""
@@ -163,11 +252,8 @@ def read_anim(stream: typing.BinaryIO) -> Anim:
     distance = struct.unpack('<f', stream.read(4))[0]
     moves = struct.unpack('<b', stream.read(1))[0] != 0
 
-    translation_count = struct.unpack('>I', stream.read(4))[0]
-    translations = [struct.unpack('<3f', stream.read(12)) for _ in range(translation_count)]
-
-    rotation_count = struct.unpack('>I', stream.read(4))[0]
-    rotations = [struct.unpack('<4f', stream.read(16)) for _ in range(rotation_count)]
+    translations = read_translations(stream)
+    rotations = read_rotations(stream)
 
     motions_count = struct.unpack('>I', stream.read(4))[0]
     motions = [read_motion(stream) for _ in range(motions_count)]
@@ -183,45 +269,72 @@ def read_anim(stream: typing.BinaryIO) -> Anim:
     )
 
 
-def write_anim(stream: typing.BinaryIO, animation: Anim) -> None:
-    """Write an anim to a stream."""
-    stream.write(struct.pack('>I', 0x02))
+def anim_size(animation: Anim) -> int:
+    """Return the size in bytes of a packed anim."""
+    return (
+        4
+        + pascal_string.string_16_size(animation.name)
+        + 4
+        + 4
+        + 1
+        + vectors_size(animation.translations)
+        + vectors_size(animation.rotations)
+        + 4
+        + sum(motion_size(motion) for motion in animation.motions)
+    )
 
-    pascal_string.write_string_16(stream, animation.name, '>')
 
-    stream.write(struct.pack('<f', animation.duration))
-    stream.write(struct.pack('<f', animation.distance))
-    stream.write(struct.pack('B', animation.moves))
+def pack_anim(animation: Anim) -> bytearray:
+    """Pack an anim in to a buffer of the exact size."""
+    buffer = bytearray(anim_size(animation))
+    struct.pack_into('>I', buffer, 0, 0x02)
 
-    stream.write(struct.pack('>I', len(animation.translations)))
-    for translation in animation.translations:
-        write_translation(stream, translation)
+    offset = pascal_string.pack_string_16(buffer, 4, animation.name, '>')
 
-    stream.write(struct.pack('>I', len(animation.rotations)))
-    for rotation in animation.rotations:
-        write_rotation(stream, rotation)
+    struct.pack_into('<ffB', buffer, offset, animation.duration, animation.distance, animation.moves)
+    offset += 9
 
-    stream.write(struct.pack('>I', len(animation.motions)))
+    offset = pack_translations(buffer, offset, animation.translations)
+    offset = pack_rotations(buffer, offset, animation.rotations)
+
+    struct.pack_into('>I', buffer, offset, len(animation.motions))
+    offset += 4
     for motion in animation.motions:
-        write_motion(stream, motion)
+        offset = pack_motion(buffer, offset, motion)
 
+    return buffer
 
-def read_file(file_path: pathlib.Path) -> Anim:
-    """Read an anim file."""
+
+def write_anim(stream: typing.BinaryIO, animation: Anim) -> None:
+    """Write an anim to a stream."""
+    stream.write(pack_anim(animation))
+
+
+def read_bytes(buffer: buffer_io.Buffer) -> Anim:
+    """Read an anim from a buffer."""
     try:
-        with file_path.open(mode='rb') as file:
+        with buffer_io.BufferReader(buffer) as file:
             anim = read_anim(file)
 
-            if len(file.read(1)) != 0:
+            if not file.at_end():
                 raise FileReadError
 
             return anim
 
-    except (OSError, struct.error) as exception:
+    except struct.error as exception:
+        raise FileReadError from exception
+
+
+def read_file(file_path: pathlib.Path) -> Anim:
+    """Read an anim file."""
+    try:
+        buffer = file_path.read_bytes()
+    except OSError as exception:
         raise FileReadError from exception
 
+    return read_bytes(buffer)
+
 
-def write_file(file_path: pathlib.Path, animation: Anim) -> None:
-    """Write an anim file."""
-    with file_path.open('wb') as file:
-        write_anim(file, animation)
+def write_file(file_path: pathlib.Path, animation: Anim, *, atomic: bool = False) -> None:
+    """Write an anim file, optionally replacing the file atomically."""
+    buffer_io.write_file(file_path, pack_anim(animation), atomic=atomic)
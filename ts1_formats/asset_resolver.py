@@ -0,0 +1,53 @@
+"""Resolve The Sims asset names to file paths."""
+
+import collections.abc
+import pathlib
+
+
+class AssetResolver:
+    """Map lowercase asset names to file paths by suffix, ordered by directory priority.
+
+    Files in earlier priority directories are preferred, then files in no priority directory, in the order given.
+    Names that could not be resolved are recorded in misses.
+    """
+
+    def __init__(
+        self,
+        file_paths: collections.abc.Iterable[pathlib.Path],
+        directory_priority: collections.abc.Sequence[pathlib.Path] = (),
+    ) -> None:
+        """Create a resolver for the files."""
+        self.directory_priority = list(directory_priority)
+        self.assets: dict[str, dict[str, list[pathlib.Path]]] = {}
+        self.misses: dict[tuple[str, tuple[str, ...]], None] = {}
+
+        for file_path in sorted(file_paths, key=self.directory_rank):
+            stems = self.assets.setdefault(file_path.suffix.lower(), {})
+            stems.setdefault(file_path.stem.lower(), []).append(file_path)
+
+    def directory_rank(self, file_path: pathlib.Path) -> int:
+        """Return the index of the first priority directory that contains the file."""
+        for index, directory in enumerate(self.directory_priority):
+            if file_path.is_relative_to(directory):
+                return index
+        return len(self.directory_priority)
+
+    def candidates(self, name: str, *suffixes: str) -> list[pathlib.Path]:
+        """Return all the files with the name and any of the suffixes, in suffix and priority order."""
+        name = name.lower()
+        return [file_path for suffix in suffixes for file_path in self.assets.get(suffix.lower(), {}).get(name, [])]
+
+    def resolve(self, name: str, *suffixes: str, directory: pathlib.Path | None = None) -> pathlib.Path | None:
+        """Return the file with the name and the earliest suffix, preferring files directly in the directory."""
+        candidates = self.candidates(name, *suffixes)
+
+        if directory is not None:
+            for file_path in candidates:
+                if file_path.parent == directory:
+                    return file_path
+
+        if candidates:
+            return candidates[0]
+
+        self.misses[name, suffixes] = None
+        return None
@@ -5,7 +5,7 @@ import pathlib
 import struct
 import typing
 
-from . import error, pascal_string, property_list, skeleton
+from . import buffer_io, error, pascal_string, property_list, skeleton
 
 
 def read_time_properties(file: typing.BinaryIO) -> list[property_list.TimeProperty]:
@@ -20,12 +20,19 @@ def read_time_properties(file: typing.BinaryIO) -> list[property_list.TimeProper
     ]
 
 
-def write_time_properties(file: typing.BinaryIO, time_properties: list[property_list.TimeProperty]) -> None:
-    """Write BCF time properties to a file."""
-    file.write(struct.pack('<I', len(time_properties)))
+def time_properties_size(time_properties: list[property_list.TimeProperty]) -> int:
+    """Return the size in bytes of packed BCF time properties."""
+    return 4 + sum(4 + property_list.properties_size(time_property.events) for time_property in time_properties)
+
+
+def pack_time_properties(buffer: bytearray, offset: int, time_properties: list[property_list.TimeProperty]) -> int:
+    """Pack BCF time properties in to a buffer at the offset and return the offset after them."""
+    struct.pack_into('<I', buffer, offset, len(time_properties))
+    offset += 4
     for time_property in time_properties:
-        file.write(struct.pack('<I', time_property.time))
-        property_list.write_properties(file, time_property.events, '<')
+        struct.pack_into('<I', buffer, offset, time_property.time)
+        offset = property_list.pack_properties(buffer, offset + 4, time_property.events, '<')
+    return offset
 
 
 @dataclasses.dataclass
@@ -46,11 +53,20 @@ def read_time_property_lists(file: typing.BinaryIO) -> list[TimePropertyList]:
     ]
 
 
-def write_time_property_lists(file: typing.BinaryIO, time_property_lists: list[TimePropertyList]) -> None:
-    """Write BCF time property lists to a file."""
-    file.write(struct.pack('<I', len(time_property_lists)))
+def time_property_lists_size(time_property_lists: list[TimePropertyList]) -> int:
+    """Return the size in bytes of packed BCF time property lists."""
+    return 4 + sum(
+        time_properties_size(time_property_list.time_properties) for time_property_list in time_property_lists
+    )
+
+
+def pack_time_property_lists(buffer: bytearray, offset: int, time_property_lists: list[TimePropertyList]) -> int:
+    """Pack BCF time property lists in to a buffer at the offset and return the offset after them."""
+    struct.pack_into('<I', buffer, offset, len(time_property_lists))
+    offset += 4
     for time_property_list in time_property_lists:
-        write_time_properties(file, time_property_list.time_properties)
+        offset = pack_time_properties(buffer, offset, time_property_list.time_properties)
+    return offset
 
 
 @dataclasses.dataclass
@@ -87,19 +103,42 @@ def read_motions(file: typing.BinaryIO) -> list[Motion]:
     ]
 
 
-def write_motions(file: typing.BinaryIO, motions: list[Motion]) -> None:
-    """Write BCF motions to a file."""
-    file.write(struct.pack('<I', len(motions)))
+MOTION_FIELDS_FORMAT = '<IfIIii'
+MOTION_FIELDS_SIZE = struct.calcsize(MOTION_FIELDS_FORMAT)
+
+
+def motions_size(motions: list[Motion]) -> int:
+    """Return the size in bytes of packed BCF motions."""
+    return 4 + sum(
+        pascal_string.string_size(motion.bone_name)
+        + MOTION_FIELDS_SIZE
+        + property_list.property_lists_size(motion.property_lists)
+        + time_property_lists_size(motion.time_property_lists)
+        for motion in motions
+    )
+
+
+def pack_motions(buffer: bytearray, offset: int, motions: list[Motion]) -> int:
+    """Pack BCF motions in to a buffer at the offset and return the offset after them."""
+    struct.pack_into('<I', buffer, offset, len(motions))
+    offset += 4
     for motion in motions:
-        pascal_string.write_string(file, motion.bone_name)
-        file.write(struct.pack('<I', motion.frame_count))
-        file.write(struct.pack('<f', motion.duration))
-        file.write(struct.pack('<I', motion.uses_positions))
-        file.write(struct.pack('<I', motion.uses_rotations))
-        file.write(struct.pack('<i', motion.position_offset))
-        file.write(struct.pack('<i', motion.rotation_offset))
-        property_list.write_property_lists(file, motion.property_lists, '<')
-        write_time_property_lists(file, motion.time_property_lists)
+        offset = pascal_string.pack_string(buffer, offset, motion.bone_name)
+        struct.pack_into(
+            MOTION_FIELDS_FORMAT,
+            buffer,
+            offset,
+            motion.frame_count,
+            motion.duration,
+            motion.uses_positions,
+            motion.uses_rotations,
+            motion.position_offset,
+            motion.rotation_offset,
+        )
+        offset += MOTION_FIELDS_SIZE
+        offset = property_list.pack_property_lists(buffer, offset, motion.property_lists, '<')
+        offset = pack_time_property_lists(buffer, offset, motion.time_property_lists)
+    return offset
 
 
 @dataclasses.dataclass
@@ -134,18 +173,60 @@ def read_skills(file: typing.BinaryIO) -> list[Skill]:
     ]
 
 
-def write_skills(file: typing.BinaryIO, skills: list[Skill]) -> None:
-    """Write BCF skills to a file."""
-    file.write(struct.pack('<I', len(skills)))
+SKILL_FIELDS_FORMAT = '<ffIII'
+SKILL_FIELDS_SIZE = struct.calcsize(SKILL_FIELDS_FORMAT)
+
+
+def skills_size(skills: list[Skill]) -> int:
+    """Return the size in bytes of packed BCF skills."""
+    return 4 + sum(
+        pascal_string.string_size(skill.skill_name)
+        + pascal_string.string_size(skill.animation_name)
+        + SKILL_FIELDS_SIZE
+        + motions_size(skill.motions)
+        for skill in skills
+    )
+
+
+def pack_skills(buffer: bytearray, offset: int, skills: list[Skill]) -> int:
+    """Pack BCF skills in to a buffer at the offset and return the offset after them."""
+    struct.pack_into('<I', buffer, offset, len(skills))
+    offset += 4
     for skill in skills:
-        pascal_string.write_string(file, skill.skill_name)
-        pascal_string.write_string(file, skill.animation_name)
-        file.write(struct.pack('<f', skill.duration))
-        file.write(struct.pack('<f', skill.distance))
-        file.write(struct.pack('<I', skill.moves))
-        file.write(struct.pack('<I', skill.position_count))
-        file.write(struct.pack('<I', skill.rotation_count))
-        write_motions(file, skill.motions)
+        offset = pascal_string.pack_string(buffer, offset, skill.skill_name)
+        offset = pascal_string.pack_string(buffer, offset, skill.animation_name)
+        struct.pack_into(
+            SKILL_FIELDS_FORMAT,
+            buffer,
+            offset,
+            skill.duration,
+            skill.distance,
+            skill.moves,
+            skill.position_count,
+            skill.rotation_count,
+        )
+        offset = pack_motions(buffer, offset + SKILL_FIELDS_SIZE, skill.motions)
+    return offset
+
+
+class TimeEvent(typing.NamedTuple):
+    """A flattened time property event of a skill."""
+
+    time: int
+    bone_name: str
+    name: str
+    value: str
+
+
+def create_event_table(skill: Skill) -> list[TimeEvent]:
+    """Flatten the time property events of all the motions of a skill in to a single table."""
+    return [
+        TimeEvent(time_property.time, motion.bone_name, event.name, event.value)
+        for motion in skill.motions
+        for time_property_list in motion.time_property_lists
+        for time_property in time_property_list.time_properties
+        for event in time_property.events
+    ]
 
 
 @dataclasses.dataclass
@@ -172,14 +253,23 @@ def read_skins(file: typing.BinaryIO) -> list[Skin]:
     ]
 
 
-def write_skins(file: typing.BinaryIO, skins: list[Skin]) -> None:
-    """Write BCF skins to a file."""
-    file.write(struct.pack('<I', len(skins)))
+def skins_size(skins: list[Skin]) -> int:
+    """Return the size in bytes of packed BCF skins."""
+    return 4 + sum(
+        pascal_string.string_size(skin.bone_name) + pascal_string.string_size(skin.skin_name) + 8 for skin in skins
+    )
+
+
+def pack_skins(buffer: bytearray, offset: int, skins: list[Skin]) -> int:
+    """Pack BCF skins in to a buffer at the offset and return the offset after them."""
+    struct.pack_into('<I', buffer, offset, len(skins))
+    offset += 4
     for skin in skins:
-        pascal_string.write_string(file, skin.bone_name)
-        pascal_string.write_string(file, skin.skin_name)
-        file.write(struct.pack('<I', skin.censor_flags))
-        file.write(struct.pack('<I', skin.unknown))
+        offset = pascal_string.pack_string(buffer, offset, skin.bone_name)
+        offset = pascal_string.pack_string(buffer, offset, skin.skin_name)
+        struct.pack_into('<II', buffer, offset, skin.censor_flags, skin.unknown)
+        offset += 8
+    return offset
 
 
 @dataclasses.dataclass
@@ -206,14 +296,20 @@ def read_suits(file: typing.BinaryIO) -> list[Suit]:
     ]
 
 
-def write_suits(file: typing.BinaryIO, suits: list[Suit]) -> None:
-    """Write BCF suits to a file."""
-    file.write(struct.pack('<I', len(suits)))
+def suits_size(suits: list[Suit]) -> int:
+    """Return the size in bytes of packed BCF suits."""
+    return 4 + sum(pascal_string.string_size(suit.name) + 8 + skins_size(suit.skins) for suit in suits)
+
+
+def pack_suits(buffer: bytearray, offset: int, suits: list[Suit]) -> int:
+    """Pack BCF suits in to a buffer at the offset and return the offset after them."""
+    struct.pack_into('<I', buffer, offset, len(suits))
+    offset += 4
     for suit in suits:
-        pascal_string.write_string(file, suit.name)
-        file.write(struct.pack('<I', suit.suit_type))
-        file.write(struct.pack('<I', suit.unknown))
-        write_skins(file, suit.skins)
+        offset = pascal_string.pack_string(buffer, offset, suit.name)
+        struct.pack_into('<II', buffer, offset, suit.suit_type, suit.unknown)
+        offset = pack_skins(buffer, offset + 8, suit.skins)
+    return offset
 
 
 @dataclasses.dataclass
@@ -234,29 +330,50 @@ def read_bcf(file: typing.BinaryIO) -> Bcf:
     )
 
 
+def bcf_size(bcf: Bcf) -> int:
+    """Return the size in bytes of a packed BCF."""
+    return skeleton.skeletons_size(bcf.skeletons) + suits_size(bcf.suits) + skills_size(bcf.skills)
+
+
+def pack_bcf(bcf: Bcf) -> bytearray:
+    """Pack a BCF in to a buffer of the exact size."""
+    buffer = bytearray(bcf_size(bcf))
+    offset = skeleton.pack_skeletons(buffer, 0, bcf.skeletons, '<')
+    offset = pack_suits(buffer, offset, bcf.suits)
+    pack_skills(buffer, offset, bcf.skills)
+    return buffer
+
+
 def write_bcf(file: typing.BinaryIO, bcf: Bcf) -> None:
     """Write a BCF to a file."""
-    skeleton.write_skeletons(file, bcf.skeletons, '<')
-    write_suits(file, bcf.suits)
-    write_skills(file, bcf.skills)
+    file.write(pack_bcf(bcf))
 
 
-def read_file(file_path: pathlib.Path) -> Bcf:
-    """Read a file as a BCF."""
+def read_bytes(buffer: buffer_io.Buffer) -> Bcf:
+    """Read a buffer as a BCF."""
     try:
-        with file_path.open(mode='rb') as file:
+        with buffer_io.BufferReader(buffer) as file:
             bcf = read_bcf(file)
 
-            if len(file.read(1)) != 0:
+            if not file.at_end():
                 raise error.FileReadError
 
             return bcf
 
-    except (OSError, struct.error) as exception:
+    except struct.error as exception:
         raise error.FileReadError from exception
 
 
-def write_file(file_path: pathlib.Path, bcf: Bcf) -> None:
-    """Write a BCF to a file."""
-    with file_path.open('wb') as file:
-        write_bcf(file, bcf)
+def read_file(file_path: pathlib.Path) -> Bcf:
+    """Read a file as a BCF."""
+    try:
+        buffer = file_path.read_bytes()
+    except OSError as exception:
+        raise error.FileReadError from exception
+
+    return read_bytes(buffer)
+
+
+def write_file(file_path: pathlib.Path, bcf: Bcf, *, atomic: bool = False) -> None:
+    """Write a BCF to a file, optionally replacing the file atomically."""
+    buffer_io.write_file(file_path, pack_bcf(bcf), atomic=atomic)
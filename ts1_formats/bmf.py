@@ -5,7 +5,7 @@ import pathlib
 import struct
 import typing
 
-from . import error, pascal_string
+from . import buffer_io, error, pascal_string
 
 
 def read_bones(file: typing.BinaryIO, endianness: str) -> list[str]:
@@ -204,21 +204,31 @@ def write_bmf(file: typing.BinaryIO, bmf: Bmf) -> None:
     write_mesh(file, bmf.mesh, '<')
 
 
-def read_file(file_path: pathlib.Path) -> Bmf:
-    """Read a file as a BMF."""
+def read_bytes(buffer: buffer_io.Buffer) -> Bmf:
+    """Read a buffer as a BMF."""
     try:
-        with file_path.open(mode='rb') as file:
+        with buffer_io.BufferReader(buffer) as file:
             bmf = read_bmf(file)
 
-            if len(file.read(1)) != 0:
+            if not file.at_end():
                 raise error.FileReadError
 
             return bmf
 
-    except (OSError, struct.error) as exception:
+    except struct.error as exception:
         raise error.FileReadError from exception
 
 
+def read_file(file_path: pathlib.Path) -> Bmf:
+    """Read a file as a BMF."""
+    try:
+        buffer = file_path.read_bytes()
+    except OSError as exception:
+        raise error.FileReadError from exception
+
+    return read_bytes(buffer)
+
+
 def write_file(file_path: pathlib.Path, bmf: Bmf) -> None:
     """Write a BMF to a file."""
     with file_path.open('wb') as file:
@@ -0,0 +1,93 @@
+"""Read and write The Sims files through in memory buffers."""
+
+import io
+import locale
+import mmap
+import os
+import pathlib
+import tempfile
+import types
+import typing
+
+Buffer = bytes | bytearray | memoryview | mmap.mmap
+
+
+class BufferReader:
+    """A binary stream over a buffer that reads from the buffer without copying it."""
+
+    def __init__(self, buffer: Buffer) -> None:
+        """Create a stream at the start of the buffer."""
+        self.view = memoryview(buffer).cast('B')
+        self.position = 0
+
+    def __enter__(self) -> typing.Self:
+        """Enter the context of the stream."""
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        """Release the buffer so that it can be closed or resized."""
+        self.view.release()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes, or all remaining bytes if size is negative."""
+        end = len(self.view) if size < 0 else min(self.position + size, len(self.view))
+        data = self.view[self.position : end].tobytes()
+        self.position = end
+        return data
+
+    def tell(self) -> int:
+        """Return the current position in the buffer."""
+        return self.position
+
+    def at_end(self) -> bool:
+        """Return whether all the bytes in the buffer have been read."""
+        return self.position == len(self.view)
+
+
+def open_text(buffer: Buffer) -> io.StringIO:
+    """Decode a buffer in to a text stream, as if the buffer was a file opened in text mode."""
+    with memoryview(buffer) as view:
+        text = str(view, locale.getpreferredencoding(do_setlocale=False))
+    return io.StringIO(text, newline=None)
+
+
+def get_file_mode(file_path: pathlib.Path) -> int:
+    """Get the permission bits of a file, or the ones a new file would be created with."""
+    try:
+        return file_path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_file(file_path: pathlib.Path, buffer: Buffer, *, atomic: bool = False) -> None:
+    """Write a buffer to a file with a single write.
+
+    If atomic, the buffer is written to a temporary file that then replaces the file, keeping the mode of the file.
+    """
+    if not atomic:
+        with file_path.open('wb') as file:
+            file.write(buffer)
+        return
+
+    temporary_file = tempfile.NamedTemporaryFile(  # noqa: SIM115
+        dir=file_path.parent,
+        prefix=file_path.name + ".",
+        suffix=".tmp",
+        delete=False,
+    )
+    temporary_file_path = pathlib.Path(temporary_file.name)
+    try:
+        with temporary_file:
+            temporary_file.write(buffer)
+        temporary_file_path.chmod(get_file_mode(file_path))
+        temporary_file_path.replace(file_path)
+    except BaseException:
+        temporary_file_path.unlink(missing_ok=True)
+        raise
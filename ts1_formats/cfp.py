@@ -7,7 +7,7 @@ import pathlib
 import struct
 import typing
 
-from . import error
+from . import buffer_io, error
 
 
 def decode_delta(delta: int) -> float:
@@ -127,16 +127,16 @@ class Cfp:
     rotations_w: list[float]
 
 
-def read_file(file_path: pathlib.Path, position_count: int, rotation_count: int) -> Cfp:
-    """Read a file as a CFP."""
+def read_bytes(buffer: buffer_io.Buffer, position_count: int, rotation_count: int) -> Cfp:
+    """Read a buffer as a CFP."""
     try:
-        with file_path.open(mode='rb') as file:
+        with buffer_io.BufferReader(buffer) as file:
             decoded_values = decode_values(file, (position_count * 3) + (rotation_count * 4))
 
-            if len(file.read(1)) != 0:
+            if not file.at_end():
                 raise error.FileReadError
 
-    except (OSError, struct.error) as exception:
+    except struct.error as exception:
         raise error.FileReadError from exception
 
     positions_x = decoded_values[:position_count]
@@ -160,6 +160,16 @@ def read_file(file_path: pathlib.Path, position_count: int, rotation_count: int)
     )
 
 
+def read_file(file_path: pathlib.Path, position_count: int, rotation_count: int) -> Cfp:
+    """Read a file as a CFP."""
+    try:
+        buffer = file_path.read_bytes()
+    except OSError as exception:
+        raise error.FileReadError from exception
+
+    return read_bytes(buffer, position_count, rotation_count)
+
+
 def write_file(
     file_path: pathlib.Path,
     cfp: Cfp,
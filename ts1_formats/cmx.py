@@ -3,14 +3,14 @@
 import pathlib
 import typing
 
-from . import bcf, error, property_list, skeleton
+from . import bcf, buffer_io, error, property_list, skeleton
 
 
 def read_properties(file: typing.TextIO) -> list[property_list.Property]:
     """Read BCF properties from a CMX file."""
     count = int(file.readline())
     return [
-        property_list.Property(
+        property_list.intern_property(
             file.readline().strip(),
             file.readline().strip(),
         )
@@ -282,21 +282,28 @@ def write_cmx(file: typing.TextIO, bcf_desc: bcf.Bcf) -> None:
     write_skills(file, bcf_desc.skills)
 
 
-def read_file(file_path: pathlib.Path) -> bcf.Bcf:
-    """Read a BCF from a CMX file path."""
-    try:
-        with file_path.open() as file:
-            if not file.readline().startswith("//"):
-                raise error.FileReadError
+def read_bytes(buffer: buffer_io.Buffer) -> bcf.Bcf:
+    """Read a BCF from a CMX buffer."""
+    file = buffer_io.open_text(buffer)
+
+    if not file.readline().startswith("//"):
+        raise error.FileReadError
+
+    if file.readline().strip() != "version 300":
+        raise error.FileReadError
 
-            if file.readline().strip() != "version 300":
-                raise error.FileReadError
+    return read_cmx(file)
 
-            return read_cmx(file)
 
+def read_file(file_path: pathlib.Path) -> bcf.Bcf:
+    """Read a BCF from a CMX file path."""
+    try:
+        buffer = file_path.read_bytes()
     except OSError as exception:
         raise error.FileReadError from exception
 
+    return read_bytes(buffer)
+
 
 def write_file(file_path: pathlib.Path, bcf_desc: bcf.Bcf) -> None:
     """Write a BCF to a CMX file path."""
@@ -3,3 +3,7 @@
 
 class FileReadError(Exception):
     """General purpose file read error."""
+
+
+class SkeletonTopologyError(Exception):
+    """Skeleton bones reference missing parents or are not in topological order."""
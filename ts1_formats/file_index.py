@@ -0,0 +1,176 @@
+"""Persistent index of the files in a directory tree."""
+
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+
+from . import buffer_io
+
+INDEX_VERSION = 2
+
+
+@dataclasses.dataclass
+class DirectoryEntry:
+    """The files and subdirectories of a directory when it had the modification time."""
+
+    mtime_ns: int
+    file_names: list[str]
+    subdirectory_names: list[str]
+
+
+def scan_directory(directory_path: pathlib.Path, mtime_ns: int) -> DirectoryEntry:
+    """List the files and subdirectories of a directory, including the directories symbolic links point to."""
+    file_names = []
+    subdirectory_names = []
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirectory_names.append(entry.name)
+            else:
+                file_names.append(entry.name)
+    return DirectoryEntry(mtime_ns, sorted(file_names), sorted(subdirectory_names))
+
+
+class FileIndex:
+    """Files in a directory tree bucketed by lowercase suffix and lowercase stem.
+
+    Directories are only listed again when their modification time changes.
+    """
+
+    def __init__(
+        self,
+        root: pathlib.Path,
+        directories: dict[str, DirectoryEntry] | None = None,
+        *,
+        recursive: bool = True,
+    ) -> None:
+        """Create an index of the root directory from previously indexed directories."""
+        self.root = root
+        self.recursive = recursive
+        self.directories = directories if directories is not None else {}
+        self.buckets: dict[str, dict[str, list[pathlib.Path]]] = {}
+        self.create_buckets()
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the file system and return whether anything changed."""
+        changed = False
+        directories: dict[str, DirectoryEntry] = {}
+        visited_directories: set[tuple[int, int]] = set()
+
+        pending = [""]
+        while pending:
+            relative_path = pending.pop()
+            directory_path = self.root / relative_path
+            try:
+                stat = directory_path.stat()
+            except OSError:
+                changed = True
+                continue
+
+            # Directories reached again through symbolic links, such as links to a parent, are only indexed once.
+            directory_key = (stat.st_dev, stat.st_ino)
+            if directory_key in visited_directories:
+                continue
+            visited_directories.add(directory_key)
+            mtime_ns = stat.st_mtime_ns
+
+            entry = self.directories.get(relative_path)
+            if entry is None or entry.mtime_ns != mtime_ns:
+                try:
+                    entry = scan_directory(directory_path, mtime_ns)
+                except OSError:
+                    changed = True
+                    continue
+                changed = True
+
+            directories[relative_path] = entry
+            if self.recursive:
+                pending.extend(
+                    pathlib.PurePosixPath(relative_path, name).as_posix() for name in reversed(entry.subdirectory_names)
+                )
+
+        if directories.keys() != self.directories.keys():
+            changed = True
+
+        self.directories = directories
+        if changed:
+            self.create_buckets()
+
+        return changed
+
+    def create_buckets(self) -> None:
+        """Bucket all the indexed files by lowercase suffix and stem."""
+        self.buckets = {}
+        for relative_path, entry in self.directories.items():
+            directory_path = self.root / relative_path
+            for file_name in entry.file_names:
+                file_path = directory_path / file_name
+                stems = self.buckets.setdefault(file_path.suffix.lower(), {})
+                stems.setdefault(file_path.stem.lower(), []).append(file_path)
+
+    def files(self, *suffixes: str) -> list[pathlib.Path]:
+        """Return all the files with any of the given suffixes, or all files if none are given."""
+        if not suffixes:
+            suffixes = tuple(self.buckets.keys())
+
+        return [
+            file_path
+            for suffix in suffixes
+            for file_paths in self.buckets.get(suffix.lower(), {}).values()
+            for file_path in file_paths
+        ]
+
+    def find(self, stem: str, *suffixes: str) -> list[pathlib.Path]:
+        """Return all the files with the stem, ignoring case, and any of the given suffixes."""
+        stem = stem.lower()
+        return [file_path for suffix in suffixes for file_path in self.buckets.get(suffix.lower(), {}).get(stem, [])]
+
+
+def index_file_path(root: pathlib.Path, cache_directory: pathlib.Path) -> pathlib.Path:
+    """Return the path of the cached index of the root directory."""
+    root_hash = hashlib.sha1(root.resolve().as_posix().encode(), usedforsecurity=False).hexdigest()
+    return cache_directory / f"file-index-{root_hash[:16]}.json"
+
+
+def load_index(root: pathlib.Path, cache_directory: pathlib.Path) -> FileIndex:
+    """Load the cached index of the root directory, bring it up to date and cache it again if it changed."""
+    cache_file_path = index_file_path(root, cache_directory)
+
+    directories: dict[str, DirectoryEntry] = {}
+    try:
+        cached_index = json.loads(cache_file_path.read_bytes())
+        if cached_index["version"] == INDEX_VERSION and cached_index["root"] == root.resolve().as_posix():
+            directories = {
+                relative_path: DirectoryEntry(*entry) for relative_path, entry in cached_index["directories"].items()
+            }
+    except (OSError, ValueError, KeyError, TypeError):
+        directories = {}
+
+    index = FileIndex(root, directories)
+    if index.refresh():
+        save_index(index, cache_directory)
+
+    return index
+
+
+def save_index(index: FileIndex, cache_directory: pathlib.Path) -> None:
+    """Cache the index, ignoring any errors as the cache can always be recreated."""
+    cached_index = {
+        "version": INDEX_VERSION,
+        "root": index.root.resolve().as_posix(),
+        "directories": {
+            relative_path: [entry.mtime_ns, entry.file_names, entry.subdirectory_names]
+            for relative_path, entry in index.directories.items()
+        },
+    }
+    try:
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        buffer_io.write_file(
+            index_file_path(index.root, cache_directory),
+            json.dumps(cached_index, separators=(",", ":")).encode(),
+            atomic=True,
+        )
+    except OSError:
+        pass
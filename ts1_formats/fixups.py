@@ -0,0 +1,120 @@
+"""Fixes for mistakes in the skin names, default textures and texture file names of The Sims 1.
+
+The fixes are stored in fixups.json, grouped by the expansion pack or download they fix, and loaded once.
+"""
+
+import dataclasses
+import functools
+import json
+import pathlib
+
+from .error import FileReadError
+
+FIXUPS_FILE_PATH = pathlib.Path(__file__).with_name("fixups.json")
+FIXUPS_VERSION = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class ExpansionPackFixups:
+    """The fixes for an expansion pack."""
+
+    name: str
+    skin_names: dict[str, str]
+    default_textures: dict[str, str]
+    texture_file_names: dict[str, str]
+
+
+@dataclasses.dataclass(frozen=True)
+class FixupTable:
+    """The fixes of all the expansion packs merged in to single lookups."""
+
+    version: int
+    expansion_packs: tuple[ExpansionPackFixups, ...]
+    skin_names: dict[str, str]
+    default_textures: dict[str, str]
+    texture_file_names: dict[str, str]
+
+    def fix_skin_name(self, skin_name: str) -> str:
+        """Fix a skin name."""
+        return self.skin_names.get(skin_name, skin_name)
+
+    def fix_default_texture(self, skin_name: str, default_texture: str) -> str:
+        """Fix the default texture of a skin, using its fixed skin name."""
+        return self.default_textures.get(skin_name, default_texture)
+
+    def fix_skin_name_and_default_texture(self, skin_name: str, default_texture: str) -> tuple[str, str]:
+        """Fix a skin name and its default texture."""
+        skin_name = self.fix_skin_name(skin_name)
+        return skin_name, self.fix_default_texture(skin_name, default_texture)
+
+    def fix_texture_file_name(self, texture_file_name: str) -> str:
+        """Fix a texture file name, without its extension."""
+        return self.texture_file_names.get(texture_file_name, texture_file_name)
+
+
+def merge_fixups(kind: str, fixups: list[dict[str, str]]) -> dict[str, str]:
+    """Merge the fixes of the expansion packs, checking that no fixed name is fixed again."""
+    merged: dict[str, str] = {}
+    for expansion_pack_fixups in fixups:
+        for name, fixed_name in expansion_pack_fixups.items():
+            if merged.get(name, fixed_name) != fixed_name:
+                error_message = f"Conflicting {kind} fixes for {name}"
+                raise FileReadError(error_message)
+            merged[name] = fixed_name
+
+    for fixed_name in merged.values():
+        if fixed_name in merged:
+            error_message = f"The {kind} fix {fixed_name} is fixed again"
+            raise FileReadError(error_message)
+
+    return merged
+
+
+def read_fixup_table(file_path: pathlib.Path) -> FixupTable:
+    """Read a fixup table from a json file."""
+    try:
+        with file_path.open(encoding="utf-8") as file:
+            data = json.load(file)
+    except (OSError, json.JSONDecodeError) as exception:
+        raise FileReadError from exception
+
+    if data.get("version") != FIXUPS_VERSION:
+        error_message = f"Unsupported fixups version {data.get('version')}"
+        raise FileReadError(error_message)
+
+    try:
+        expansion_packs = tuple(
+            ExpansionPackFixups(
+                expansion_pack["name"],
+                dict(expansion_pack["skin_names"]),
+                dict(expansion_pack["default_textures"]),
+                dict(expansion_pack["texture_file_names"]),
+            )
+            for expansion_pack in data["expansion_packs"]
+        )
+    except (KeyError, TypeError, ValueError) as exception:
+        raise FileReadError from exception
+
+    return FixupTable(
+        data["version"],
+        expansion_packs,
+        merge_fixups("skin name", [expansion_pack.skin_names for expansion_pack in expansion_packs]),
+        merge_fixups("default texture", [expansion_pack.default_textures for expansion_pack in expansion_packs]),
+        merge_fixups("texture file name", [expansion_pack.texture_file_names for expansion_pack in expansion_packs]),
+    )
+
+
+@functools.cache
+def load_fixup_table() -> FixupTable:
+    """Load the bundled fixup table, once."""
+    return read_fixup_table(FIXUPS_FILE_PATH)
+
+
+def fixup_skin_name_and_default_texture(skin_name: str, default_texture: str) -> tuple[str, str]:
+    """Fix mistakes in the skin name and default texture in files from The Sims 1."""
+    return load_fixup_table().fix_skin_name_and_default_texture(skin_name, default_texture)
+
+
+def fix_texture_file_name(texture_file_name: str) -> str:
+    """Fix texture file name mistakes in The Sims."""
+    return load_fixup_table().fix_texture_file_name(texture_file_name)
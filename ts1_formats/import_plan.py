@@ -0,0 +1,403 @@
+"""Plan the import of The Sims files without Blender."""
+
+import argparse
+import collections
+import dataclasses
+import json
+import pathlib
+import sys
+import typing
+
+from . import asset_resolver, bcf, file_index, preload, skin_classifier, texture_names
+from .error import FileReadError
+
+SKELETON_FILE_NAMES = {
+    "adult": "adult-skeleton.cmx.bcf",
+    "child": "child-skeleton.cmx.bcf",
+    "kat": "kat_skeleton.cmx.bcf",
+    "dog": "dog_skeleton.cmx.bcf",
+    "effects1": "effects1-skeleton.cmx.bcf",
+}
+
+TextureFile = tuple[str, pathlib.Path | None]
+
+
+@dataclasses.dataclass
+class SkeletonPlan:
+    """A skeleton in one of the imported files."""
+
+    name: str
+    bone_count: int
+    file_path: pathlib.Path
+
+
+@dataclasses.dataclass
+class SkinPlan:
+    """The files used by a skin of a suit.
+
+    The default texture name, vertex and face counts are only known if the mesh was read while planning.
+    """
+
+    skin_name: str
+    mesh_file_path: pathlib.Path | None
+    skeleton_names: list[str]
+    texture_files: list[TextureFile]
+    default_texture_name: str | None = None
+    vertex_count: int | None = None
+    face_count: int | None = None
+
+
+@dataclasses.dataclass
+class SuitPlan:
+    """The files used by a suit."""
+
+    bcf_file_path: pathlib.Path
+    suit: bcf.Suit
+    skins: list[SkinPlan]
+
+
+@dataclasses.dataclass
+class SkillPlan:
+    """The files used by a skill."""
+
+    bcf_file_path: pathlib.Path
+    skill: bcf.Skill
+    cfp_file_path: pathlib.Path | None
+    skeleton_names: list[str]
+    keyframe_count: int
+
+
+@dataclasses.dataclass
+class MissingReference:
+    """A file or skeleton referenced by a suit or skill that could not be found or read."""
+
+    kind: str
+    name: str
+    referenced_by: str
+
+
+@dataclasses.dataclass
+class ImportPlan:
+    """Everything an import of a set of bcf and cmx files will create and the files it will read."""
+
+    bcf_files: list[tuple[pathlib.Path, bcf.Bcf]]
+    skeletons: list[SkeletonPlan]
+    skeleton_files: dict[str, pathlib.Path | None]
+    suits: list[SuitPlan]
+    skills: list[SkillPlan]
+    missing: list[MissingReference]
+    texture_index: texture_names.TextureIndex
+
+    def counts(self) -> dict[str, int]:
+        """Count the files and data the import will read and create."""
+        skins = [skin for suit in self.suits for skin in suit.skins]
+        return {
+            "files": len(self.bcf_files),
+            "skeletons": len(self.skeletons),
+            "skeleton_files": sum(file_path is not None for file_path in self.skeleton_files.values()),
+            "suits": len(self.suits),
+            "meshes": sum(skin.mesh_file_path is not None for skin in skins),
+            "textures": len({file_path for skin in skins for _, file_path in skin.texture_files if file_path}),
+            "vertices": sum(skin.vertex_count or 0 for skin in skins),
+            "faces": sum(skin.face_count or 0 for skin in skins),
+            "skills": len(self.skills),
+            "animations": sum(skill.cfp_file_path is not None for skill in self.skills),
+            "keyframes": sum(skill.keyframe_count for skill in self.skills),
+            "missing": len(self.missing),
+        }
+
+    def count_mesh_file_uses(self) -> collections.Counter[pathlib.Path]:
+        """Count the skins using each mesh file, so a read mesh can be released after its last skin."""
+        return collections.Counter(
+            skin.mesh_file_path for suit in self.suits for skin in suit.skins if skin.mesh_file_path is not None
+        )
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        """Return the plan as a dictionary that can be written as json."""
+
+        def path_string(file_path: pathlib.Path | None) -> str | None:
+            return None if file_path is None else file_path.as_posix()
+
+        return {
+            "files": [path_string(file_path) for file_path, _ in self.bcf_files],
+            "skeletons": [
+                {"name": skeleton.name, "bone_count": skeleton.bone_count, "file": path_string(skeleton.file_path)}
+                for skeleton in self.skeletons
+            ],
+            "skeleton_files": {name: path_string(file_path) for name, file_path in self.skeleton_files.items()},
+            "suits": [
+                {
+                    "name": suit.suit.name,
+                    "file": path_string(suit.bcf_file_path),
+                    "skins": [
+                        {
+                            "skin_name": skin.skin_name,
+                            "mesh": path_string(skin.mesh_file_path),
+                            "skeleton_names": skin.skeleton_names,
+                            "textures": [
+                                {"name": name, "file": path_string(file_path)} for name, file_path in skin.texture_files
+                            ],
+                            "vertex_count": skin.vertex_count,
+                            "face_count": skin.face_count,
+                        }
+                        for skin in suit.skins
+                    ],
+                }
+                for suit in self.suits
+            ],
+            "skills": [
+                {
+                    "name": skill.skill.skill_name,
+                    "animation_name": skill.skill.animation_name,
+                    "file": path_string(skill.bcf_file_path),
+                    "cfp": path_string(skill.cfp_file_path),
+                    "skeleton_names": skill.skeleton_names,
+                    "keyframe_count": skill.keyframe_count,
+                }
+                for skill in self.skills
+            ],
+            "missing": [dataclasses.asdict(missing) for missing in self.missing],
+            "counts": self.counts(),
+        }
+
+
+def index_search_directories(
+    file_paths: list[pathlib.Path],
+    file_search_directory: pathlib.Path,
+    cache_directory: pathlib.Path | None,
+) -> tuple[asset_resolver.AssetResolver, list[pathlib.Path]]:
+    """Index the search directory and the directory of the files, returning an asset resolver and texture files.
+
+    If there is a cache directory the index of the search directory is cached in it.
+    """
+    if cache_directory is not None:
+        file_indices = [file_index.load_index(file_search_directory, cache_directory)]
+    else:
+        file_indices = [file_index.FileIndex(file_search_directory)]
+        file_indices[0].refresh()
+
+    if not file_paths[0].parent.is_relative_to(file_search_directory):
+        file_indices.append(file_index.FileIndex(file_paths[0].parent, recursive=False))
+        file_indices[-1].refresh()
+
+    def list_files(*suffixes: str) -> list[pathlib.Path]:
+        return [file_path for index in file_indices for file_path in index.files(*suffixes)]
+
+    directory_priority = list(dict.fromkeys(file_path.parent for file_path in file_paths))
+    resolver = asset_resolver.AssetResolver(
+        list_files(".bcf", ".cmx", ".bmf", ".skn", ".cfp"),
+        [*directory_priority, file_search_directory],
+    )
+
+    return resolver, list_files(".bmp", ".tga")
+
+
+def count_keyframes(skill: bcf.Skill) -> int:
+    """Count the translation and rotation keyframes of all the motions in a skill."""
+    return sum(motion.frame_count * (motion.uses_positions + motion.uses_rotations) for motion in skill.motions)
+
+
+def create_plan(
+    bcf_files: list[tuple[pathlib.Path, bcf.Bcf]],
+    resolver: asset_resolver.AssetResolver,
+    texture_file_list: list[pathlib.Path],
+    preferred_skin_color: str,
+    preloader: preload.Preloader | None = None,
+    *,
+    import_skeletons: bool,
+    import_meshes: bool,
+    import_animations: bool,
+    find_skeleton: bool,
+    fix_textures: bool,
+    read_meshes: bool,
+) -> ImportPlan:
+    """Plan the import of the bcf files.
+
+    If there is a preloader, it starts reading the meshes and animations in the order they will be imported.
+    If read_meshes, the meshes are read to count their vertices and faces and to find their default textures.
+    """
+    texture_index = texture_names.TextureIndex(texture_file_list, fix_textures=fix_textures)
+    plan = ImportPlan(bcf_files, [], {}, [], [], [], texture_index)
+
+    def plan_skeleton_file(skeleton_names: list[str], referenced_by: str) -> None:
+        skeleton_name = skeleton_names[0]
+        if skeleton_name in plan.skeleton_files:
+            return
+
+        skeleton_file_name = SKELETON_FILE_NAMES.get(skeleton_name)
+        file_path = None
+        if skeleton_file_name is not None:
+            file_path = resolver.resolve(skeleton_file_name.removesuffix(".bcf"), ".bcf")
+        plan.skeleton_files[skeleton_name] = file_path
+
+        if file_path is None:
+            plan.missing.append(MissingReference("skeleton", skeleton_name, referenced_by))
+
+    if import_skeletons:
+        plan.skeletons = [
+            SkeletonPlan(skeleton.name, len(skeleton.bones), bcf_file_path)
+            for bcf_file_path, bcf_file in bcf_files
+            for skeleton in bcf_file.skeletons
+        ]
+
+    if import_meshes:
+        for bcf_file_path, bcf_file in bcf_files:
+            for suit in bcf_file.suits:
+                suit_plan = SuitPlan(bcf_file_path, suit, [])
+                for skin in suit.skins:
+                    skeleton_names = list(skin_classifier.classify_skin(skin.skin_name).skeleton_names)
+                    if find_skeleton:
+                        plan_skeleton_file(skeleton_names, suit.name)
+
+                    mesh_file_path = resolver.resolve(skin.skin_name, ".bmf", ".skn", directory=bcf_file_path.parent)
+                    if mesh_file_path is None:
+                        plan.missing.append(MissingReference("mesh", skin.skin_name, suit.name))
+                    elif preloader is not None:
+                        preloader.request(mesh_file_path)
+
+                    texture_files = texture_names.find_skin_texture_files(
+                        plan.texture_index,
+                        skin.skin_name,
+                        preferred_skin_color,
+                        fix_textures=fix_textures,
+                    )
+                    suit_plan.skins.append(SkinPlan(skin.skin_name, mesh_file_path, skeleton_names, texture_files))
+                plan.suits.append(suit_plan)
+
+    if import_animations:
+        for bcf_file_path, bcf_file in bcf_files:
+            for skill in bcf_file.skills:
+                skeleton_names = skin_classifier.classify_skill(skill.skill_name)
+                if skeleton_names is None:
+                    plan.missing.append(MissingReference("skill type", skill.skill_name, skill.skill_name))
+                elif find_skeleton:
+                    plan_skeleton_file(list(skeleton_names), skill.skill_name)
+
+                cfp_file_path = resolver.resolve(skill.animation_name, ".cfp", directory=bcf_file_path.parent)
+                if cfp_file_path is None:
+                    plan.missing.append(MissingReference("animation", skill.animation_name, skill.skill_name))
+                elif preloader is not None:
+                    preloader.request(cfp_file_path, skill.position_count, skill.rotation_count)
+
+                plan.skills.append(
+                    SkillPlan(
+                        bcf_file_path,
+                        skill,
+                        cfp_file_path,
+                        list(skeleton_names or []),
+                        count_keyframes(skill),
+                    ),
+                )
+
+    if read_meshes:
+        for suit_plan in plan.suits:
+            for skin_plan in suit_plan.skins:
+                read_mesh(plan, suit_plan, skin_plan, preloader, fix_textures=fix_textures)
+
+    for suit_plan in plan.suits:
+        for skin_plan in suit_plan.skins:
+            if skin_plan.vertex_count is not None and not skin_plan.texture_files:
+                plan.missing.append(MissingReference("texture", skin_plan.skin_name, suit_plan.suit.name))
+
+    return plan
+
+
+def read_mesh(
+    plan: ImportPlan,
+    suit_plan: SuitPlan,
+    skin_plan: SkinPlan,
+    preloader: preload.Preloader | None,
+    *,
+    fix_textures: bool,
+) -> None:
+    """Read the mesh of a skin to count its vertices and faces and find its default texture if it has no others."""
+    if skin_plan.mesh_file_path is None:
+        return
+
+    try:
+        if preloader is not None:
+            bmf_file = preloader.result(skin_plan.mesh_file_path)
+        else:
+            bmf_file = preload.read_file(skin_plan.mesh_file_path)
+    except FileReadError:
+        plan.missing.append(MissingReference("unreadable mesh", skin_plan.skin_name, suit_plan.suit.name))
+        return
+
+    skin_plan.default_texture_name = bmf_file.default_texture_name
+    skin_plan.vertex_count = len(bmf_file.mesh.vertices)
+    skin_plan.face_count = len(bmf_file.mesh.faces)
+
+    if not skin_plan.texture_files:
+        skin_plan.texture_files = texture_names.find_default_texture_files(
+            plan.texture_index,
+            skin_plan.skin_name,
+            bmf_file.default_texture_name,
+            fix_textures=fix_textures,
+        )
+
+
+def plan_files(
+    file_paths: list[pathlib.Path],
+    file_search_directory: pathlib.Path | None = None,
+    cache_directory: pathlib.Path | None = None,
+    preferred_skin_color: str = "med",
+    *,
+    import_skeletons: bool = True,
+    import_meshes: bool = True,
+    import_animations: bool = True,
+    find_skeleton: bool = True,
+    fix_textures: bool = True,
+    read_meshes: bool = True,
+) -> ImportPlan:
+    """Read the bcf and cmx files and plan their import."""
+    with preload.Preloader() as preloader:
+        bcf_file_paths = [file_path for file_path in file_paths if file_path.suffix in {".cmx", ".bcf"}]
+        for file_path in bcf_file_paths:
+            preloader.request(file_path)
+        bcf_files = [(file_path, preloader.result(file_path)) for file_path in bcf_file_paths]
+
+        resolver, texture_file_list = index_search_directories(
+            file_paths,
+            file_search_directory or file_paths[0].parent,
+            cache_directory,
+        )
+
+        return create_plan(
+            bcf_files,
+            resolver,
+            texture_file_list,
+            preferred_skin_color,
+            preloader,
+            import_skeletons=import_skeletons,
+            import_meshes=import_meshes,
+            import_animations=import_animations,
+            find_skeleton=find_skeleton,
+            fix_textures=fix_textures,
+            read_meshes=read_meshes,
+        )
+
+
+def main(arguments: list[str] | None = None) -> None:
+    """Write the import plan of the files given on the command line as json."""
+    parser = argparse.ArgumentParser(description="Plan the import of The Sims 1 bcf and cmx files.")
+    parser.add_argument("files", nargs="+", type=pathlib.Path)
+    parser.add_argument("--search-directory", type=pathlib.Path)
+    parser.add_argument("--skin-color", choices=["drk", "med", "lgt"], default="med")
+    parser.add_argument("--no-fix-textures", action="store_true")
+    parser.add_argument("--no-read-meshes", action="store_true")
+    parsed_arguments = parser.parse_args(arguments)
+
+    plan = plan_files(
+        parsed_arguments.files,
+        parsed_arguments.search_directory,
+        preferred_skin_color=parsed_arguments.skin_color,
+        fix_textures=not parsed_arguments.no_fix_textures,
+        read_meshes=not parsed_arguments.no_read_meshes,
+    )
+
+    json.dump(plan.to_dict(), sys.stdout, indent=1)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Collect the problems found during a single import."""
+
+import dataclasses
+
+SAMPLE_COUNT = 5
+
+
+@dataclasses.dataclass
+class Problem:
+    """A kind of problem, counted every time it is found, with the messages of the first few occurrences."""
+
+    count: int = 0
+    occurrences: int = 0
+    samples: list[str] = dataclasses.field(default_factory=list)
+
+
+class ImportReport:
+    """The problems found during an import, such as skipped faces, missing textures and unknown bones.
+
+    Only the first few messages of each kind of problem are kept, so the cost of a report does not grow with the size
+    of the import, and each import creates its own report so nothing is kept between imports.
+    """
+
+    def __init__(self, sample_count: int = SAMPLE_COUNT) -> None:
+        """Create an empty report."""
+        self.sample_count = sample_count
+        self.problems: dict[str, Problem] = {}
+
+    def __bool__(self) -> bool:
+        """Return whether any problems were found."""
+        return bool(self.problems)
+
+    def add(self, kind: str, message: str, *args: object, count: int = 1) -> None:
+        """Count a problem, formatting its message with the arguments only if it is kept as a sample."""
+        problem = self.problems.get(kind)
+        if problem is None:
+            problem = self.problems[kind] = Problem()
+
+        problem.count += count
+        problem.occurrences += 1
+        if len(problem.samples) < self.sample_count:
+            problem.samples.append(message % args if args else message)
+
+    def counts(self) -> dict[str, int]:
+        """Return the count of each kind of problem."""
+        return {kind: problem.count for kind, problem in self.problems.items()}
+
+    def lines(self) -> list[str]:
+        """Return the sample messages of each kind of problem and how many more messages there were."""
+        lines = []
+        for kind, problem in self.problems.items():
+            lines += problem.samples
+            omitted = problem.occurrences - len(problem.samples)
+            if omitted > 0:
+                lines.append(f"... and {omitted} more {kind.replace('_', ' ')} problems.")
+        return lines
+
+    def format(self) -> str:
+        """Return the report as text with a line per message."""
+        return "\n".join(self.lines())
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the report as a dictionary that can be written as JSON."""
+        return {kind: dataclasses.asdict(problem) for kind, problem in self.problems.items()}
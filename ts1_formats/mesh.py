@@ -4,7 +4,7 @@ import pathlib
 import struct
 import typing
 
-from . import bmf
+from . import bmf, buffer_io
 from .error import FileReadError
 
 
@@ -23,21 +23,31 @@ def write_mesh(stream: typing.BinaryIO, mesh: bmf.Mesh) -> None:
     bmf.write_mesh(stream, mesh, '>')
 
 
-def read_file(file_path: pathlib.Path) -> bmf.Mesh:
-    """Read a mesh file."""
+def read_bytes(buffer: buffer_io.Buffer) -> bmf.Mesh:
+    """Read a mesh from a buffer."""
     try:
-        with file_path.open(mode='rb') as file:
+        with buffer_io.BufferReader(buffer) as file:
             mesh = read_mesh(file)
 
-            if len(file.read(1)) != 0:
+            if not file.at_end():
                 raise FileReadError
 
             return mesh
 
-    except (OSError, struct.error) as exception:
+    except struct.error as exception:
         raise FileReadError from exception
 
 
+def read_file(file_path: pathlib.Path) -> bmf.Mesh:
+    """Read a mesh file."""
+    try:
+        buffer = file_path.read_bytes()
+    except OSError as exception:
+        raise FileReadError from exception
+
+    return read_bytes(buffer)
+
+
 def write_file(file_path: pathlib.Path, mesh: bmf.Mesh) -> None:
     """Write a mesh file."""
     with file_path.open('wb') as file:
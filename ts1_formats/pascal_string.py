@@ -26,3 +26,31 @@ def write_string_16(stream: typing.BinaryIO, string: str, endianness: str) -> No
     """Write a pascal string with 2 byte length to a stream."""
     stream.write(struct.pack(endianness + 'H', len(string)))
     stream.write(string.encode("windows-1252"))
+
+
+def string_size(string: str) -> int:
+    """Return the size in bytes of a pascal string."""
+    return 1 + len(string)
+
+
+def pack_string(buffer: bytearray, offset: int, string: str) -> int:
+    """Pack a pascal string in to a buffer at the offset and return the offset after it."""
+    encoded = string.encode("windows-1252")
+    struct.pack_into('B', buffer, offset, len(encoded))
+    offset += 1
+    buffer[offset : offset + len(encoded)] = encoded
+    return offset + len(encoded)
+
+
+def string_16_size(string: str) -> int:
+    """Return the size in bytes of a pascal string with 2 byte length."""
+    return 2 + len(string)
+
+
+def pack_string_16(buffer: bytearray, offset: int, string: str, endianness: str) -> int:
+    """Pack a pascal string with 2 byte length in to a buffer at the offset and return the offset after it."""
+    encoded = string.encode("windows-1252")
+    struct.pack_into(endianness + 'H', buffer, offset, len(encoded))
+    offset += 2
+    buffer[offset : offset + len(encoded)] = encoded
+    return offset + len(encoded)
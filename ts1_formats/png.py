@@ -0,0 +1,42 @@
+"""Write textures as PNG files."""
+
+import pathlib
+import struct
+import zlib
+
+import numpy as np
+
+from . import buffer_io, texture
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+COLOR_TYPE_RGB = 2
+COLOR_TYPE_RGBA = 6
+
+
+def pack_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Pack a PNG chunk with its length and CRC."""
+    return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+
+def pack_png(decoded_texture: texture.Texture, compression_level: int = 6) -> bytes:
+    """Pack a texture as 8 bit RGB, or RGBA if it has alpha, PNG bytes."""
+    channel_count = 4 if decoded_texture.has_alpha else 3
+    color_type = COLOR_TYPE_RGBA if decoded_texture.has_alpha else COLOR_TYPE_RGB
+
+    # PNG rows are top first and each starts with a filter type byte, 0 for none.
+    pixels = decoded_texture.pixels[::-1, :, :channel_count]
+    rows = np.zeros((decoded_texture.height, decoded_texture.width * channel_count + 1), dtype=np.uint8)
+    rows[:, 1:] = (np.clip(pixels, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8).reshape(decoded_texture.height, -1)
+
+    header = struct.pack('>IIBBBBB', decoded_texture.width, decoded_texture.height, 8, color_type, 0, 0, 0)
+    return (
+        PNG_SIGNATURE
+        + pack_chunk(b"IHDR", header)
+        + pack_chunk(b"IDAT", zlib.compress(rows.tobytes(), compression_level))
+        + pack_chunk(b"IEND", b"")
+    )
+
+
+def write_file(file_path: pathlib.Path, decoded_texture: texture.Texture, *, atomic: bool = False) -> None:
+    """Write a texture as a PNG file, optionally replacing the file atomically."""
+    buffer_io.write_file(file_path, pack_png(decoded_texture), atomic=atomic)
@@ -0,0 +1,117 @@
+"""Read The Sims files in parallel ahead of their use."""
+
+import concurrent.futures
+import multiprocessing
+import pathlib
+import typing
+
+from . import bcf, bmf, cfp, cmx, skn, texture
+from .error import FileReadError
+
+READERS: dict[str, typing.Callable[..., typing.Any]] = {
+    ".bcf": bcf.read_file,
+    ".bmf": bmf.read_file,
+    ".cfp": cfp.read_file,
+    ".cmx": cmx.read_file,
+    ".skn": skn.read_file,
+    ".bmp": texture.read_file,
+    ".tga": texture.read_file,
+}
+
+
+def read_file(file_path: pathlib.Path, *args: int) -> typing.Any:  # noqa: ANN401
+    """Read a file with the reader for its suffix."""
+    reader = READERS.get(file_path.suffix.lower())
+    if reader is None:
+        raise FileReadError
+    return reader(file_path, *args)
+
+
+# Run by exec in each worker process, as the initializer can't be a function of this package. It registers the
+# packages containing this one as bare packages, so unpickling the reader functions doesn't import their __init__
+# modules, such as the Blender add-on's, which imports bpy.
+WORKER_INITIALIZER = """
+import sys
+import types
+
+for package_name, package_path in parent_packages:
+    if package_name not in sys.modules:
+        package = types.ModuleType(package_name)
+        package.__path__ = [package_path]
+        sys.modules[package_name] = package
+"""
+
+
+def list_parent_packages() -> list[tuple[str, str]]:
+    """List the names and directories of the packages containing this package, outermost first."""
+    package_names = __name__.split(".")[:-2]
+    package_directories = pathlib.Path(__file__).parents[1 : len(package_names) + 1]
+    return [
+        (".".join(package_names[: index + 1]), str(package_directory))
+        for index, package_directory in enumerate(reversed(package_directories))
+    ]
+
+
+class Preloader:
+    """Read files in a thread or process pool as soon as they are requested and return them when they are needed.
+
+    If the mode is 'NONE' or the pool stops working, files are read when their results are needed.
+    """
+
+    def __init__(self, mode: str = 'THREADS', max_workers: int | None = None) -> None:
+        """Create a preloader with a thread pool, a process pool or no pool."""
+        self.executor: concurrent.futures.Executor | None = None
+        match mode:
+            case 'THREADS':
+                self.executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+            case 'PROCESSES':
+                self.executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=exec,
+                    initargs=(WORKER_INITIALIZER, {"parent_packages": list_parent_packages()}),
+                )
+        self.futures: dict[tuple[pathlib.Path, tuple[int, ...]], concurrent.futures.Future] = {}
+
+    def __enter__(self) -> typing.Self:
+        """Enter the context of the preloader."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Cancel any outstanding reads and shut down the pool."""
+        self.shutdown()
+
+    def request(self, file_path: pathlib.Path, *args: int) -> None:
+        """Start reading a file, unless it has already been requested."""
+        key = (file_path, args)
+        if self.executor is None or key in self.futures:
+            return
+
+        try:
+            self.futures[key] = self.executor.submit(read_file, file_path, *args)
+        except (RuntimeError, concurrent.futures.BrokenExecutor):
+            self.shutdown()
+
+    def result(self, file_path: pathlib.Path, *args: int) -> typing.Any:  # noqa: ANN401
+        """Return a read file, waiting for it if it is still being read, or read it now if it was not requested."""
+        future = self.futures.get((file_path, args))
+        if future is not None:
+            try:
+                return future.result()
+            except (concurrent.futures.BrokenExecutor, concurrent.futures.CancelledError):
+                self.shutdown()
+        return read_file(file_path, *args)
+
+    def take(self, file_path: pathlib.Path, *args: int) -> typing.Any:  # noqa: ANN401
+        """Return a read file like result, and release it, for files that are only needed once."""
+        try:
+            return self.result(file_path, *args)
+        finally:
+            self.futures.pop((file_path, args), None)
+
+    def shutdown(self) -> None:
+        """Cancel any outstanding reads and shut down the pool, reading any later requests when they are needed."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.futures = {key: future for key, future in self.futures.items() if future.done() and not future.cancelled()}
@@ -0,0 +1,126 @@
+"""Measure the time spent in each phase of an import."""
+
+import collections.abc
+import contextlib
+import cProfile
+import dataclasses
+import datetime as dt
+import json
+import pathlib
+import pstats
+import time
+
+from . import buffer_io
+
+FUNCTION_COUNT = 40
+
+
+@dataclasses.dataclass
+class Span:
+    """The total time spent in a named phase and the number of times it was entered."""
+
+    duration: float = 0.0
+    count: int = 0
+
+
+class Profiler:
+    """Record named timing spans, and optionally a cProfile of the code run between start and stop.
+
+    A disabled profiler records nothing, so it can always be passed to the import functions.
+    """
+
+    def __init__(self, name: str, *, enabled: bool = True, profile_functions: bool = False) -> None:
+        """Create a profiler for an import."""
+        self.name = name
+        self.enabled = enabled
+        self.spans: dict[str, Span] = {}
+        self.duration = 0.0
+        self.start_time: float | None = None
+        self.function_profile = cProfile.Profile() if enabled and profile_functions else None
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> collections.abc.Generator[None, None, None]:
+        """Add the time spent in the context to the named span."""
+        if not self.enabled:
+            yield
+            return
+
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            span = self.spans.get(name)
+            if span is None:
+                span = self.spans[name] = Span()
+            span.duration += time.perf_counter() - start_time
+            span.count += 1
+
+    def start(self) -> None:
+        """Start measuring the total duration and capturing the cProfile, if enabled."""
+        if not self.enabled or self.start_time is not None:
+            return
+
+        self.start_time = time.perf_counter()
+        if self.function_profile is not None:
+            try:
+                self.function_profile.enable()
+            except ValueError:
+                # Another profiler is already active.
+                self.function_profile = None
+
+    def stop(self) -> None:
+        """Stop measuring, so time spent outside the import, such as between modal timer events, is not counted."""
+        if self.start_time is None:
+            return
+
+        if self.function_profile is not None:
+            self.function_profile.disable()
+        self.duration += time.perf_counter() - self.start_time
+        self.start_time = None
+
+    def function_summary(self) -> list[dict[str, object]]:
+        """Return the functions with the highest cumulative time in the cProfile."""
+        if self.function_profile is None:
+            return []
+
+        try:
+            stats = pstats.Stats(self.function_profile).stats  # type: ignore[attr-defined]
+        except TypeError:
+            # Nothing was captured.
+            return []
+
+        functions = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:FUNCTION_COUNT]
+        return [
+            {
+                "function": f"{file_name}:{line_number}({function_name})",
+                "calls": call_count,
+                "total_time": total_time,
+                "cumulative_time": cumulative_time,
+            }
+            for (file_name, line_number, function_name), (_, call_count, total_time, cumulative_time, _) in functions
+        ]
+
+    def summary(self) -> dict[str, object]:
+        """Return the recorded durations as a dictionary that can be written as JSON."""
+        return {
+            "name": self.name,
+            "duration": self.duration,
+            "spans": {name: dataclasses.asdict(span) for name, span in self.spans.items()},
+            "functions": self.function_summary(),
+        }
+
+    def format_summary(self) -> str:
+        """Return a single line summary of the recorded durations."""
+        spans = ", ".join(
+            f"{name} {span.duration:.2f}s" + (f" ({span.count})" if span.count > 1 else "")
+            for name, span in self.spans.items()
+        )
+        return f"{self.name} took {self.duration:.2f}s: {spans}" if spans else f"{self.name} took {self.duration:.2f}s"
+
+    def write_summary(self, directory: pathlib.Path) -> pathlib.Path:
+        """Write the summary to a JSON file named after the profiler and the current time and return its path."""
+        time_stamp = dt.datetime.now(tz=dt.UTC).strftime("%Y%m%d-%H%M%S-%f")
+        file_path = directory / f"{self.name}-{time_stamp}.json"
+        directory.mkdir(parents=True, exist_ok=True)
+        buffer_io.write_file(file_path, json.dumps(self.summary(), indent=1).encode("utf-8"), atomic=True)
+        return file_path
@@ -1,25 +1,42 @@
 """Read and write The Sims property lists."""
 
 import dataclasses
+import functools
 import struct
+import sys
 import typing
 
 from . import pascal_string
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Property:
-    """A property."""
+    """A property.
+
+    Properties are immutable so that identical properties can be shared, see intern_property.
+    """
 
     name: str
     value: str
 
 
+PROPERTY_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=PROPERTY_CACHE_SIZE)
+def intern_property(name: str, value: str) -> Property:
+    """Return the shared property with the given name and value, creating it if it isn't cached.
+
+    Only the most recently used properties are kept, so reading files for a whole session doesn't grow the cache.
+    """
+    return Property(sys.intern(name), sys.intern(value))
+
+
 def read_properties(file: typing.BinaryIO, endianness: str) -> list[Property]:
     """Read properties from a stream."""
     count = struct.unpack(endianness + 'I', file.read(4))[0]
     return [
-        Property(
+        intern_property(
             pascal_string.read_string(file),
             pascal_string.read_string(file),
         )
@@ -27,12 +44,19 @@ def read_properties(file: typing.BinaryIO, endianness: str) -> list[Property]:
     ]
 
 
-def write_properties(file: typing.BinaryIO, properties: list[Property], endianness: str) -> None:
-    """Write properties to a stream."""
-    file.write(struct.pack(endianness + 'I', len(properties)))
+def properties_size(properties: list[Property]) -> int:
+    """Return the size in bytes of packed properties."""
+    return 4 + sum(pascal_string.string_size(prop.name) + pascal_string.string_size(prop.value) for prop in properties)
+
+
+def pack_properties(buffer: bytearray, offset: int, properties: list[Property], endianness: str) -> int:
+    """Pack properties in to a buffer at the offset and return the offset after them."""
+    struct.pack_into(endianness + 'I', buffer, offset, len(properties))
+    offset += 4
     for prop in properties:
-        pascal_string.write_string(file, prop.name)
-        pascal_string.write_string(file, prop.value)
+        offset = pascal_string.pack_string(buffer, offset, prop.name)
+        offset = pascal_string.pack_string(buffer, offset, prop.value)
+    return offset
 
 
 @dataclasses.dataclass
@@ -53,11 +77,18 @@ def read_property_lists(file: typing.BinaryIO, endianness: str) -> list[Property
     ]
 
 
-def write_property_lists(file: typing.BinaryIO, property_lists: list[PropertyList], endianness: str) -> None:
-    """Write property lists to a stream."""
-    file.write(struct.pack(endianness + 'I', len(property_lists)))
+def property_lists_size(property_lists: list[PropertyList]) -> int:
+    """Return the size in bytes of packed property lists."""
+    return 4 + sum(properties_size(property_list.properties) for property_list in property_lists)
+
+
+def pack_property_lists(buffer: bytearray, offset: int, property_lists: list[PropertyList], endianness: str) -> int:
+    """Pack property lists in to a buffer at the offset and return the offset after them."""
+    struct.pack_into(endianness + 'I', buffer, offset, len(property_lists))
+    offset += 4
     for property_list in property_lists:
-        write_properties(file, property_list.properties, endianness)
+        offset = pack_properties(buffer, offset, property_list.properties, endianness)
+    return offset
 
 
 @dataclasses.dataclass
@@ -66,3 +97,8 @@ class TimeProperty:
 
     time: int
     events: list[Property]
+
+
+def clear_interned_properties() -> None:
+    """Release all the shared properties."""
+    intern_property.cache_clear()
@@ -0,0 +1,51 @@
+"""Cache downscaled PNG copies of texture files, for building large scenes quickly."""
+
+import collections.abc
+import hashlib
+import pathlib
+
+from . import png, texture
+from .error import FileReadError
+
+PROXY_SCALE = 4
+
+
+def get_proxy_file_path(file_path: pathlib.Path, cache_directory: pathlib.Path, scale: int) -> pathlib.Path:
+    """Get the path of the proxy of a texture file, named after the resolved path and modified time of the file."""
+    try:
+        stat = file_path.stat()
+    except OSError as exception:
+        raise FileReadError from exception
+
+    key = f"{file_path.resolve().as_posix()}|{stat.st_mtime_ns}|{stat.st_size}|{scale}"
+    digest = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()[:16]
+    return cache_directory / f"{file_path.stem}-{digest}.png"
+
+
+def is_proxy_cached(file_path: pathlib.Path, cache_directory: pathlib.Path, scale: int) -> bool:
+    """Return whether the proxy of a texture file is already cached."""
+    try:
+        return get_proxy_file_path(file_path, cache_directory, scale).is_file()
+    except FileReadError:
+        return False
+
+
+def get_proxy(
+    file_path: pathlib.Path,
+    cache_directory: pathlib.Path,
+    scale: int = PROXY_SCALE,
+    read_texture: collections.abc.Callable[[pathlib.Path], texture.Texture] = texture.read_file,
+) -> pathlib.Path:
+    """Return the path of the proxy of a texture file, decoding and downscaling the file if it isn't cached."""
+    proxy_file_path = get_proxy_file_path(file_path, cache_directory, scale)
+    if proxy_file_path.is_file():
+        return proxy_file_path
+
+    decoded_texture = read_texture(file_path)
+    try:
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        png.write_file(proxy_file_path, texture.downscale(decoded_texture, scale), atomic=True)
+    except OSError as exception:
+        raise FileReadError from exception
+
+    return proxy_file_path
@@ -4,7 +4,7 @@ import pathlib
 import struct
 import typing
 
-from . import pascal_string, skeleton
+from . import buffer_io, pascal_string, skeleton
 from .error import FileReadError
 
 
@@ -22,16 +22,26 @@ def read_skel(stream: typing.BinaryIO) -> skeleton.Skeleton:
     return skeleton.Skeleton(name, bones)
 
 
-def read_file(file_path: pathlib.Path) -> skeleton.Skeleton:
-    """Read a skel file."""
+def read_bytes(buffer: buffer_io.Buffer) -> skeleton.Skeleton:
+    """Read a skel from a buffer."""
     try:
-        with file_path.open(mode='rb') as file:
+        with buffer_io.BufferReader(buffer) as file:
             skel = read_skel(file)
 
-            if len(file.read(1)) != 0:
+            if not file.at_end():
                 raise FileReadError
 
             return skel
 
-    except (OSError, struct.error) as exception:
+    except struct.error as exception:
         raise FileReadError from exception
+
+
+def read_file(file_path: pathlib.Path) -> skeleton.Skeleton:
+    """Read a skel file."""
+    try:
+        buffer = file_path.read_bytes()
+    except OSError as exception:
+        raise FileReadError from exception
+
+    return read_bytes(buffer)
@@ -55,20 +55,50 @@ def read_bones(stream: typing.BinaryIO, endianness: str) -> list[Bone]:
     return [read_bone(stream, endianness, skel_format=False) for _ in range(count)]
 
 
+BONE_FIELDS_FORMAT = '3f4f3I2f'
+BONE_FIELDS_SIZE = struct.calcsize('<' + BONE_FIELDS_FORMAT)
+
+
+def bones_size(bones: list[Bone]) -> int:
+    """Return the size in bytes of packed bones."""
+    return 4 + sum(
+        pascal_string.string_size(bone.name)
+        + pascal_string.string_size(bone.parent)
+        + property_list.property_lists_size(bone.property_lists)
+        + BONE_FIELDS_SIZE
+        for bone in bones
+    )
+
+
+def pack_bones(buffer: bytearray, offset: int, bones: list[Bone], endianness: str) -> int:
+    """Pack bones in to a buffer at the offset and return the offset after them."""
+    struct.pack_into(endianness + 'I', buffer, offset, len(bones))
+    offset += 4
+    for bone in bones:
+        offset = pascal_string.pack_string(buffer, offset, bone.name)
+        offset = pascal_string.pack_string(buffer, offset, bone.parent)
+        offset = property_list.pack_property_lists(buffer, offset, bone.property_lists, endianness)
+        struct.pack_into(
+            endianness + BONE_FIELDS_FORMAT,
+            buffer,
+            offset,
+            *bone.position,
+            *bone.rotation,
+            bone.translate,
+            bone.rotate,
+            bone.blend,
+            bone.wiggle_value,
+            bone.wiggle_power,
+        )
+        offset += BONE_FIELDS_SIZE
+    return offset
+
+
 def write_bones(stream: typing.BinaryIO, bones: list[Bone], endianness: str) -> None:
     """Write bones to a stream."""
-    stream.write(struct.pack(endianness + 'I', len(bones)))
-    for bone in bones:
-        pascal_string.write_string(stream, bone.name)
-        pascal_string.write_string(stream, bone.parent)
-        property_list.write_property_lists(stream, bone.property_lists, endianness)
-        stream.write(struct.pack(endianness + '3f', *bone.position))
-        stream.write(struct.pack(endianness + '4f', *bone.rotation))
-        stream.write(struct.pack(endianness + 'I', bone.translate))
-        stream.write(struct.pack(endianness + 'I', bone.rotate))
-        stream.write(struct.pack(endianness + 'I', bone.blend))
-        stream.write(struct.pack(endianness + 'f', bone.wiggle_value))
-        stream.write(struct.pack(endianness + 'f', bone.wiggle_power))
+    buffer = bytearray(bones_size(bones))
+    pack_bones(buffer, 0, bones, endianness)
+    stream.write(buffer)
 
 
 @dataclasses.dataclass
@@ -91,9 +121,23 @@ def read_skeletons(stream: typing.BinaryIO, endianness: str) -> list[Skeleton]:
     ]
 
 
+def skeletons_size(skeletons: list[Skeleton]) -> int:
+    """Return the size in bytes of packed skeletons."""
+    return 4 + sum(pascal_string.string_size(skeleton.name) + bones_size(skeleton.bones) for skeleton in skeletons)
+
+
+def pack_skeletons(buffer: bytearray, offset: int, skeletons: list[Skeleton], endianness: str) -> int:
+    """Pack skeletons in to a buffer at the offset and return the offset after them."""
+    struct.pack_into(endianness + 'I', buffer, offset, len(skeletons))
+    offset += 4
+    for skeleton in skeletons:
+        offset = pascal_string.pack_string(buffer, offset, skeleton.name)
+        offset = pack_bones(buffer, offset, skeleton.bones, endianness)
+    return offset
+
+
 def write_skeletons(stream: typing.BinaryIO, skeletons: list[Skeleton], endianness: str) -> None:
     """Write skeletons to a stream."""
-    stream.write(struct.pack(endianness + 'I', len(skeletons)))
-    for skeleton in skeletons:
-        pascal_string.write_string(stream, skeleton.name)
-        write_bones(stream, skeleton.bones, endianness)
+    buffer = bytearray(skeletons_size(skeletons))
+    pack_skeletons(buffer, 0, skeletons, endianness)
+    stream.write(buffer)
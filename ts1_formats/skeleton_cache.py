@@ -0,0 +1,40 @@
+"""Cache the skeletons read from The Sims files for the session."""
+
+import pathlib
+
+from . import bcf, cmx
+from .error import FileReadError
+from .skeleton import Skeleton
+
+cached_skeletons: dict[pathlib.Path, tuple[int, list[Skeleton]]] = {}
+
+
+def source_key(file_path: pathlib.Path) -> str:
+    """Return a key that changes when the file is moved or modified."""
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except OSError as exception:
+        raise FileReadError from exception
+    return f"{file_path.resolve().as_posix()}:{mtime_ns}"
+
+
+def read_skeletons(file_path: pathlib.Path) -> list[Skeleton]:
+    """Read the skeletons in a bcf or cmx file, or return them from the cache if the file has not been modified."""
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except OSError as exception:
+        raise FileReadError from exception
+
+    cached = cached_skeletons.get(file_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    reader = cmx.read_file if file_path.suffix.lower() == ".cmx" else bcf.read_file
+    skeletons = reader(file_path).skeletons
+    cached_skeletons[file_path] = (mtime_ns, skeletons)
+    return skeletons
+
+
+def clear() -> None:
+    """Remove all the cached skeletons."""
+    cached_skeletons.clear()
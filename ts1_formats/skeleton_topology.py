@@ -0,0 +1,142 @@
+"""Skeleton topology and bind pose matrices for The Sims skeletons."""
+
+import dataclasses
+
+import numpy as np
+
+from . import bcf, bmf, error, skeleton
+
+ROOT_PARENT_NAME = "NULL"
+NO_PARENT = -1
+UNKNOWN_BONE = -1
+
+
+@dataclasses.dataclass(eq=False)
+class SkeletonTopology:
+    """Resolved bone hierarchy and bind pose matrices of a skeleton.
+
+    Matrices are 4x4 column vector matrices in the coordinate space of the files.
+    """
+
+    bone_names: list[str]
+    bone_index_map: dict[str, int]
+    parent_indices: np.ndarray
+    depths: np.ndarray
+    local_matrices: np.ndarray
+    world_matrices: np.ndarray
+
+
+def resolve_parent_indices(bones: list[skeleton.Bone]) -> tuple[dict[str, int], np.ndarray]:
+    """Map the bone names to indices and resolve the parent of every bone to an index.
+
+    Every parent must appear before its children.
+    """
+    bone_index_map: dict[str, int] = {}
+    parent_indices = np.empty(len(bones), dtype=np.int32)
+
+    for index, bone in enumerate(bones):
+        if bone.name in bone_index_map:
+            error_message = f"Duplicate bone {bone.name}"
+            raise error.SkeletonTopologyError(error_message)
+
+        if bone.parent == ROOT_PARENT_NAME:
+            parent_indices[index] = NO_PARENT
+        else:
+            parent_index = bone_index_map.get(bone.parent)
+            if parent_index is None:
+                error_message = f"Parent {bone.parent} of bone {bone.name} is missing or comes after it"
+                raise error.SkeletonTopologyError(error_message)
+            parent_indices[index] = parent_index
+
+        bone_index_map[bone.name] = index
+
+    return bone_index_map, parent_indices
+
+
+def calculate_depths(parent_indices: np.ndarray) -> np.ndarray:
+    """Calculate the depth of every bone in the hierarchy from topologically ordered parent indices."""
+    depths = np.zeros(len(parent_indices), dtype=np.int32)
+    for index, parent_index in enumerate(parent_indices.tolist()):
+        if parent_index != NO_PARENT:
+            depths[index] = depths[parent_index] + 1
+    return depths
+
+
+def quaternions_to_matrices(quaternions: np.ndarray) -> np.ndarray:
+    """Convert an Nx4 array of x, y, z, w quaternions to an Nx3x3 array of rotation matrices."""
+    quaternions = quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True)
+    x, y, z, w = quaternions.T
+
+    matrices = np.empty((len(quaternions), 3, 3), dtype=np.float64)
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y - z * w)
+    matrices[:, 0, 2] = 2.0 * (x * z + y * w)
+    matrices[:, 1, 0] = 2.0 * (x * y + z * w)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[:, 1, 2] = 2.0 * (y * z - x * w)
+    matrices[:, 2, 0] = 2.0 * (x * z - y * w)
+    matrices[:, 2, 1] = 2.0 * (y * z + x * w)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return matrices
+
+
+def calculate_local_matrices(bones: list[skeleton.Bone]) -> np.ndarray:
+    """Calculate the local bind pose matrix, translation then rotation, of every bone."""
+    positions = np.array([bone.position for bone in bones], dtype=np.float64).reshape(-1, 3)
+    rotations = np.array([bone.rotation for bone in bones], dtype=np.float64).reshape(-1, 4)
+
+    matrices = np.zeros((len(bones), 4, 4), dtype=np.float64)
+    # The files store the inverse rotation of the bones, so the matrices of the conjugate quaternions are used.
+    matrices[:, :3, :3] = quaternions_to_matrices(rotations).transpose(0, 2, 1)
+    matrices[:, :3, 3] = positions
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def calculate_world_matrices(parent_indices: np.ndarray, depths: np.ndarray, local_matrices: np.ndarray) -> np.ndarray:
+    """Calculate the world bind pose matrix of every bone, one hierarchy level at a time."""
+    world_matrices = local_matrices.copy()
+    if len(depths) == 0:
+        return world_matrices
+
+    for depth in range(1, int(depths.max()) + 1):
+        indices = np.flatnonzero(depths == depth)
+        world_matrices[indices] = world_matrices[parent_indices[indices]] @ local_matrices[indices]
+
+    return world_matrices
+
+
+def create_topology(skel: skeleton.Skeleton) -> SkeletonTopology:
+    """Create the topology of a skeleton."""
+    bone_index_map, parent_indices = resolve_parent_indices(skel.bones)
+    depths = calculate_depths(parent_indices)
+    local_matrices = calculate_local_matrices(skel.bones)
+    world_matrices = calculate_world_matrices(parent_indices, depths, local_matrices)
+
+    return SkeletonTopology(
+        [bone.name for bone in skel.bones],
+        bone_index_map,
+        parent_indices,
+        depths,
+        local_matrices,
+        world_matrices,
+    )
+
+
+def resolve_bone_names(topology: SkeletonTopology, bone_names: list[str]) -> np.ndarray:
+    """Resolve bone names to skeleton bone indices, unknown bones resolve to UNKNOWN_BONE."""
+    return np.fromiter(
+        (topology.bone_index_map.get(bone_name, UNKNOWN_BONE) for bone_name in bone_names),
+        dtype=np.int32,
+        count=len(bone_names),
+    )
+
+
+def resolve_motion_bones(topology: SkeletonTopology, motions: list[bcf.Motion]) -> np.ndarray:
+    """Resolve the bones of BCF motions to skeleton bone indices."""
+    return resolve_bone_names(topology, [motion.bone_name for motion in motions])
+
+
+def resolve_mesh_bones(topology: SkeletonTopology, mesh: bmf.Mesh) -> np.ndarray:
+    """Resolve the bones of a mesh to skeleton bone indices."""
+    return resolve_bone_names(topology, mesh.bones)
@@ -0,0 +1,139 @@
+"""Classify The Sims skins and skills by their names."""
+
+import dataclasses
+import functools
+import re
+
+GNOME_PATTERN = re.compile("xskin-SpellboundMAFat_Gnome-.*-GNOMEBODY.*")
+
+# The rules are in priority order, the first one that matches the lowercase skin name is used.
+SKELETON_RULES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("adult_head", "xskin-c\\d{3}(f|m|u)a.*-head", ("adult",)),
+    ("adult_body", "xskin-(b|f|h|l|s|w)\\d{3}(f|m|u)a(skn|fit|fat|chd).*-body.*", ("adult",)),
+    ("child_head", "xskin-c\\d{3}(f|m|u)c.*-head", ("child",)),
+    ("child_body", "xskin-(b|f|h|l|s|w)\\d{3}(f|m|u)c(skn|fit|fat|chd|).*-body.*", ("child",)),
+    ("adult_npc_head", "xskin-c((?!\\d{3}).).*(f|m|u)a(skn|fit|fat|)_.*-head-.*", ("adult",)),
+    ("child_npc_head", "xskin-c((?!\\d{3}).).*(f|m|u)cchd_.*-head-.*", ("child",)),
+    ("adult_npc_body", "xskin-((?!\\d{3}).).*(f|m|u)a(skn|fit|fat)_.*-pelvis-.*", ("adult",)),
+    ("child_npc_body", "xskin-.*chd_.*-pelvis-.*", ("child",)),
+    ("adult_costume", "xskin-ct-.*(f|m)a-.*", ("adult",)),
+    ("child_costume", "xskin-ct-.*(f|m)c-.*", ("child",)),
+    ("unleashed_npc", "xskin-b((?!\\d{3}).).*_01-pelvis-body$", ("adult",)),
+    ("cat", "xskin-b\\d{3}(c|k)at.*", ("kat",)),
+    ("dog", "xskin-b\\d{3}dog_.*", ("dog",)),
+    ("skunk_and_raccoon", "xskin-.*-dogbody", ("dog",)),
+    ("dragon", "xskin-b\\d{3}dragon_.*", ("kat",)),
+    ("effects", "xskin-effects1-.*", ("effects1",)),
+    ("cat_accessory", "xskin-cat.*-cat-", ("kat",)),
+    ("dog_accessory", "xskin-dog.*-dog-", ("dog",)),
+)
+
+UNKNOWN_SKELETON_NAMES = ("adult", "child")
+
+# The rules are in priority order, the first one that matches the lowercase skin name is used.
+TEXTURE_FAMILY_RULES: tuple[tuple[str, str, str], ...] = (
+    ("head", "xskin-c[a-zA-Z0-9]{3}(f|m|u)(a|c)_.*-head-head$", "head"),
+    ("body", "xskin-(b|f|h|l|s|w)[a-zA-Z0-9]{3}(f|m|u)(a|c)(skn|fit|fat|chd).*-pelvis-body$", "body"),
+    ("hand", "xskin-h(u|f|m)(l|r)(c|o|p)-(l|r)_hand-(fist|hand|point)(f|m|c)(l|r)$", "hand"),
+    ("nude_body", "xskin-n(f|m|u)(skn|fit|fat|chd)_01-pelvis-.*body.*", "nude_body"),
+    ("npc_head", "xskin-c((?!\\d{3}).).*(f|m|u)(a|c)_.*-head-head$", "npc_head"),
+    ("sex_npc_head", "xskin-c((?!\\d{3}).).*(f|m|u)_.*-head-head$", "npc_head"),
+    ("weight_npc_head", "xskin-c((?!\\d{3}).).*(f|m|u)(skn|fit|fat)_.*-head-head$", "npc_head"),
+    ("age_weight_npc_head", "xskin-c((?!\\d{3}).).*(f|m|u)(a|c)(skn|fit|fat)_.*-head-head$", "age_weight_npc_head"),
+    ("npc_body", "xskin-((?!\\d{3}).).*(f|m|u)(a|c|)(skn|fit|fat|chd)_.*-pelvis-body$", "npc_body"),
+    ("unleashed_npc_body", "xskin-b((?!\\d{3}).).*_01-pelvis-body$", "unleashed_npc_body"),
+    ("costume_body", "xskin-ct-.*-pelvis-body$", "costume_body"),
+)
+
+
+def compile_rules(rules: tuple[tuple[str, str, object], ...]) -> re.Pattern:
+    """Compile rules in to a single alternation where the name of the matched rule is the last group."""
+    return re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in rules))
+
+
+SKELETON_PATTERN = compile_rules(SKELETON_RULES)
+SKELETON_NAMES = {name: skeleton_names for name, _, skeleton_names in SKELETON_RULES}
+
+TEXTURE_FAMILY_PATTERN = compile_rules(TEXTURE_FAMILY_RULES)
+TEXTURE_FAMILIES = {name: texture_family for name, _, texture_family in TEXTURE_FAMILY_RULES}
+
+# Patterns that find the sex, age and body type codes in the lowercase skin name of each texture family.
+TEXTURE_FAMILY_DETAIL_PATTERNS = {
+    "head": re.compile("xskin-c[a-z0-9]{3}(?P<sex>[fmu])(?P<age>[ac])_"),
+    "body": re.compile("xskin-[bfhlsw][a-z0-9]{3}(?P<sex>[fmu])(?P<age>[ac])(?P<body_type>skn|fit|fat|chd)"),
+    "hand": re.compile("xskin-h(?P<sex>[ufm])"),
+    "nude_body": re.compile("xskin-n(?P<sex>[fmu])(?P<body_type>skn|fit|fat|chd)_"),
+    "npc_head": re.compile("xskin-c.*(?P<sex>[fmu])(?P<age>[ac]?)(?P<body_type>skn|fit|fat|)_.*-head-head$"),
+    "age_weight_npc_head": re.compile("xskin-c.*(?P<sex>[fmu])(?P<age>[ac])(?P<body_type>skn|fit|fat)_.*-head-head$"),
+    "npc_body": re.compile("xskin-.*?(?P<sex>[fmu])(?P<age>[ac]?)(?P<body_type>skn|fit|fat|chd)_"),
+}
+
+SKELETON_AGES = {
+    ("adult",): "a",
+    ("child",): "c",
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class SkinClass:
+    """The classification of a skin name.
+
+    Sex, age and body type are the codes used in the skin and texture names, f/m/u, a/c and skn/fit/fat/chd.
+    """
+
+    category: str | None
+    texture_family: str | None
+    sex: str | None
+    age: str | None
+    body_type: str | None
+    skeleton_names: tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=4096)
+def classify_skin(skin_name: str) -> SkinClass:
+    """Classify a skin by its name."""
+    lower_skin_name = skin_name.lower()
+
+    if GNOME_PATTERN.match(skin_name):
+        category = "gnome"
+        skeleton_names: tuple[str, ...] = ("kat",)
+    else:
+        skeleton_match = SKELETON_PATTERN.match(lower_skin_name)
+        category = skeleton_match.lastgroup if skeleton_match else None
+        skeleton_names = SKELETON_NAMES[category] if category else UNKNOWN_SKELETON_NAMES
+
+    texture_family_match = TEXTURE_FAMILY_PATTERN.match(lower_skin_name)
+    texture_family = TEXTURE_FAMILIES[texture_family_match.lastgroup] if texture_family_match else None
+
+    details: dict[str, str] = {}
+    detail_pattern = TEXTURE_FAMILY_DETAIL_PATTERNS.get(texture_family) if texture_family else None
+    detail_match = detail_pattern.match(lower_skin_name) if detail_pattern else None
+    if detail_match is not None:
+        details = {name: value for name, value in detail_match.groupdict().items() if value}
+
+    return SkinClass(
+        category,
+        texture_family,
+        details.get("sex"),
+        details.get("age", SKELETON_AGES.get(skeleton_names)),
+        details.get("body_type"),
+        skeleton_names,
+    )
+
+
+SKILL_SKELETON_NAMES = {
+    "a2": ("adult",),
+    "c2": ("child",),
+    "k2": ("kat",),
+    "d2": ("dog",),
+    "f2": ("kat",),
+    "effects-": ("effects1",),
+}
+
+
+def classify_skill(skill_name: str) -> tuple[str, ...] | None:
+    """Return the names of the skeletons a skill can be applied to, or None if the skill type is unknown."""
+    for prefix, skeleton_names in SKILL_SKELETON_NAMES.items():
+        if skill_name.startswith(prefix):
+            return skeleton_names
+    return None
@@ -0,0 +1,163 @@
+"""Skin The Sims meshes to the matrices of their bone bindings."""
+
+import dataclasses
+
+import numpy as np
+
+from . import bmf, error, skeleton_topology
+
+BLEND_WEIGHT_SCALE = 2.0**-15
+UNBOUND = -1
+
+
+@dataclasses.dataclass(eq=False)
+class Blends:
+    """The blends of a mesh, in the order they are applied.
+
+    Each blended vertex keeps the original weight for the binding whose vertex range contains it and gets the blend
+    weight for the binding it is blended with.
+    """
+
+    vertex_indices: np.ndarray
+    original_bindings: np.ndarray
+    bindings: np.ndarray
+    original_weights: np.ndarray
+    weights: np.ndarray
+
+
+@dataclasses.dataclass(eq=False)
+class SkinnedMesh:
+    """The skinned vertex positions and normals of a mesh, ordered by bone binding.
+
+    The binding of each vertex and the blends applied are kept for weighting the vertices.
+    """
+
+    positions: np.ndarray
+    normals: np.ndarray
+    vertex_bindings: np.ndarray
+    blends: Blends
+
+
+def resolve_vertex_bindings(mesh: bmf.Mesh) -> np.ndarray:
+    """Map each vertex index of the mesh to the binding whose vertex range contains it, or UNBOUND.
+
+    Bindings normally cover the vertices in order, in which case the map is built from the cumulative binding vertex
+    counts. Otherwise later bindings take precedence over earlier ones.
+    """
+    starts = np.array([bone_binding.vertex_index for bone_binding in mesh.bone_bindings], dtype=np.int64)
+    counts = np.array([bone_binding.vertex_count for bone_binding in mesh.bone_bindings], dtype=np.int64)
+    vertex_bindings = np.full(len(mesh.vertices), UNBOUND, dtype=np.int64)
+
+    if np.array_equal(starts, np.cumsum(counts) - counts):
+        bound_vertex_bindings = np.repeat(np.arange(len(counts)), counts)[: len(vertex_bindings)]
+        vertex_bindings[: len(bound_vertex_bindings)] = bound_vertex_bindings
+        return vertex_bindings
+
+    for binding_index, (start, count) in enumerate(zip(starts.tolist(), counts.tolist(), strict=True)):
+        vertex_bindings[start : start + count] = binding_index
+    return vertex_bindings
+
+
+def transform_points(matrix: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Transform points by a 4x4 column vector matrix."""
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def transform_directions(matrix: np.ndarray, directions: np.ndarray) -> np.ndarray:
+    """Rotate directions by the rotation of a 4x4 column vector matrix, ignoring its scale and translation."""
+    rotation = matrix[:3, :3] / np.linalg.norm(matrix[:3, :3], axis=0)
+    return directions @ rotation.T
+
+
+def transform_bindings(mesh: bmf.Mesh, binding_matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Transform the vertices of each binding by its matrix in one multiply per binding.
+
+    The positions, normals and binding index of the vertices are returned, ordered by binding.
+    """
+    vertices = np.array([vertex.position + vertex.normal for vertex in mesh.vertices], dtype=np.float64)
+    vertices = vertices.reshape(-1, 6)
+
+    positions = [np.zeros((0, 3))]
+    normals = [np.zeros((0, 3))]
+    vertex_bindings = [np.zeros(0, dtype=np.int64)]
+    for binding_index, bone_binding in enumerate(mesh.bone_bindings):
+        binding_vertices = vertices[bone_binding.vertex_index : bone_binding.vertex_index + bone_binding.vertex_count]
+        positions.append(transform_points(binding_matrices[binding_index], binding_vertices[:, :3]))
+        normals.append(transform_directions(binding_matrices[binding_index], binding_vertices[:, 3:]))
+        vertex_bindings.append(np.full(len(binding_vertices), binding_index, dtype=np.int64))
+
+    return np.concatenate(positions), np.concatenate(normals), np.concatenate(vertex_bindings)
+
+
+def blend_vertices(mesh: bmf.Mesh, binding_matrices: np.ndarray, positions: np.ndarray) -> Blends:
+    """Move the blended vertices towards their blend vertices, transformed by the bindings blended with.
+
+    The positions are modified in place. Vertices blended more than once are blended in order, each blend starting
+    from the result of the previous one.
+    """
+    blend_indices = []
+    blend_bindings = [np.zeros(0, dtype=np.int64)]
+    targets = [np.zeros((0, 3))]
+    for binding_index, bone_binding in enumerate(mesh.bone_bindings):
+        blend_start = bone_binding.blended_vertex_index
+        blend_end = blend_start + bone_binding.blended_vertex_count
+        binding_blend_vertices = mesh.blend_vertices[blend_start:blend_end]
+        if not binding_blend_vertices:
+            continue
+
+        binding_targets = np.array([vertex.position for vertex in binding_blend_vertices], dtype=np.float64)
+        targets.append(transform_points(binding_matrices[binding_index], binding_targets))
+        blend_indices += range(blend_start, blend_start + len(binding_blend_vertices))
+        blend_bindings.append(np.full(len(binding_blend_vertices), binding_index, dtype=np.int64))
+
+    blends = [mesh.blends[blend_index] for blend_index in blend_indices]
+    vertex_indices = np.array([blend.vertex_index for blend in blends], dtype=np.int64)
+    weights = np.array([blend.weight for blend in blends], dtype=np.float64) * BLEND_WEIGHT_SCALE
+    blend_targets = np.concatenate(targets)
+
+    # Blends are applied in rounds, where each round contains at most one blend of each vertex.
+    order = np.argsort(vertex_indices, kind='stable')
+    sorted_vertex_indices = vertex_indices[order]
+    group_starts = np.flatnonzero(np.r_[True, sorted_vertex_indices[1:] != sorted_vertex_indices[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, len(order)])
+    rounds = np.empty(len(order), dtype=np.int64)
+    rounds[order] = np.arange(len(order)) - np.repeat(group_starts, group_sizes)
+
+    for blend_round in range(int(rounds.max()) + 1 if len(rounds) else 0):
+        round_blends = rounds == blend_round
+        round_vertex_indices = vertex_indices[round_blends]
+        round_weights = weights[round_blends, None]
+        positions[round_vertex_indices] = (
+            positions[round_vertex_indices] * (1 - round_weights) + blend_targets[round_blends] * round_weights
+        )
+
+    return Blends(
+        vertex_indices,
+        resolve_vertex_bindings(mesh)[vertex_indices],
+        np.concatenate(blend_bindings),
+        1 - weights,
+        weights,
+    )
+
+
+def skin_mesh(mesh: bmf.Mesh, binding_matrices: np.ndarray) -> SkinnedMesh:
+    """Skin a mesh to a 4x4 column vector matrix for each of its bone bindings."""
+    positions, normals, vertex_bindings = transform_bindings(mesh, binding_matrices)
+    blends = blend_vertices(mesh, binding_matrices, positions)
+    return SkinnedMesh(positions, normals, vertex_bindings, blends)
+
+
+def resolve_binding_matrices(topology: skeleton_topology.SkeletonTopology, mesh: bmf.Mesh) -> np.ndarray:
+    """Get the world matrix of the bone of each binding of a mesh from a skeleton topology."""
+    bone_indices = skeleton_topology.resolve_mesh_bones(topology, mesh)
+    binding_bone_indices = np.array([bone_binding.bone_index for bone_binding in mesh.bone_bindings], dtype=np.int64)
+    if ((binding_bone_indices < 0) | (binding_bone_indices >= len(bone_indices))).any():
+        error_message = "Mesh bone binding references an invalid bone"
+        raise error.SkeletonTopologyError(error_message)
+
+    skeleton_bone_indices = bone_indices[binding_bone_indices]
+    if (skeleton_bone_indices == skeleton_topology.UNKNOWN_BONE).any():
+        error_message = "Mesh bone not found in skeleton"
+        raise error.SkeletonTopologyError(error_message)
+
+    return topology.world_matrices[skeleton_bone_indices].reshape(-1, 4, 4)
@@ -3,7 +3,7 @@
 import pathlib
 import typing
 
-from . import bmf, error
+from . import bmf, buffer_io, error
 
 
 def read_bones(file: typing.TextIO) -> list[str]:
@@ -167,20 +167,26 @@ def write_skn(file: typing.TextIO, bmf: bmf.Bmf) -> None:
     write_mesh(file, bmf.mesh)
 
 
-def read_file(file_path: pathlib.Path) -> bmf.Bmf:
-    """Read a file as a SKN."""
-    try:
-        with file_path.open() as file:
-            bmf = read_skn(file)
+def read_bytes(buffer: buffer_io.Buffer) -> bmf.Bmf:
+    """Read a buffer as a SKN."""
+    file = buffer_io.open_text(buffer)
+    bmf = read_skn(file)
+
+    if file.readline() != "":
+        raise error.FileReadError
 
-            if file.readline() != "":
-                raise error.FileReadError
+    return bmf
 
-            return bmf
 
+def read_file(file_path: pathlib.Path) -> bmf.Bmf:
+    """Read a file as a SKN."""
+    try:
+        buffer = file_path.read_bytes()
     except OSError as exception:
         raise error.FileReadError from exception
 
+    return read_bytes(buffer)
+
 
 def write_file(file_path: pathlib.Path, bmf: bmf.Bmf) -> None:
     """Write a SKN to a file."""
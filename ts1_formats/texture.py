@@ -0,0 +1,356 @@
+"""Read the BMP and TGA texture files used by The Sims."""
+
+import dataclasses
+import pathlib
+import struct
+
+import numpy as np
+
+from .error import FileReadError
+
+
+@dataclasses.dataclass
+class Texture:
+    """A decoded texture.
+
+    The pixels are RGBA floats from 0 to 1 with the bottom row first, the layout of Blender image pixels.
+    """
+
+    width: int
+    height: int
+    has_alpha: bool
+    pixels: np.ndarray
+
+
+def create_texture(rgba: np.ndarray, *, has_alpha: bool, top_down: bool) -> Texture:
+    """Create a texture from an array of 8 bit RGBA rows."""
+    if top_down:
+        rgba = rgba[::-1]
+    pixels = np.ascontiguousarray(rgba, dtype=np.float32)
+    pixels *= 1.0 / 255.0
+    return Texture(rgba.shape[1], rgba.shape[0], has_alpha, pixels)
+
+
+def unpack_indices(data: np.ndarray, bits_per_pixel: int, width: int) -> np.ndarray:
+    """Unpack rows of 1, 2, 4 or 8 bit palette indices, most significant bits first."""
+    if bits_per_pixel == 8:
+        return data[:, :width]
+    bits = np.unpackbits(data, axis=1).reshape(data.shape[0], -1, bits_per_pixel)
+    weights = 1 << np.arange(bits_per_pixel - 1, -1, -1, dtype=np.uint8)
+    return (bits * weights).sum(axis=2, dtype=np.uint8)[:, :width]
+
+
+def decode_bmp_rle(data: memoryview, width: int, height: int, bits_per_pixel: int) -> np.ndarray:
+    """Decode RLE8 or RLE4 compressed BMP pixel data in to rows of palette indices, bottom row first."""
+    indices = np.zeros((height, width), dtype=np.uint8)
+    x = 0
+    y = 0
+    position = 0
+    while position + 1 < len(data) and y < height:
+        count = data[position]
+        value = data[position + 1]
+        position += 2
+        if count > 0:
+            if bits_per_pixel == 8:
+                run = [value] * count
+            else:
+                run = [value >> 4 if i % 2 == 0 else value & 0x0F for i in range(count)]
+            if x < width:
+                end = min(x + count, width)
+                indices[y, x:end] = run[: end - x]
+            x += count
+        elif value == 0:
+            x = 0
+            y += 1
+        elif value == 1:
+            break
+        elif value == 2:
+            if position + 1 >= len(data):
+                break
+            x += data[position]
+            y += data[position + 1]
+            position += 2
+        else:
+            if bits_per_pixel == 8:
+                run = list(data[position : position + value])
+                position += (value + 1) & ~1
+            else:
+                byte_count = (value + 1) // 2
+                packed = data[position : position + byte_count]
+                run = [packed[i // 2] >> 4 if i % 2 == 0 else packed[i // 2] & 0x0F for i in range(value)]
+                position += (byte_count + 1) & ~1
+            if y < height and x < width:
+                end = min(x + value, width)
+                indices[y, x:end] = run[: end - x]
+            x += value
+
+    return indices
+
+
+def decode_bitfield(values: np.ndarray, mask: int) -> np.ndarray:
+    """Scale the bits of each value selected by the mask to 8 bits."""
+    if mask == 0:
+        return np.zeros(values.shape, dtype=np.uint8)
+    shift = (mask & -mask).bit_length() - 1
+    maximum = mask >> shift
+    channel = (values.astype(np.uint64) & mask) >> shift
+    return ((channel * 255 + maximum // 2) // maximum).astype(np.uint8)
+
+
+def read_bmp(buffer: bytes) -> Texture:
+    """Read a Windows or OS/2 bitmap with 1, 4, 8, 16, 24 or 32 bits per pixel, uncompressed or RLE compressed."""
+    view = memoryview(buffer)
+    try:
+        pixel_offset = struct.unpack_from('<I', view, 10)[0]
+        header_size = struct.unpack_from('<I', view, 14)[0]
+        if header_size == 12:
+            width, height, _, bits_per_pixel = struct.unpack_from('<hhHH', view, 18)
+            compression = 0
+            color_count = 0
+            palette_entry_size = 3
+        else:
+            width, height, _, bits_per_pixel, compression = struct.unpack_from('<iiHHI', view, 18)
+            color_count = struct.unpack_from('<I', view, 46)[0]
+            palette_entry_size = 4
+    except struct.error as exception:
+        raise FileReadError from exception
+
+    top_down = height < 0
+    height = abs(height)
+    if width <= 0 or height == 0:
+        raise FileReadError
+
+    palette_offset = 14 + header_size
+    masks = (0x7C00, 0x03E0, 0x001F, 0) if bits_per_pixel == 16 else (0xFF0000, 0x00FF00, 0x0000FF, 0)
+    if compression in {3, 6}:
+        mask_count = 4 if compression == 6 or header_size >= 56 else 3
+        mask_offset = 54
+        if header_size == 40:
+            # The masks follow the header instead of being part of it.
+            mask_offset = palette_offset
+            palette_offset += 4 * mask_count
+        try:
+            masks = (*struct.unpack_from(f'<{mask_count}I', view, mask_offset), 0)[:4]
+        except struct.error as exception:
+            raise FileReadError from exception
+        compression = 0
+    elif compression not in {0, 1, 2}:
+        raise FileReadError
+
+    if bits_per_pixel <= 8:
+        color_count = min(color_count or 1 << bits_per_pixel, 256)
+        try:
+            palette_data = np.frombuffer(
+                view,
+                dtype=np.uint8,
+                count=color_count * palette_entry_size,
+                offset=palette_offset,
+            ).reshape(color_count, palette_entry_size)
+        except ValueError as exception:
+            raise FileReadError from exception
+        palette = np.full((256, 4), 255, dtype=np.uint8)
+        palette[:color_count, :3] = palette_data[:, 2::-1]
+
+        if compression in {1, 2}:
+            if compression != (1 if bits_per_pixel == 8 else 2):
+                raise FileReadError
+            try:
+                indices = decode_bmp_rle(view[pixel_offset:], width, height, bits_per_pixel)
+            except (IndexError, ValueError) as exception:
+                raise FileReadError from exception
+        else:
+            row_size = (width * bits_per_pixel + 31) // 32 * 4
+            try:
+                data = np.frombuffer(view, dtype=np.uint8, count=row_size * height, offset=pixel_offset)
+            except ValueError as exception:
+                raise FileReadError from exception
+            indices = unpack_indices(data.reshape(height, row_size), bits_per_pixel, width)
+
+        return create_texture(palette[indices], has_alpha=False, top_down=top_down)
+
+    if compression != 0 or bits_per_pixel not in {16, 24, 32}:
+        raise FileReadError
+
+    bytes_per_pixel = bits_per_pixel // 8
+    row_size = (width * bits_per_pixel + 31) // 32 * 4
+    try:
+        data = np.frombuffer(view, dtype=np.uint8, count=row_size * height, offset=pixel_offset)
+    except ValueError as exception:
+        raise FileReadError from exception
+    data = data.reshape(height, row_size)[:, : width * bytes_per_pixel].reshape(height, width, bytes_per_pixel)
+
+    rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+    if bits_per_pixel == 24:
+        rgba[..., :3] = data[..., 2::-1]
+        return create_texture(rgba, has_alpha=False, top_down=top_down)
+
+    values = data[..., 0].astype(np.uint32)
+    for index in range(1, bytes_per_pixel):
+        values |= data[..., index].astype(np.uint32) << (8 * index)
+    for channel, mask in enumerate(masks):
+        if mask != 0:
+            rgba[..., channel] = decode_bitfield(values, mask)
+
+    return create_texture(rgba, has_alpha=masks[3] != 0, top_down=top_down)
+
+
+def decode_tga_rle(data: memoryview, pixel_count: int, bytes_per_pixel: int) -> bytes:
+    """Decode RLE compressed TGA pixel data."""
+    size = pixel_count * bytes_per_pixel
+    decoded = bytearray()
+    position = 0
+    while len(decoded) < size and position < len(data):
+        header = data[position]
+        position += 1
+        count = (header & 0x7F) + 1
+        if header & 0x80:
+            decoded += bytes(data[position : position + bytes_per_pixel]) * count
+            position += bytes_per_pixel
+        else:
+            decoded += data[position : position + count * bytes_per_pixel]
+            position += count * bytes_per_pixel
+
+    if len(decoded) < size:
+        raise FileReadError
+    return bytes(decoded[:size])
+
+
+def convert_tga_pixels(data: np.ndarray, bits_per_pixel: int, *, grayscale: bool) -> np.ndarray:
+    """Convert TGA pixel data in to 8 bit RGBA."""
+    rgba = np.full((*data.shape[:-1], 4), 255, dtype=np.uint8)
+    if grayscale:
+        rgba[..., :3] = data[..., :1]
+        if bits_per_pixel == 16:
+            rgba[..., 3] = data[..., 1]
+    elif bits_per_pixel in {15, 16}:
+        values = data[..., 0].astype(np.uint16) | (data[..., 1].astype(np.uint16) << 8)
+        rgba[..., 0] = decode_bitfield(values, 0x7C00)
+        rgba[..., 1] = decode_bitfield(values, 0x03E0)
+        rgba[..., 2] = decode_bitfield(values, 0x001F)
+        if bits_per_pixel == 16:
+            rgba[..., 3] = decode_bitfield(values, 0x8000)
+    else:
+        rgba[..., :3] = data[..., 2::-1]
+        if bits_per_pixel == 32:
+            rgba[..., 3] = data[..., 3]
+    return rgba
+
+
+def read_tga(buffer: bytes) -> Texture:
+    """Read a colormapped, truecolor or grayscale targa, uncompressed or RLE compressed."""
+    view = memoryview(buffer)
+    try:
+        (
+            id_length,
+            colormap_type,
+            image_type,
+            colormap_start,
+            colormap_length,
+            colormap_bits,
+            _,
+            _,
+            width,
+            height,
+            bits_per_pixel,
+            descriptor,
+        ) = struct.unpack_from('<BBBHHBHHHHBB', view, 0)
+    except struct.error as exception:
+        raise FileReadError from exception
+
+    if image_type not in {1, 2, 3, 9, 10, 11} or width == 0 or height == 0:
+        raise FileReadError
+
+    colormapped = image_type in {1, 9}
+    grayscale = image_type in {3, 11}
+    alpha_bits = descriptor & 0x0F
+    bytes_per_pixel = (bits_per_pixel + 7) // 8
+    if (colormapped and bits_per_pixel != 8) or (grayscale and bits_per_pixel not in {8, 16}):
+        raise FileReadError
+    if not colormapped and not grayscale and bits_per_pixel not in {15, 16, 24, 32}:
+        raise FileReadError
+
+    offset = 18 + id_length
+    palette = None
+    if colormap_type == 1:
+        colormap_bytes_per_entry = (colormap_bits + 7) // 8
+        colormap_size = colormap_length * colormap_bytes_per_entry
+        if colormapped:
+            try:
+                colormap_data = np.frombuffer(view, dtype=np.uint8, count=colormap_size, offset=offset)
+            except ValueError as exception:
+                raise FileReadError from exception
+            colormap_data = colormap_data.reshape(colormap_length, colormap_bytes_per_entry)
+            palette = np.zeros((256, 4), dtype=np.uint8)
+            palette[:, 3] = 255
+            end = min(colormap_start + colormap_length, 256)
+            palette[colormap_start:end] = convert_tga_pixels(
+                colormap_data[: end - colormap_start],
+                colormap_bits,
+                grayscale=False,
+            )
+        offset += colormap_size
+    elif colormapped:
+        raise FileReadError
+
+    pixel_count = width * height
+    if image_type >= 9:
+        pixel_data = decode_tga_rle(view[offset:], pixel_count, bytes_per_pixel)
+        data = np.frombuffer(pixel_data, dtype=np.uint8)
+    else:
+        try:
+            data = np.frombuffer(view, dtype=np.uint8, count=pixel_count * bytes_per_pixel, offset=offset)
+        except ValueError as exception:
+            raise FileReadError from exception
+    data = data.reshape(height, width, bytes_per_pixel)
+
+    if palette is not None:
+        rgba = palette[data[..., 0]]
+        has_alpha = colormap_bits == 32 or (colormap_bits == 16 and alpha_bits > 0)
+    else:
+        rgba = convert_tga_pixels(data, bits_per_pixel, grayscale=grayscale)
+        has_alpha = bits_per_pixel == 32 or (bits_per_pixel == 16 and alpha_bits > 0)
+        if bits_per_pixel == 16 and alpha_bits == 0 and not grayscale:
+            rgba[..., 3] = 255
+
+    if has_alpha and alpha_bits == 0 and not rgba[..., 3].any():
+        # The alpha channel is unused, rather than fully transparent.
+        rgba[..., 3] = 255
+        has_alpha = False
+
+    if descriptor & 0x10:
+        rgba = rgba[:, ::-1]
+
+    return create_texture(rgba, has_alpha=has_alpha, top_down=bool(descriptor & 0x20))
+
+
+def read_bytes(buffer: bytes) -> Texture:
+    """Read a BMP or TGA texture from bytes, telling the formats apart by the BMP signature."""
+    if buffer[:2] == b"BM":
+        return read_bmp(buffer)
+    return read_tga(buffer)
+
+
+def read_file(file_path: pathlib.Path) -> Texture:
+    """Read a BMP or TGA file as a texture."""
+    try:
+        buffer = file_path.read_bytes()
+    except OSError as exception:
+        raise FileReadError from exception
+
+    return read_bytes(buffer)
+
+
+def downscale(texture: Texture, factor: int) -> Texture:
+    """Shrink a texture by an integer factor, averaging each block of pixels.
+
+    Blocks at the right and top edges are cropped when the size isn't a multiple of the factor.
+    """
+    width = max(1, texture.width // factor)
+    height = max(1, texture.height // factor)
+    block_width = texture.width // width
+    block_height = texture.height // height
+
+    blocks = texture.pixels[: height * block_height, : width * block_width]
+    blocks = blocks.reshape(height, block_height, width, block_width, 4)
+    pixels = blocks.mean(axis=(1, 3), dtype=np.float32)
+    return Texture(width, height, texture.has_alpha, pixels)
@@ -0,0 +1,493 @@
+"""Find the names of the textures used by The Sims skins."""
+
+import bisect
+import dataclasses
+import functools
+import pathlib
+import re
+
+from . import fixups, skin_classifier
+
+SKIN_COLORS = ("drk", "med", "lgt")
+
+
+@functools.cache
+def order_skin_colors(preferred_skin_color: str) -> tuple[str, ...]:
+    """Order the skin colors with the preferred one first."""
+    return (preferred_skin_color, *(skin_color for skin_color in SKIN_COLORS if skin_color != preferred_skin_color))
+
+
+def list_head_texture_variants(skin_name: str, preferred_skin_color: str) -> list[str]:
+    """List potential texture file names for a head skin."""
+    skin_colors = order_skin_colors(preferred_skin_color)
+
+    texture_names = []
+
+    split_skin_name = skin_name.split("-")[1].split("_", 1)
+    skin_type = split_skin_name[0]
+    name = None if len(split_skin_name) == 1 else split_skin_name[1]
+
+    body_id = skin_type[1:4]
+    sex = skin_type[4]
+    age = skin_type[5]
+
+    for skin_color in skin_colors:
+        if name is not None:
+            texture_names.append(("c" + body_id + sex + age + skin_color + "_" + name).lower())
+
+        texture_names.append(("c" + body_id + sex + age + skin_color + "_").lower())
+
+    return texture_names
+
+
+def list_body_texture_variants(skin_name: str, preferred_skin_color: str) -> list[str]:
+    """List potential texture file names for a body skin."""
+    skin_colors = order_skin_colors(preferred_skin_color)
+
+    texture_names = []
+
+    split_skin_name = skin_name.split("-")[1].split("_", 1)
+    skin_type = split_skin_name[0]
+    name = None if len(split_skin_name) == 1 else split_skin_name[1]
+
+    clothes = skin_type[0]
+    body_id = skin_type[1:4]
+    sex = skin_type[4]
+    age = skin_type[5]
+    weight = skin_type[6:9]
+
+    for skin_color in skin_colors:
+        if name is not None:
+            texture_names.append((clothes + body_id + sex + age + weight + skin_color + "_" + name).lower())
+
+        texture_names.append((clothes + body_id + sex + age + weight + skin_color + "_").lower())
+
+    return texture_names
+
+
+def list_hand_texture_variants(skin_name: str, preferred_skin_color: str) -> list[str]:
+    """List potential texture file names for a hand skin."""
+    skin_colors = order_skin_colors(preferred_skin_color)
+
+    split_skin_name = skin_name.split("-")
+
+    hand_sex = split_skin_name[1][1]
+    hand_side = split_skin_name[1][2]
+    hand_position = split_skin_name[1][3]
+
+    texture_names: list[str] = []
+
+    for sex in ["u", hand_sex.lower()]:
+        for side in ["a", hand_side, "c"]:
+            texture_names.extend(("h" + sex + side + hand_position + skin_color).lower() for skin_color in skin_colors)
+
+            texture_names.append(("h" + sex + side + hand_position).lower())
+            texture_names.append(("g" + sex + side + hand_position).lower())
+            texture_names.append(("_g" + sex + side + hand_position).lower())
+
+    return texture_names
+
+
+def list_nude_body_texture_variants(skin_name: str, preferred_skin_color: str) -> list[str]:
+    """List potential texture file names for a nude body skin."""
+    skin_colors = order_skin_colors(preferred_skin_color)
+
+    texture_names = []
+
+    split_skin_name = skin_name.split("-")[1].split("_", 1)
+    skin_type = split_skin_name[0]
+    name = split_skin_name[1]
+
+    sex = skin_type[1]
+    weight = skin_type[2:5]
+
+    for skin_color in skin_colors:
+        texture_names.append(("n" + sex + weight + skin_color + "_" + name).lower())
+        texture_names.append(("u" + sex + weight + skin_color + "_" + name).lower())
+        texture_names.append(("n" + sex + weight + skin_color + "_").lower())
+        texture_names.append(("u" + sex + weight + skin_color + "_").lower())
+
+        if sex.lower() == "u":
+            texture_names.append(("n" + "f" + weight + skin_color).lower())
+            texture_names.append(("n" + "m" + weight + skin_color).lower())
+            texture_names.append(("u" + "f" + weight + skin_color).lower())
+            texture_names.append(("u" + "m" + weight + skin_color).lower())
+
+    return texture_names
+
+
+def list_npc_head_texture_variants(skin_name: str, preferred_skin_color: str) -> list[str]:
+    """List potential texture file names for an npc head skin."""
+    skin_colors = order_skin_colors(preferred_skin_color)
+
+    search = re.search("(?<=xskin-).*(?=-head-head)", skin_name.lower())
+    if search is None:
+        return []
+    split_skin_name = search.group(0).split("_", 1)
+    skin_type = split_skin_name[0]
+    name = split_skin_name[1]
+
+    return [(skin_type + skin_color + "_" + name).lower() for skin_color in skin_colors]
+
+
+def list_age_weight_npc_head_texture_variants(skin_name: str, preferred_skin_color: str) -> list[str]:
+    """List potential texture file names for an npc head with age and weight skin."""
+    skin_colors = order_skin_colors(preferred_skin_color)
+
+    texture_names = []
+
+    search = re.search("(?<=xskin-).*(?=-head-head)", skin_name.lower())
+    if search is None:
+        return []
+    split_skin_name = search.group(0).split("_", 1)
+    skin_type = split_skin_name[0]
+    name = split_skin_name[1]
+
+    for skin_color in skin_colors:
+        texture_names.append((skin_type + skin_color + "_" + name).lower())
+        texture_names.append((skin_type[:-3] + skin_color + "_" + name).lower())
+
+    return texture_names
+
+
+def list_npc_body_texture_variants(skin_name: str, preferred_skin_color: str) -> list[str]:
+    """List potential texture file names for an npc body skin."""
+    skin_colors = order_skin_colors(preferred_skin_color)
+
+    texture_names = []
+
+    split_skin_name = skin_name.lower().removeprefix("xskin-").removesuffix("-pelvis-body")
+    search = re.search("(f|m|u)(a|c|)(skn|fit|fat|chd)_", split_skin_name.lower())
+    if search is None:
+        return []
+    sex_age_weight_span = search.span()
+    skin_type = split_skin_name[: sex_age_weight_span[1] - 1]
+    name = split_skin_name[sex_age_weight_span[1] :]
+
+    texture_names.append((skin_type + "_" + name).lower())
+    texture_names.append(("b" + skin_type + "_" + name).lower())
+
+    for skin_color in skin_colors:
+        texture_names.append((skin_type + skin_color + "_" + name).lower())
+        texture_names.append((skin_type[:-3] + skin_color + "_" + name).lower())
+
+        if name == "01":
+            texture_names.append((skin_type + skin_color + "_").lower())
+
+    return texture_names
+
+
+def list_unleashed_npc_body_texture_variants(skin_name: str, preferred_skin_color: str) -> list[str]:
+    """List potential texture file names for an unleashed npc body skin."""
+    skin_colors = order_skin_colors(preferred_skin_color)
+
+    split_skin_name = skin_name.split("-")[1].split("_", 1)
+    skin_type = split_skin_name[0]
+    name = split_skin_name[1]
+
+    return [(skin_type + skin_color + "_" + name).lower() for skin_color in skin_colors]
+
+
+def list_costume_body_texture_variants(skin_name: str, preferred_skin_color: str) -> list[str]:
+    """List potential texture file names for a costume body skin."""
+    skin_colors = order_skin_colors(preferred_skin_color)
+
+    split_skin_name = skin_name.split("-")
+
+    skin_type = split_skin_name[1]
+    for element in split_skin_name[2:-3]:
+        skin_type += "-" + element
+
+    identifier = split_skin_name[-3]
+
+    texture_names = []
+
+    for skin_color in skin_colors:
+        texture_name = skin_type + skin_color + "-" + identifier
+        texture_names.append(texture_name.lower())
+
+    return texture_names
+
+
+@dataclasses.dataclass(frozen=True)
+class TextureEntry:
+    """A texture file, its position in the list it was indexed from and its lowercase, possibly fixed, name."""
+
+    position: int
+    name: str
+    file_path: pathlib.Path
+
+
+class TextureIndex:
+    """Texture files sorted by their lowercase names, with the file name mistakes fixed if requested.
+
+    Files with the same name keep the order of the list they were indexed from.
+    """
+
+    def __init__(self, texture_file_list: list[pathlib.Path], *, fix_textures: bool) -> None:
+        """Index the texture files."""
+        fixup_table = fixups.load_fixup_table()
+        entries = []
+        for position, file_path in enumerate(texture_file_list):
+            name = file_path.stem
+            if fix_textures:
+                name = fixup_table.fix_texture_file_name(name)
+            entries.append(TextureEntry(position, name.lower(), file_path))
+
+        entries.sort(key=lambda entry: (entry.name, entry.position))
+        self.fix_textures = fix_textures
+        self.entries = entries
+        self.names = [entry.name for entry in entries]
+
+    def __len__(self) -> int:
+        """Return the number of indexed texture files."""
+        return len(self.entries)
+
+    def exact(self, name: str) -> list[TextureEntry]:
+        """Return the texture files with the given name."""
+        name = name.lower()
+        start = bisect.bisect_left(self.names, name)
+        end = bisect.bisect_right(self.names, name, lo=start)
+        return self.entries[start:end]
+
+    def prefix(self, prefix: str) -> list[TextureEntry]:
+        """Return the texture files with names starting with the prefix."""
+        prefix = prefix.lower()
+        if prefix == "":
+            return self.entries
+        start = bisect.bisect_left(self.names, prefix)
+        end = bisect.bisect_left(self.names, prefix[:-1] + chr(ord(prefix[-1]) + 1), lo=start)
+        return self.entries[start:end]
+
+    def match_prefixes(self, prefixes: list[str]) -> list[TextureEntry]:
+        """Return the texture files with names starting with any of the prefixes.
+
+        The files are ordered by the first prefix they match, then by their position in the indexed list.
+        """
+        matches: dict[int, tuple[int, TextureEntry]] = {}
+        for priority, prefix in enumerate(prefixes):
+            for entry in self.prefix(prefix):
+                matches.setdefault(entry.position, (priority, entry))
+
+        return [entry for _, entry in sorted(matches.values(), key=lambda match: (match[0], match[1].position))]
+
+
+# Textures used by jobs and npcs that share the meshes of other skins, in priority order. Each rule is a skin name
+# prefix, or a full skin name, and the textures it adds. Names starting with xskin- add the variants of that npc body.
+SKIN_NAME_PREFIX_LENGTH = len("xskin-b001ma")
+JOB_AND_NPC_TEXTURE_RULES: tuple[tuple[str, bool, tuple[str, ...]], ...] = (
+    # base game
+    ("xskin-b001ma", True, ("xskin-ExtremeMfit_01-pelvis-body",)),
+    ("xskin-b002fafat_01-PELVIS-BODY", False, ("GardenerFFat_01",)),
+    ("xskin-b002ma", True, ("xskin-PoliceMfit_01-pelvis-body", "xskin-ScrubsMfit_01-pelvis-body")),
+    ("xskin-b002mafit_01-PELVIS-BODY", False, ("pizzaguysuit",)),
+    (
+        "xskin-b003fa",
+        True,
+        ("xskin-BurglarFfit_01-pelvis-body", "xskin-CatsuitFfit_01-pelvis-body", "xskin-EMTFfit_01-pelvis-body"),
+    ),
+    ("xskin-b003ma", True, ("xskin-BurglarMfit_01-pelvis-body", "xskin-EMTMfit_01-pelvis-body")),
+    ("xskin-b003mafat_01-PELVIS-BODY", False, ("HandyMFat_01",)),
+    ("xskin-b003mafit_01-PELVIS-BODY", False, ("Postalsuit",)),
+    (
+        "xskin-b004ma",
+        True,
+        (
+            "xskin-BusinessMfit_01-pelvis-body",
+            "xskin-MayorMfit_01-pelvis-body",
+            "xskin-PoliticsMfit_01-pelvis-body",
+            "xskin-SciMidMfit_01-pelvis-body",
+            "xskin-TopCopMfit_01-pelvis-body",
+            "xskin-TopDocMfit_01-pelvis-body",
+        ),
+    ),
+    ("xskin-b005mafit_01-PELVIS-BODY", False, ("RepoMFit_01",)),
+    (
+        "xskin-b008fa",
+        True,
+        (
+            "xskin-BusinessFfit_01-pelvis-body",
+            "xskin-MayorFfit_01-pelvis-body",
+            "xskin-PoliticsFfit_01-pelvis-body",
+            "xskin-TopCopFfit_01-pelvis-body",
+            "xskin-TopDocFfit_01-pelvis-body",
+        ),
+    ),
+    ("xskin-b009fa", True, ("xskin-SciMidFfit_01-pelvis-body",)),
+    ("xskin-b004ucchd_01-PELVIS-BODY", False, ("xskin-MilCadetUfit_01-pelvis-body",)),
+    ("xskin-b011fa", True, ("xskin-ExtremeFfit_01-pelvis-body",)),
+    ("xskin-b012fa", True, ("xskin-PoliceFfit_01-pelvis-body", "xskin-ScrubsFfit_01-pelvis-body")),
+    ("xskin-c004fa_gma1-HEAD-HEAD", False, ("C_socwkr",)),
+    ("xskin-c003ma_romancrew-HEAD-HEAD", False, ("C_Handy", "C_Repo")),
+    ("xskin-c_skeleton-HEAD-HEAD", False, ("C_skeleton", "C_skeleneg")),
+    ("xskin-skeleton_01-PELVIS-BODY", False, ("Skeleton_01", "Skeleneg_01")),
+    ("xskin-skeletonchd_01-PELVIS-BODY", False, ("Skeleton_01", "Skeleneg_01")),
+    # livin large
+    ("xskin-b004ma", True, ("xskin-HypnotistMfit_01-pelvis-body", "xskin-UFOinvestMfit_01-pelvis-body")),
+    ("xskin-b008fa", True, ("xskin-infoverlordFfit_01-pelvis-body", "xskin-UFOinvestFfit_01-pelvis-body")),
+    # house party
+    ("xskin-nffit_01-PELVIS-MBODY", False, ("b_fa_eurotrash_swim", "b_fa_eurotrash_nekkid")),
+    # unleashed
+    ("xskin-Petjudge_Mafit_01-PELVIS-BODY", False, ("xskin-Petjudge_Mafit_02-pelvis-body",)),
+)
+
+
+def create_rule_lookup(*, prefix: bool) -> dict[str, tuple[tuple[int, tuple[str, ...]], ...]]:
+    """Map the skin names or prefixes of the job and npc rules to their priorities and textures."""
+    lookup: dict[str, tuple[tuple[int, tuple[str, ...]], ...]] = {}
+    for priority, (skin_name, is_prefix, texture_names) in enumerate(JOB_AND_NPC_TEXTURE_RULES):
+        if is_prefix == prefix:
+            lookup[skin_name] = (*lookup.get(skin_name, ()), (priority, texture_names))
+    return lookup
+
+
+JOB_AND_NPC_TEXTURE_PREFIXES = create_rule_lookup(prefix=True)
+JOB_AND_NPC_TEXTURE_SKINS = create_rule_lookup(prefix=False)
+
+
+def list_job_and_npc_textures(skin_name: str, preferred_skin_color: str) -> list[str]:
+    """List the job and npc texture names for the given skin."""
+    rules = sorted(
+        JOB_AND_NPC_TEXTURE_PREFIXES.get(skin_name[:SKIN_NAME_PREFIX_LENGTH], ())
+        + JOB_AND_NPC_TEXTURE_SKINS.get(skin_name, ()),
+    )
+
+    texture_names = []
+    for _, rule_texture_names in rules:
+        for texture_name in rule_texture_names:
+            if texture_name.startswith("xskin-"):
+                texture_names += list_npc_body_texture_variants(texture_name, preferred_skin_color)
+            else:
+                texture_names.append(texture_name.lower())
+    return texture_names
+
+
+# The texture variant generator of each texture family and whether textures starting with the variants are used too.
+TEXTURE_VARIANT_RULES = {
+    "head": (list_head_texture_variants, True),
+    "body": (list_body_texture_variants, True),
+    "hand": (list_hand_texture_variants, True),
+    "nude_body": (list_nude_body_texture_variants, True),
+    "npc_head": (list_npc_head_texture_variants, False),
+    "age_weight_npc_head": (list_age_weight_npc_head_texture_variants, False),
+    "npc_body": (list_npc_body_texture_variants, False),
+    "unleashed_npc_body": (list_unleashed_npc_body_texture_variants, False),
+    "costume_body": (list_costume_body_texture_variants, False),
+}
+
+# Skins whose secondary textures belong to other skins.
+NO_SECONDARY_TEXTURE_PREFIXES = (
+    "xskin-b601mafit_",
+    "xskin-b620mafit_",
+    "xskin-b632mafit_",
+    "xskin-b634fafit_",
+    "xskin-c620ma_",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def list_texture_variants(
+    skin_name: str, preferred_skin_color: str, *, fix_textures: bool
+) -> tuple[tuple[str, ...], bool]:
+    """List the potential texture names for a skin in priority order and whether textures starting with them are used.
+
+    The names are lowercase.
+    """
+    if fix_textures:
+        skin_name, _ = fixups.fixup_skin_name_and_default_texture(skin_name, "")
+
+    texture_names: list[str] = []
+    find_secondary_textures = False
+
+    rule = TEXTURE_VARIANT_RULES.get(skin_classifier.classify_skin(skin_name).texture_family)
+    if rule is not None:
+        list_variants, find_secondary_textures = rule
+        texture_names += list_variants(skin_name, preferred_skin_color)
+
+    texture_names += list_job_and_npc_textures(skin_name, preferred_skin_color)
+
+    if fix_textures and skin_name.lower().startswith(NO_SECONDARY_TEXTURE_PREFIXES):
+        find_secondary_textures = False
+
+    return tuple(texture_name.lower() for texture_name in texture_names), find_secondary_textures
+
+
+def find_skin_texture_files(
+    texture_index: TextureIndex,
+    skin_name: str,
+    preferred_skin_color: str,
+    *,
+    fix_textures: bool,
+) -> list[tuple[str, pathlib.Path | None]]:
+    """Find all the texture files named after the given skin, as material names and file paths."""
+    texture_files: dict[str, tuple[str, pathlib.Path | None]] = {}
+
+    def add_texture_file(texture_name: str, texture_file_path: pathlib.Path) -> None:
+        texture_files.setdefault(texture_name.casefold(), (texture_name, texture_file_path))
+
+    texture_file_names, find_secondary_textures = list_texture_variants(
+        skin_name,
+        preferred_skin_color,
+        fix_textures=fix_textures,
+    )
+
+    matching_entries = texture_index.match_prefixes(list(texture_file_names))
+
+    texture_file_name_set = set(texture_file_names)
+    for entry in matching_entries:
+        if entry.name in texture_file_name_set:
+            add_texture_file(entry.file_path.stem, entry.file_path)
+
+    if find_secondary_textures:
+        for entry in matching_entries:
+            add_texture_file(entry.file_path.stem, entry.file_path)
+
+    return list(texture_files.values())
+
+
+def find_default_texture_files(
+    texture_index: TextureIndex,
+    skin_name: str,
+    default_texture: str,
+    *,
+    fix_textures: bool,
+) -> list[tuple[str, pathlib.Path | None]]:
+    """Find the default texture file of the given skin, as a material name and file path.
+
+    The white and grey default textures have no file.
+    """
+    if fix_textures:
+        skin_name, default_texture = fixups.fixup_skin_name_and_default_texture(skin_name, default_texture)
+
+    if default_texture == "x":
+        return []
+
+    if default_texture.lower() in ["white", "grey"]:
+        return [(default_texture, None)]
+
+    entries = texture_index.exact(default_texture)
+    if entries:
+        return [(entries[0].file_path.stem, entries[0].file_path)]
+
+    return []
+
+
+def find_texture_files(
+    texture_index: TextureIndex,
+    skin_name: str,
+    default_texture: str,
+    preferred_skin_color: str,
+    *,
+    fix_textures: bool,
+) -> list[tuple[str, pathlib.Path | None]]:
+    """Find all the applicable texture files for the given skin, falling back to its default texture."""
+    texture_files = find_skin_texture_files(
+        texture_index,
+        skin_name,
+        preferred_skin_color,
+        fix_textures=fix_textures,
+    )
+    if texture_files:
+        return texture_files
+
+    return find_default_texture_files(texture_index, skin_name, default_texture, fix_textures=fix_textures)